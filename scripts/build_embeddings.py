@@ -11,19 +11,23 @@ Usage:
     python scripts/build_embeddings.py
     python scripts/build_embeddings.py --skills-dir .claude/skills --agents-dir .claude/agents
     python scripts/build_embeddings.py --rebuild  # Force rebuild from scratch
+    python scripts/build_embeddings.py export embeddings-index.zip  # Portable artifact
+    python scripts/build_embeddings.py import embeddings-index.zip  # Load + re-embed delta
 """
 
+import io
 import os
 import sys
 import json
 import hashlib
-import re
+import zipfile
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 import click
-import frontmatter
+import numpy as np
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
@@ -32,6 +36,9 @@ from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
+from corpus_cache import CorpusCache, open_cache, read_markdown
+from skill_parser import split_sections
+
 console = Console()
 
 # Constants
@@ -40,6 +47,10 @@ EMBEDDING_DIM = 384
 CHROMA_COLLECTION_NAME = "claude_ecosystem"
 DEFAULT_CHROMA_PATH = ".chroma_db"
 
+# Portable index artifact (see export_index / import_index)
+ARTIFACT_FORMAT_VERSION = 1
+DEFAULT_ARTIFACT_PATH = "embeddings-index.zip"
+
 
 @dataclass
 class DocumentChunk:
@@ -61,6 +72,7 @@ class ParsedDocument:
     frontmatter: Dict[str, Any]
     content: str
     sections: List[Tuple[str, str]] = field(default_factory=list)  # (title, content)
+    content_hash: str = ""
 
 
 def compute_file_hash(file_path: Path) -> str:
@@ -74,54 +86,33 @@ def parse_markdown_sections(content: str) -> List[Tuple[str, str]]:
     Parse markdown content into sections based on headers.
     Returns list of (section_title, section_content) tuples.
     """
-    sections = []
-    lines = content.split('\n')
-    current_title = "Introduction"
-    current_content = []
-
-    for line in lines:
-        # Match headers (## or ###)
-        header_match = re.match(r'^(#{1,3})\s+(.+)$', line)
-        if header_match:
-            # Save previous section if it has content
-            if current_content:
-                section_text = '\n'.join(current_content).strip()
-                if section_text:
-                    sections.append((current_title, section_text))
-
-            current_title = header_match.group(2).strip()
-            current_content = []
-        else:
-            current_content.append(line)
-
-    # Save final section
-    if current_content:
-        section_text = '\n'.join(current_content).strip()
-        if section_text:
-            sections.append((current_title, section_text))
-
-    return sections
-
-
-def parse_document(file_path: Path, doc_type: str) -> Optional[ParsedDocument]:
+    return split_sections(content)
+
+
+def parse_document(
+    file_path: Path,
+    doc_type: str,
+    cache: Optional[CorpusCache] = None
+) -> Optional[ParsedDocument]:
     """
     Parse a SKILL.md or AGENT.md file.
     Extracts YAML frontmatter and markdown content.
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            doc = frontmatter.load(f)
+        entry = read_markdown(file_path, cache)
+        if entry.frontmatter_error:
+            raise ValueError(f"Invalid YAML frontmatter: {entry.frontmatter_error}")
 
-        name = doc.metadata.get('name', file_path.parent.name)
-        sections = parse_markdown_sections(doc.content)
+        name = entry.frontmatter.get('name', file_path.parent.name)
 
         return ParsedDocument(
             path=str(file_path),
             doc_type=doc_type,
             name=name,
-            frontmatter=dict(doc.metadata),
-            content=doc.content,
-            sections=sections
+            frontmatter=entry.frontmatter,
+            content=entry.body.strip(),
+            sections=entry.sections,
+            content_hash=entry.content_hash
         )
     except Exception as e:
         console.print(f"[red]Error parsing {file_path}: {e}[/red]")
@@ -145,6 +136,7 @@ def create_chunks(doc: ParsedDocument) -> List[DocumentChunk]:
         "type": doc.doc_type,
         "name": doc.name,
         "source_file": doc.path,
+        "content_hash": doc.content_hash,
     }
 
     # Add frontmatter fields to metadata
@@ -229,11 +221,70 @@ def find_documents(
     return skill_files, agent_files
 
 
+def clean_metadata(metadata: Dict[str, Any]) -> Dict[str, Any]:
+    """Clean metadata - ChromaDB only accepts str, int, float, bool."""
+    clean_meta = {}
+    for k, v in metadata.items():
+        if isinstance(v, (str, int, float, bool)):
+            clean_meta[k] = v
+        elif isinstance(v, list):
+            clean_meta[k] = json.dumps(v)
+        elif v is not None:
+            clean_meta[k] = str(v)
+    return clean_meta
+
+
+def open_collection(chroma_full_path: Path, reset: bool = False):
+    """Open (or create) the ecosystem collection, optionally deleting it first."""
+    chroma_full_path.mkdir(parents=True, exist_ok=True)
+    client = chromadb.PersistentClient(
+        path=str(chroma_full_path),
+        settings=Settings(anonymized_telemetry=False)
+    )
+
+    if reset:
+        try:
+            client.delete_collection(CHROMA_COLLECTION_NAME)
+        except Exception:
+            pass  # Collection doesn't exist or other error
+
+    return client.get_or_create_collection(
+        name=CHROMA_COLLECTION_NAME,
+        metadata={
+            "description": "Claude Skills and Agents Ecosystem",
+            "embedding_model": EMBEDDING_MODEL,
+            "embedding_dim": str(EMBEDDING_DIM)
+        }
+    )
+
+
+def upsert_records(
+    collection,
+    ids: List[str],
+    documents: List[str],
+    embeddings: "np.ndarray",
+    metadatas: List[Dict[str, Any]]
+) -> None:
+    """Upsert records in batches (ChromaDB has batch size limits)."""
+    batch_size = 100
+    for i in tqdm(range(0, len(ids), batch_size), desc="Upserting"):
+        batch_end = min(i + batch_size, len(ids))
+        collection.upsert(
+            ids=ids[i:batch_end],
+            documents=documents[i:batch_end],
+            embeddings=embeddings[i:batch_end].tolist(),
+            metadatas=metadatas[i:batch_end]
+        )
+
+
 def build_embeddings(
     skills_dir: str = ".claude/skills",
     agents_dir: str = ".claude/agents",
     chroma_path: str = DEFAULT_CHROMA_PATH,
-    rebuild: bool = False
+    rebuild: bool = False,
+    use_cache: bool = True,
+    cache: Optional[CorpusCache] = None,
+    base_dir: Optional[Path] = None
 ) -> Dict[str, Any]:
     """
     Main function to build embeddings for all skills and agents.
@@ -243,9 +294,15 @@ def build_embeddings(
         agents_dir: Path to agents directory
         chroma_path: Path for ChromaDB persistence
         rebuild: If True, delete existing collection and rebuild
+        use_cache: Parse documents through the shared corpus cache
+        cache: An already-open corpus cache to use (left open for the caller)
+        base_dir: Project root the paths are relative to (default: this repo)
 
     Returns:
         Statistics about the build process
+
+    Raises:
+        FileNotFoundError: If the skills or agents directory doesn't exist
     """
     console.print(Panel.fit(
         "[bold blue]Building RAG Embeddings for Claude Ecosystem[/bold blue]\n"
@@ -256,8 +313,8 @@ def build_embeddings(
     ))
 
     # Find base directory
-    script_dir = Path(__file__).parent
-    base_dir = script_dir.parent
+    if base_dir is None:
+        base_dir = Path(__file__).parent.parent
 
     skills_path = base_dir / skills_dir
     agents_path = base_dir / agents_dir
@@ -265,38 +322,15 @@ def build_embeddings(
 
     # Validate directories exist
     if not skills_path.exists():
-        console.print(f"[red]Skills directory not found: {skills_path}[/red]")
-        sys.exit(1)
+        raise FileNotFoundError(f"Skills directory not found: {skills_path}")
     if not agents_path.exists():
-        console.print(f"[red]Agents directory not found: {agents_path}[/red]")
-        sys.exit(1)
+        raise FileNotFoundError(f"Agents directory not found: {agents_path}")
 
     # Initialize ChromaDB
     console.print("\n[bold]Initializing ChromaDB...[/bold]")
-    chroma_full_path.mkdir(parents=True, exist_ok=True)
-
-    client = chromadb.PersistentClient(
-        path=str(chroma_full_path),
-        settings=Settings(anonymized_telemetry=False)
-    )
-
-    # Handle rebuild
     if rebuild:
         console.print("[yellow]Rebuild requested - deleting existing collection[/yellow]")
-        try:
-            client.delete_collection(CHROMA_COLLECTION_NAME)
-        except Exception:
-            pass  # Collection doesn't exist or other error
-
-    # Get or create collection
-    collection = client.get_or_create_collection(
-        name=CHROMA_COLLECTION_NAME,
-        metadata={
-            "description": "Claude Skills and Agents Ecosystem",
-            "embedding_model": EMBEDDING_MODEL,
-            "embedding_dim": str(EMBEDDING_DIM)
-        }
-    )
+    collection = open_collection(chroma_full_path, reset=rebuild)
 
     # Load existing document hashes to detect changes
     existing_ids = set()
@@ -318,16 +352,23 @@ def build_embeddings(
     # Parse all documents
     console.print("\n[bold]Parsing documents...[/bold]")
     all_docs = []
+    owns_cache = cache is None
+    if owns_cache:
+        cache = open_cache(base_dir, enabled=use_cache)
 
-    for file_path in tqdm(skill_files, desc="Parsing skills"):
-        doc = parse_document(file_path, "skill")
-        if doc:
-            all_docs.append(doc)
-
-    for file_path in tqdm(agent_files, desc="Parsing agents"):
-        doc = parse_document(file_path, "agent")
-        if doc:
-            all_docs.append(doc)
+    try:
+        for file_path in tqdm(skill_files, desc="Parsing skills"):
+            doc = parse_document(file_path, "skill", cache)
+            if doc:
+                all_docs.append(doc)
+
+        for file_path in tqdm(agent_files, desc="Parsing agents"):
+            doc = parse_document(file_path, "agent", cache)
+            if doc:
+                all_docs.append(doc)
+    finally:
+        if owns_cache and cache is not None:
+            cache.close()
 
     console.print(f"  Successfully parsed {len(all_docs)} documents")
 
@@ -365,36 +406,15 @@ def build_embeddings(
         convert_to_numpy=True
     )
 
-    # Prepare data for ChromaDB
-    ids = [c.id for c in chunks_to_process]
-    documents = contents
-    metadatas = []
-
-    for chunk in chunks_to_process:
-        # Clean metadata - ChromaDB only accepts str, int, float, bool
-        clean_meta = {}
-        for k, v in chunk.metadata.items():
-            if isinstance(v, (str, int, float, bool)):
-                clean_meta[k] = v
-            elif isinstance(v, list):
-                clean_meta[k] = json.dumps(v)
-            elif v is not None:
-                clean_meta[k] = str(v)
-        metadatas.append(clean_meta)
-
     # Upsert to ChromaDB
     console.print("\n[bold]Storing in ChromaDB...[/bold]")
-
-    # ChromaDB has batch size limits, process in chunks
-    batch_size = 100
-    for i in tqdm(range(0, len(ids), batch_size), desc="Upserting"):
-        batch_end = min(i + batch_size, len(ids))
-        collection.upsert(
-            ids=ids[i:batch_end],
-            documents=documents[i:batch_end],
-            embeddings=embeddings[i:batch_end].tolist(),
-            metadatas=metadatas[i:batch_end]
-        )
+    upsert_records(
+        collection,
+        ids=[c.id for c in chunks_to_process],
+        documents=contents,
+        embeddings=embeddings,
+        metadatas=[clean_metadata(c.metadata) for c in chunks_to_process]
+    )
 
     # Print summary
     stats = {
@@ -429,7 +449,202 @@ def build_embeddings(
     return stats
 
 
-@click.command()
+def _relative_source(source_file: str, base_dir: Path) -> str:
+    """Make a source path portable by expressing it relative to the project root."""
+    try:
+        return str(Path(source_file).resolve().relative_to(base_dir.resolve()))
+    except ValueError:
+        return source_file
+
+
+def export_index(
+    output: str = DEFAULT_ARTIFACT_PATH,
+    chroma_path: str = DEFAULT_CHROMA_PATH
+) -> Dict[str, Any]:
+    """
+    Export the vector index as a single compressed, versioned artifact.
+
+    The artifact is a zip archive containing:
+        manifest.json  - format version, model name, dim, per-source content hashes
+        chunks.jsonl   - one {"id", "document", "metadata"} record per chunk
+        embeddings.npy - float32 matrix, rows aligned with chunks.jsonl
+
+    Source paths are stored relative to the project root so the artifact
+    can be imported on any machine or CI job.
+    """
+    base_dir = Path(__file__).parent.parent
+    chroma_full_path = base_dir / chroma_path
+    output_path = Path(output)
+
+    if not chroma_full_path.exists():
+        console.print(f"[red]ChromaDB not found at {chroma_full_path}. Build embeddings first.[/red]")
+        sys.exit(1)
+
+    collection = open_collection(chroma_full_path)
+    data = collection.get(include=["documents", "metadatas", "embeddings"])
+    ids = data['ids'] or []
+
+    if not ids:
+        console.print("[red]Collection is empty - nothing to export.[/red]")
+        sys.exit(1)
+
+    embeddings = np.asarray(data['embeddings'], dtype=np.float32)
+    sources: Dict[str, str] = {}
+    records = []
+
+    for chunk_id, document, metadata in zip(ids, data['documents'], data['metadatas']):
+        metadata = dict(metadata or {})
+        if 'source_file' in metadata:
+            metadata['source_file'] = _relative_source(metadata['source_file'], base_dir)
+            # Chunks built before content hashes were recorded have no hash,
+            # which forces a re-embed of that source on import.
+            sources[metadata['source_file']] = metadata.get('content_hash', '')
+        records.append({"id": chunk_id, "document": document, "metadata": metadata})
+
+    manifest = {
+        "format_version": ARTIFACT_FORMAT_VERSION,
+        "collection": CHROMA_COLLECTION_NAME,
+        "embedding_model": EMBEDDING_MODEL,
+        "embedding_dim": int(embeddings.shape[1]),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "chunk_count": len(records),
+        "sources": dict(sorted(sources.items())),
+    }
+
+    buffer = io.BytesIO()
+    np.save(buffer, embeddings, allow_pickle=False)
+
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(output_path, 'w', compression=zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("manifest.json", json.dumps(manifest, indent=2))
+        zf.writestr("chunks.jsonl", "\n".join(json.dumps(r, ensure_ascii=False) for r in records))
+        zf.writestr("embeddings.npy", buffer.getvalue())
+
+    console.print(f"[green]Exported {len(records)} chunks from {len(sources)} documents to {output_path}[/green]")
+
+    return {
+        "chunks": len(records),
+        "documents": len(sources),
+        "artifact": str(output_path),
+        "bytes": output_path.stat().st_size,
+    }
+
+
+def import_index(
+    artifact: str = DEFAULT_ARTIFACT_PATH,
+    skills_dir: str = ".claude/skills",
+    agents_dir: str = ".claude/agents",
+    chroma_path: str = DEFAULT_CHROMA_PATH,
+    verify: bool = True,
+    use_cache: bool = True
+) -> Dict[str, Any]:
+    """
+    Load an artifact produced by export_index into ChromaDB.
+
+    The existing collection is replaced. With verify=True, the manifest's
+    content hashes are compared against the current corpus: chunks from
+    changed or deleted documents are dropped, and only changed or new
+    documents are parsed and re-embedded. The embedding model is loaded
+    only when that delta is non-empty.
+    """
+    base_dir = Path(__file__).parent.parent
+    chroma_full_path = base_dir / chroma_path
+
+    with zipfile.ZipFile(artifact) as zf:
+        manifest = json.loads(zf.read("manifest.json"))
+
+        if manifest.get("format_version") != ARTIFACT_FORMAT_VERSION:
+            console.print(f"[red]Unsupported artifact format version: {manifest.get('format_version')} "
+                          f"(expected {ARTIFACT_FORMAT_VERSION})[/red]")
+            sys.exit(1)
+        if manifest.get("embedding_model") != EMBEDDING_MODEL:
+            console.print(f"[red]Artifact was built with {manifest.get('embedding_model')}, "
+                          f"but this pipeline uses {EMBEDDING_MODEL}. Rebuild instead.[/red]")
+            sys.exit(1)
+
+        records = [json.loads(line) for line in zf.read("chunks.jsonl").decode("utf-8").splitlines() if line]
+        embeddings = np.load(io.BytesIO(zf.read("embeddings.npy")), allow_pickle=False)
+
+    if len(records) != len(embeddings):
+        console.print(f"[red]Corrupt artifact: {len(records)} chunks but {len(embeddings)} vectors[/red]")
+        sys.exit(1)
+
+    # Work out which documents no longer match the artifact
+    stale_sources: Set[str] = set()
+    changed_files: List[Tuple[Path, str]] = []
+    cache = open_cache(base_dir, enabled=use_cache)
+
+    if verify:
+        skill_files, agent_files = find_documents(base_dir / skills_dir, base_dir / agents_dir)
+        current: Dict[str, Tuple[Path, str]] = {}
+        for file_path, doc_type in [(f, "skill") for f in skill_files] + [(f, "agent") for f in agent_files]:
+            current[_relative_source(str(file_path), base_dir)] = (file_path, doc_type)
+
+        manifest_sources = manifest.get("sources", {})
+        for rel, (file_path, doc_type) in current.items():
+            if manifest_sources.get(rel) != read_markdown(file_path, cache).content_hash:
+                stale_sources.add(rel)
+                changed_files.append((file_path, doc_type))
+        stale_sources.update(rel for rel in manifest_sources if rel not in current)
+
+    keep = [i for i, r in enumerate(records)
+            if r["metadata"].get("source_file") not in stale_sources]
+
+    console.print(f"[bold]Importing {len(keep)}/{len(records)} chunks from {artifact}[/bold]")
+    if stale_sources:
+        console.print(f"  {len(changed_files)} changed/new documents to re-embed, "
+                      f"{len(stale_sources) - len(changed_files)} removed")
+
+    collection = open_collection(chroma_full_path, reset=True)
+
+    metadatas = []
+    for i in keep:
+        metadata = dict(records[i]["metadata"])
+        if 'source_file' in metadata and not os.path.isabs(metadata['source_file']):
+            metadata['source_file'] = str(base_dir / metadata['source_file'])
+        metadatas.append(metadata)
+
+    if keep:
+        upsert_records(
+            collection,
+            ids=[records[i]["id"] for i in keep],
+            documents=[records[i]["document"] for i in keep],
+            embeddings=embeddings[keep],
+            metadatas=metadatas
+        )
+
+    new_chunks: List[DocumentChunk] = []
+    for file_path, doc_type in changed_files:
+        doc = parse_document(file_path, doc_type, cache)
+        if doc:
+            new_chunks.extend(create_chunks(doc))
+    if cache is not None:
+        cache.close()
+
+    if new_chunks:
+        console.print(f"\n[bold]Loading embedding model: {EMBEDDING_MODEL}[/bold]")
+        model = SentenceTransformer(EMBEDDING_MODEL)
+        contents = [c.content for c in new_chunks]
+        upsert_records(
+            collection,
+            ids=[c.id for c in new_chunks],
+            documents=contents,
+            embeddings=model.encode(contents, show_progress_bar=True, convert_to_numpy=True),
+            metadatas=[clean_metadata(c.metadata) for c in new_chunks]
+        )
+
+    stats = {
+        "imported_chunks": len(keep),
+        "reembedded_documents": len(changed_files),
+        "reembedded_chunks": len(new_chunks),
+        "removed_documents": len(stale_sources) - len(changed_files),
+        "total_in_collection": collection.count(),
+    }
+    console.print(f"[green]Import complete: {stats['total_in_collection']} chunks in collection[/green]")
+    return stats
+
+
+@click.group(invoke_without_command=True)
 @click.option(
     '--skills-dir',
     default='.claude/skills',
@@ -450,23 +665,44 @@ def build_embeddings(
     is_flag=True,
     help='Force rebuild from scratch (delete existing collection)'
 )
-def main(skills_dir: str, agents_dir: str, chroma_path: str, rebuild: bool):
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    help='Parse files directly instead of using the shared corpus cache'
+)
+@click.pass_context
+def main(ctx, skills_dir: str, agents_dir: str, chroma_path: str, rebuild: bool, no_cache: bool):
     """
     Build embeddings for the Claude Skills Ecosystem.
 
     Reads all SKILL.md and AGENT.md files, creates semantic chunks,
     generates embeddings with sentence-transformers, and stores in ChromaDB.
+
+    Use the export/import subcommands to share a built index as a portable artifact.
     """
+    ctx.obj = {
+        "skills_dir": skills_dir,
+        "agents_dir": agents_dir,
+        "chroma_path": chroma_path,
+        "use_cache": not no_cache,
+    }
+    if ctx.invoked_subcommand is not None:
+        return
+
     try:
         build_embeddings(
             skills_dir=skills_dir,
             agents_dir=agents_dir,
             chroma_path=chroma_path,
-            rebuild=rebuild
+            rebuild=rebuild,
+            use_cache=not no_cache
         )
     except KeyboardInterrupt:
         console.print("\n[yellow]Build interrupted by user[/yellow]")
         sys.exit(1)
+    except FileNotFoundError as e:
+        console.print(f"[red]{e}[/red]")
+        sys.exit(1)
     except Exception as e:
         console.print(f"\n[red]Build failed: {e}[/red]")
         import traceback
@@ -474,5 +710,33 @@ def main(skills_dir: str, agents_dir: str, chroma_path: str, rebuild: bool):
         sys.exit(1)
 
 
+@main.command('export')
+@click.argument('output', default=DEFAULT_ARTIFACT_PATH)
+@click.pass_obj
+def export_command(obj: Dict[str, str], output: str):
+    """Export the vector index to a compressed artifact (OUTPUT)."""
+    export_index(output=output, chroma_path=obj["chroma_path"])
+
+
+@main.command('import')
+@click.argument('artifact', default=DEFAULT_ARTIFACT_PATH, type=click.Path(exists=True, dir_okay=False))
+@click.option(
+    '--no-verify',
+    is_flag=True,
+    help='Load the artifact as-is, without re-embedding documents that changed since export'
+)
+@click.pass_obj
+def import_command(obj: Dict[str, str], artifact: str, no_verify: bool):
+    """Replace the vector index with ARTIFACT, re-embedding only changed documents."""
+    import_index(
+        artifact=artifact,
+        skills_dir=obj["skills_dir"],
+        agents_dir=obj["agents_dir"],
+        chroma_path=obj["chroma_path"],
+        verify=not no_verify,
+        use_cache=obj["use_cache"]
+    )
+
+
 if __name__ == "__main__":
     main()
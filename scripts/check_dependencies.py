@@ -12,15 +12,30 @@ Checks for:
 Usage:
     python scripts/check_dependencies.py
     python scripts/check_dependencies.py --skill security-auditor
+    python scripts/check_dependencies.py --changed-since origin/main
+    python scripts/check_dependencies.py --jsonl                  # One JSON line per issue, streamed
+    python scripts/check_dependencies.py --dependents api-architect  # What uses it (transitively)
+    python scripts/check_dependencies.py --closure api-architect     # What it uses (transitively)
+    python scripts/check_dependencies.py --benchmark              # 10k synthetic skills
 """
 
 import argparse
+import json
+import os
+import random
 import re
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import Dict, List, Set, Optional
-from collections import defaultdict
+from typing import Callable, Dict, Iterable, List, Set, Optional, Tuple
+from collections import Counter, defaultdict, deque
+
+from corpus_cache import CorpusCache, open_cache, read_markdown
+from dependency_graph import (DependencyGraph, mcp_servers, open_graph, reference_links, skill_frontmatter,
+                              use_with_refs)
+from git_changes import affected_skills
 
 @dataclass
 class DependencyIssue:
@@ -30,19 +45,161 @@ class DependencyIssue:
     message: str
     severity: str  # 'error', 'warning'
 
+    def to_dict(self) -> Dict[str, str]:
+        return {'skill': self.skill, 'type': self.issue_type,
+                'message': self.message, 'severity': self.severity}
+
+
+def edit_distance(a: str, b: str, limit: Optional[int] = None) -> int:
+    """Levenshtein distance (insert, delete, substitute all cost 1).
+
+    With limit, only the diagonal band of width limit is computed and
+    limit + 1 is returned as soon as the distance must exceed it.
+    """
+    # A shared prefix/suffix never changes the distance (names share many)
+    start = 0
+    while start < len(a) and start < len(b) and a[start] == b[start]:
+        start += 1
+    end = 0
+    while end < len(a) - start and end < len(b) - start and a[-1 - end] == b[-1 - end]:
+        end += 1
+    a, b = a[start:len(a) - end], b[start:len(b) - end]
+
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is None:
+        limit = len(a)
+    if len(a) - len(b) > limit:
+        return limit + 1
+
+    over = limit + 1
+    previous = [j if j <= limit else over for j in range(len(b) + 1)]
+    for i in range(1, len(a) + 1):
+        ca = a[i - 1]
+        lo, hi = max(1, i - limit), min(len(b), i + limit)
+        current = [over] * (len(b) + 1)
+        current[0] = i if i <= limit else over
+        best = current[0]
+        for j in range(lo, hi + 1):
+            cost = previous[j - 1] + (ca != b[j - 1])
+            if previous[j] + 1 < cost:
+                cost = previous[j] + 1
+            if current[j - 1] + 1 < cost:
+                cost = current[j - 1] + 1
+            current[j] = cost
+            if cost < best:
+                best = cost
+        if best > limit:
+            return over
+        previous = current
+    return min(previous[-1], over)
+
+
+class SkillNameIndex:
+    """Ranked "did you mean" suggestions for unknown skill references.
+
+    Built once per run over the skill names, with trigram postings bucketed
+    by name length. Lookups replace the old scan of every name per unknown
+    reference:
+
+    - names inside the reference: each of its substrings is a set lookup;
+    - names containing the reference: they contain its rarest trigram, so
+      only that trigram's postings are checked;
+    - typos: k edits destroy at most 3k trigrams, so a name within edit
+      distance k is within k characters in length and shares at least
+      max(trigrams) - 3k trigrams with the reference. Shared trigrams are
+      counted over the length-bucketed postings and only names passing
+      that bound get a (bounded) edit distance computed.
+    """
+
+    MAX_SUGGESTIONS = 5
+
+    def __init__(self, names: Iterable[str]):
+        self._names = set(names)
+        # trigram -> name length -> names
+        self._postings: Dict[str, Dict[int, List[str]]] = defaultdict(lambda: defaultdict(list))
+        self._gram_counts: Dict[str, int] = {}
+
+        for name in sorted(self._names):
+            grams = self._grams(name)
+            self._gram_counts[name] = len(grams)
+            for gram in grams:
+                self._postings[gram][len(name)].append(name)
+
+    @staticmethod
+    def _grams(text: str) -> Set[str]:
+        return {text[i:i + 3] for i in range(len(text) - 2)}
+
+    @staticmethod
+    def max_distance(ref: str) -> int:
+        """Edit distance still treated as a typo: 1 for short names, else 2."""
+        return 1 if len(ref) < 8 else 2
+
+    def suggest(self, ref: str, limit: int = MAX_SUGGESTIONS) -> List[str]:
+        """Closest known names to ref, nearest first."""
+        k = self.max_distance(ref)
+        ref_grams = self._grams(ref)
+
+        # Names that are substrings of ref
+        matches = {ref[i:j] for i in range(len(ref)) for j in range(i + 1, len(ref) + 1)} & self._names
+
+        if len(ref_grams) - 3 * k <= 0:
+            # Too short for trigram filtering to prune anything
+            matches.update(n for n in self._names if ref in n or edit_distance(ref, n, k) <= k)
+            return sorted(matches, key=lambda n: (edit_distance(ref, n), n))[:limit]
+
+        postings = [self._postings[g] for g in ref_grams if g in self._postings]
+        if len(postings) < len(ref_grams):
+            rarest = {}  # Some trigram occurs in no name, so nothing contains ref
+        else:
+            rarest = min(postings, key=lambda p: sum(len(v) for v in p.values()))
+        for length, names in rarest.items():
+            if length > len(ref):
+                matches.update(n for n in names if ref in n)
+
+        shared: Counter = Counter()
+        for by_length in postings:
+            for length in range(len(ref) - k, len(ref) + k + 1):
+                names = by_length.get(length)
+                if names:
+                    shared.update(names)
+
+        floor = len(ref_grams) - 3 * k
+        for name, count in shared.items():
+            if count >= floor and count >= self._gram_counts[name] - 3 * k and name not in matches:
+                if edit_distance(ref, name, k) <= k:
+                    matches.add(name)
+
+        return sorted(matches, key=lambda n: (edit_distance(ref, n), n))[:limit]
+
 
 class DependencyChecker:
     """Checks skill dependencies and cross-references"""
 
-    def __init__(self, base_dir: Path):
+    def __init__(self, base_dir: Path, cache: Optional[CorpusCache] = None,
+                 graph: Optional[DependencyGraph] = None, workers: Optional[int] = None,
+                 on_issue: Optional[Callable[[DependencyIssue], None]] = None):
         self.base_dir = base_dir
         self.skills_dir = base_dir / '.claude' / 'skills'
+        self.cache = cache
+        self.graph = graph
+        # Skill scans are stat/read bound, so threads overlap the I/O waits
+        self.workers = workers or min(32, (os.cpu_count() or 1) + 4)
+        # Called with each issue as soon as it is recorded (e.g. to stream JSON Lines)
+        self.on_issue = on_issue
         self.issues: List[DependencyIssue] = []
         self.skill_names: Set[str] = set()
         self.skill_references: Dict[str, Set[str]] = defaultdict(set)
+        self.name_index = SkillNameIndex(())
 
     def add_issue(self, skill: str, issue_type: str, message: str, severity: str = 'warning'):
-        self.issues.append(DependencyIssue(skill, issue_type, message, severity))
+        self._record([DependencyIssue(skill, issue_type, message, severity)])
+
+    def _record(self, issues: List[DependencyIssue]) -> None:
+        self.issues.extend(issues)
+        if self.on_issue is not None:
+            for issue in issues:
+                self.on_issue(issue)
 
     def discover_skills(self) -> None:
         """Find all skill directories"""
@@ -55,6 +212,8 @@ class DependencyChecker:
             if skill_dir.is_dir() and (skill_dir / 'SKILL.md').exists():
                 self.skill_names.add(skill_dir.name)
 
+        self.name_index = SkillNameIndex(self.skill_names)
+
     def check_all(self) -> bool:
         """Run all checks and return overall pass/fail"""
         self.discover_skills()
@@ -62,9 +221,7 @@ class DependencyChecker:
         if not self.skill_names:
             return len([i for i in self.issues if i.severity == 'error']) == 0
 
-        for skill_name in self.skill_names:
-            skill_dir = self.skills_dir / skill_name
-            self._check_skill(skill_dir)
+        self._check_skills(self.skill_names)
 
         self._check_circular_dependencies()
 
@@ -86,130 +243,182 @@ class DependencyChecker:
         errors = [i for i in self.issues if i.severity == 'error']
         return len(errors) == 0
 
+    def check_changed(self, skill_names: Set[str]) -> bool:
+        """Check only the given skills, plus any cycles passing through them.
+
+        References of the other skills are still collected (without checks)
+        so cycle detection sees the whole graph.
+        """
+        self.discover_skills()
+        self._check_skills(self.skill_names & skill_names)
+
+        for skill_name in self.skill_names - skill_names:
+            skill_dir = self.skills_dir / skill_name
+            if self.graph is not None and skill_name in self.graph.nodes:
+                self.skill_references[skill_name].update(
+                    ref for ref in self.graph.nodes[skill_name].uses if ref in self.skill_names
+                )
+            else:
+                content = read_markdown(skill_dir / 'SKILL.md', self.cache).content
+                self.skill_references[skill_name].update(
+                    ref for ref in use_with_refs(content) if ref in self.skill_names
+                )
+
+        self._check_circular_dependencies(only=skill_names)
+
+        errors = [i for i in self.issues if i.severity == 'error']
+        return len(errors) == 0
+
+    def _check_skills(self, skill_names: Iterable[str]) -> None:
+        """Scan skills concurrently, merging results in name order."""
+        skill_dirs = [self.skills_dir / name for name in sorted(skill_names)]
+        if self.workers <= 1 or len(skill_dirs) <= 1:
+            for skill_dir in skill_dirs:
+                self._check_skill(skill_dir)
+            return
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            for skill_dir, scan in zip(skill_dirs, executor.map(self._scan_skill, skill_dirs)):
+                self._merge_scan(skill_dir.name, *scan)
+
+    def _merge_scan(self, skill_name: str, issues: List[DependencyIssue], refs: Set[str]) -> None:
+        self._record(issues)
+        if refs:
+            self.skill_references[skill_name].update(refs)
+
     def _check_skill(self, skill_dir: Path) -> None:
         """Check a single skill's dependencies"""
+        self._merge_scan(skill_dir.name, *self._scan_skill(skill_dir))
+
+    def _scan_skill(self, skill_dir: Path) -> Tuple[List[DependencyIssue], Set[str]]:
+        """Check one skill without touching shared state, so it can run in a worker thread.
+
+        Returns the skill's issues and the existing skills it references.
+        """
         skill_name = skill_dir.name
         skill_md = skill_dir / 'SKILL.md'
+        issues: List[DependencyIssue] = []
+        refs: Set[str] = set()
 
         if not skill_md.exists():
-            self.add_issue(skill_name, 'missing_file',
-                          "SKILL.md not found", 'error')
-            return
+            issues.append(DependencyIssue(skill_name, 'missing_file', "SKILL.md not found", 'error'))
+            return issues, refs
 
-        content = skill_md.read_text()
+        entry = read_markdown(skill_md, self.cache)
+        content, frontmatter = entry.content, skill_frontmatter(entry)
+        if entry.frontmatter_error:
+            issues.append(DependencyIssue(skill_name, 'invalid_frontmatter',
+                          "Invalid YAML frontmatter; allowed-tools read line by line",
+                          'warning'))
 
         # Check for skill references in "Use with:" section
-        self._check_skill_references(skill_name, content)
+        self._check_skill_references(skill_name, content, issues, refs)
 
         # Check for reference file links
-        self._check_reference_links(skill_name, skill_dir, content)
+        self._check_reference_links(skill_name, skill_dir, content, issues)
 
         # Check for MCP tool references
-        self._check_mcp_tools(skill_name, content)
-
-    def _check_skill_references(self, skill_name: str, content: str) -> None:
-        """Check that referenced skills exist"""
-        # Look for "Use with:" section
-        use_with_match = re.search(r'\*\*Use with\*\*:\s*(.+)', content)
-        if not use_with_match:
-            return
+        self._check_mcp_tools(skill_name, frontmatter, issues)
 
-        use_with_line = use_with_match.group(1)
+        return issues, refs
 
-        # Extract skill names (format: skill-name, skill-name (description))
-        skill_refs = re.findall(r'([a-z][a-z0-9-]+)', use_with_line)
-
-        for ref in skill_refs:
+    def _check_skill_references(self, skill_name: str, content: str,
+                                issues: List[DependencyIssue], refs: Set[str]) -> None:
+        """Check that referenced skills exist"""
+        # Skill names from the "Use with:" line (format: skill-name, skill-name (description))
+        for ref in use_with_refs(content):
             if ref in self.skill_names:
-                self.skill_references[skill_name].add(ref)
+                refs.add(ref)
             else:
                 # Check if it might be a partial match or typo
-                close_matches = [s for s in self.skill_names
-                               if ref in s or s in ref]
+                close_matches = self.name_index.suggest(ref)
                 if close_matches:
-                    self.add_issue(skill_name, 'possible_typo',
+                    issues.append(DependencyIssue(skill_name, 'possible_typo',
                                   f"'{ref}' not found, did you mean: {close_matches}?",
-                                  'warning')
+                                  'warning'))
                 else:
-                    self.add_issue(skill_name, 'missing_ref',
+                    issues.append(DependencyIssue(skill_name, 'missing_ref',
                                   f"Referenced skill not found: '{ref}'",
-                                  'warning')
+                                  'warning'))
+
+    def _list_references(self, refs_dir: Path) -> Optional[Set[str]]:
+        """File names in a references/ directory from one listing; None if it doesn't exist."""
+        if self.cache is not None:
+            if not refs_dir.is_dir():
+                return None
+            return set(self.cache.list_dir(refs_dir))
+        try:
+            with os.scandir(refs_dir) as it:
+                return {e.name for e in it if e.is_file()}
+        except (FileNotFoundError, NotADirectoryError):
+            return None
 
     def _check_reference_links(self, skill_name: str, skill_dir: Path,
-                               content: str) -> None:
+                               content: str, issues: List[DependencyIssue]) -> None:
         """Check that reference file links are valid"""
-        # Find reference file mentions
-        ref_mentions = re.findall(r'`references/([^`]+)`', content)
-        ref_mentions += re.findall(r'references/([a-zA-Z0-9_-]+\.md)', content)
-        # Clean up any trailing punctuation
-        ref_mentions = [r.rstrip('`\'".,;:)') for r in ref_mentions]
-
+        ref_mentions = reference_links(content)
         refs_dir = skill_dir / 'references'
-
-        for ref_file in set(ref_mentions):
-            ref_path = refs_dir / ref_file
-            if not ref_path.exists():
-                self.add_issue(skill_name, 'broken_ref_link',
+        listing = self._list_references(refs_dir)
+
+        for ref_file in ref_mentions:
+            if listing is not None and ref_file in listing:
+                continue
+            # Not a file in the listing; could still be a directory or a nested path
+            if listing is None or not (refs_dir / ref_file).exists():
+                issues.append(DependencyIssue(skill_name, 'broken_ref_link',
                               f"Referenced file not found: references/{ref_file}",
-                              'error')
+                              'error'))
 
         # Check if references dir exists but isn't mentioned
-        if refs_dir.exists():
-            existing_refs = {f.name for f in refs_dir.glob('*.md')}
+        if listing is not None:
+            existing_refs = {name for name in listing if name.endswith('.md')}
             mentioned_refs = {r for r in ref_mentions if r.endswith('.md')}
             unmentioned = existing_refs - mentioned_refs
 
             if unmentioned:
-                self.add_issue(skill_name, 'unreferenced_files',
+                issues.append(DependencyIssue(skill_name, 'unreferenced_files',
                               f"Reference files not mentioned in SKILL.md: {unmentioned}",
-                              'warning')
+                              'warning'))
 
-    def _check_mcp_tools(self, skill_name: str, content: str) -> None:
+    def _check_mcp_tools(self, skill_name: str, frontmatter: Dict,
+                         issues: List[DependencyIssue]) -> None:
         """Check MCP tool references in allowed-tools"""
-        # Extract allowed-tools from frontmatter
-        tools_match = re.search(r'^allowed-tools:\s*(.+)$', content, re.MULTILINE)
-        if not tools_match:
-            return
-
-        tools = tools_match.group(1)
-
-        # Find MCP tool references
-        mcp_refs = re.findall(r'mcp__([a-zA-Z0-9_-]+)__', tools)
-
-        for mcp in mcp_refs:
+        for mcp in mcp_servers(frontmatter):
             # We can't verify MCP servers exist, but we can check format
             if not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', mcp):
-                self.add_issue(skill_name, 'invalid_mcp',
+                issues.append(DependencyIssue(skill_name, 'invalid_mcp',
                               f"Invalid MCP server name format: {mcp}",
-                              'error')
-
-    def _check_circular_dependencies(self) -> None:
-        """Check for circular dependencies between skills"""
-        def find_cycle(skill: str, path: List[str], visited: Set[str]) -> Optional[List[str]]:
-            if skill in path:
-                cycle_start = path.index(skill)
-                return path[cycle_start:] + [skill]
-
-            if skill in visited:
-                return None
-
-            visited.add(skill)
-            path.append(skill)
-
-            for ref in self.skill_references.get(skill, set()):
-                cycle = find_cycle(ref, path.copy(), visited)
-                if cycle:
-                    return cycle
-
-            return None
-
-        visited: Set[str] = set()
-        for skill in self.skill_references:
-            cycle = find_cycle(skill, [], visited)
-            if cycle:
-                self.add_issue(skill, 'circular_dep',
-                              f"Circular dependency detected: {' -> '.join(cycle)}",
-                              'warning')
+                              'error'))
+
+    def _check_circular_dependencies(self, only: Optional[Set[str]] = None) -> None:
+        """Report every dependency cycle (those through `only`, if given).
+
+        Each strongly connected component with more than one skill is one
+        cycle group and yields one issue; a skill that lists itself under
+        "Use with" is always reported on its own.
+        """
+        for component in strongly_connected_components(self.skill_references):
+            members = set(component)
+            if only is not None and not only.intersection(members):
+                continue
+
+            if len(members) > 1:
+                for skill in sorted(members):
+                    if skill in self.skill_references.get(skill, ()):
+                        self.add_issue(skill, 'circular_dep',
+                                      f"Circular dependency detected: {skill} -> {skill}",
+                                      'warning')
+
+            start = min(component)
+            # Self-references were reported above; show the cycle through the others
+            cycle = shortest_cycle(self.skill_references, start, members, self_loops=len(members) == 1)
+            if cycle is None:  # Single skill without a self-reference
+                continue
+
+            message = f"Circular dependency detected: {' -> '.join(cycle)}"
+            if len(members) > len(cycle) - 1:
+                message += f" ({len(members)} skills in cycle group: {', '.join(sorted(members))})"
+            self.add_issue(start, 'circular_dep', message, 'warning')
 
     def print_report(self) -> None:
         """Print dependency check report"""
@@ -250,33 +459,335 @@ class DependencyChecker:
         print(f"{'='*60}\n")
 
 
+def strongly_connected_components(graph: Dict[str, Iterable[str]]) -> List[List[str]]:
+    """Tarjan's SCC algorithm, iterative so long chains cannot hit the recursion limit.
+
+    graph maps node -> successors (successors need not be keys). Runs in O(V+E)
+    and returns components in reverse topological order.
+    """
+    index: Dict[str, int] = {}
+    lowlink: Dict[str, int] = {}
+    on_stack: Set[str] = set()
+    stack: List[str] = []
+    components: List[List[str]] = []
+    counter = 0
+
+    for root in sorted(graph):
+        if root in index:
+            continue
+
+        # Each work item is (node, iterator over its remaining successors)
+        index[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(sorted(graph.get(root, ()))))]
+
+        while work:
+            node, successors = work[-1]
+            advanced = False
+            for succ in successors:
+                if succ not in index:
+                    index[succ] = lowlink[succ] = counter
+                    counter += 1
+                    stack.append(succ)
+                    on_stack.add(succ)
+                    work.append((succ, iter(sorted(graph.get(succ, ())))))
+                    advanced = True
+                    break
+                if succ in on_stack:
+                    lowlink[node] = min(lowlink[node], index[succ])
+            if advanced:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+            if lowlink[node] == index[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == node:
+                        break
+                components.append(component)
+
+    return components
+
+
+def shortest_cycle(graph: Dict[str, Iterable[str]], start: str,
+                   within: Set[str], self_loops: bool = True) -> Optional[List[str]]:
+    """Shortest path start -> ... -> start using only nodes in within (BFS).
+
+    With self_loops=False a node's edge to itself is ignored, so the cycle
+    found has at least two members.
+    """
+    parents: Dict[str, str] = {}
+    queue = deque([start])
+    while queue:
+        node = queue.popleft()
+        for succ in sorted(graph.get(node, ())):
+            if succ == node and not self_loops:
+                continue
+            if succ == start:
+                path = [node]
+                while path[-1] != start:
+                    path.append(parents[path[-1]])
+                return list(reversed(path)) + [start]
+            if succ in within and succ not in parents:
+                parents[succ] = node
+                queue.append(succ)
+    return None
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def _legacy_find_cycles(graph: Dict[str, Set[str]]) -> List[List[str]]:
+    """The recursive path.copy() search _check_circular_dependencies used to run."""
+    def find_cycle(skill: str, path: List[str], visited: Set[str]) -> Optional[List[str]]:
+        if skill in path:
+            return path[path.index(skill):] + [skill]
+        if skill in visited:
+            return None
+        visited.add(skill)
+        path.append(skill)
+        for ref in graph.get(skill, set()):
+            cycle = find_cycle(ref, path.copy(), visited)
+            if cycle:
+                return cycle
+        return None
+
+    visited: Set[str] = set()
+    cycles = []
+    for skill in graph:
+        cycle = find_cycle(skill, [], visited)
+        if cycle:
+            cycles.append(cycle)
+    return cycles
+
+
+def synthetic_graph(size: int, degree: int = 3, cycles: int = 50, seed: int = 0) -> Dict[str, Set[str]]:
+    """A skill graph shaped like the real one, at scale.
+
+    Mostly acyclic "Use with" edges pointing at nearby later skills, so
+    dependency chains run thousands deep (what broke the recursive search),
+    plus some planted cycles.
+    """
+    rng = random.Random(seed)
+    names = [f"skill-{i:05d}" for i in range(size)]
+    graph: Dict[str, Set[str]] = {name: set() for name in names}
+
+    for i, name in enumerate(names[:-1]):
+        graph[name].add(names[i + 1])
+        for _ in range(degree - 1):
+            graph[name].add(names[rng.randrange(i + 1, min(size, i + 10))])
+
+    for _ in range(cycles):
+        a = rng.randrange(size)
+        b = rng.randrange(max(0, a - 20), a + 1)
+        graph[names[a]].add(names[b])
+
+    return graph
+
+
+BENCHMARK_WORDS = (
+    "api ai agent audio auth cache chart cli cloud code color cost cv dag data db design "
+    "deploy devops docs drone email event finance git graph grief hr image infra job "
+    "layout llm map mcp metrics ml mobile monitor network oauth pixel pipeline prompt "
+    "pwa react recovery research rest retro search security seo shader skill sound "
+    "speech sql stream swift test theme typography ui ux vector video voice vr web"
+).split()
+BENCHMARK_SUFFIXES = ("expert", "designer", "engineer", "builder", "coach", "auditor", "patterns", "analyzer")
+
+
+def synthetic_names(size: int, seed: int = 0) -> List[str]:
+    """Hyphenated skill names, e.g. 'drone-vector-designer'.
+
+    Real topic words plus pronounceable made-up ones, since a 10k-skill
+    tree has a far wider vocabulary than BENCHMARK_WORDS alone.
+    """
+    rng = random.Random(seed)
+    syllables = [c + v for c in "bcdfghklmnprstvz" for v in "aeiou"]
+    vocabulary = list(BENCHMARK_WORDS)
+    while len(vocabulary) < max(len(BENCHMARK_WORDS), size // 5):
+        vocabulary.append("".join(rng.choice(syllables) for _ in range(rng.randint(2, 4))))
+
+    names: Set[str] = set()
+    while len(names) < size:
+        words = rng.sample(vocabulary, rng.randint(1, 3))
+        names.add("-".join(words + [rng.choice(BENCHMARK_SUFFIXES)]))
+    return sorted(names)
+
+
+def _typo(name: str, rng: random.Random) -> str:
+    i = rng.randrange(len(name))
+    op = rng.randrange(3)
+    if op == 0:
+        return name[:i] + name[i + 1:]
+    if op == 1:
+        return name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[i:]
+    return name[:i] + rng.choice("abcdefghijklmnopqrstuvwxyz") + name[i + 1:]
+
+
+def run_benchmark(size: int, repeat: int = 3) -> int:
+    """Time cycle detection and "did you mean" lookups against the legacy code on synthetic data."""
+    graph = synthetic_graph(size)
+    edges = sum(len(v) for v in graph.values())
+
+    print(f"\n{'='*60}")
+    print("DEPENDENCY CHECK BENCHMARK")
+    print(f"{'='*60}\n")
+    print(f"Graph:   {size:,} skills, {edges:,} references")
+    print(f"Repeat:  best of {repeat}\n")
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        components = strongly_connected_components(graph)
+        best = min(best, time.perf_counter() - start)
+    groups = [c for c in components if len(c) > 1 or c[0] in graph[c[0]]]
+    print(f"  {'tarjan (iterative SCC)':<28} {best * 1000:10.1f} ms  "
+          f"{len(groups)} cycle groups, {sum(len(c) for c in groups)} skills")
+
+    start = time.perf_counter()
+    try:
+        found = _legacy_find_cycles(graph)
+        elapsed = time.perf_counter() - start
+        print(f"  {'legacy (recursive search)':<28} {elapsed * 1000:10.1f} ms  "
+              f"{len(found)} cycles ({elapsed / best:.1f}x tarjan time)")
+    except RecursionError:
+        elapsed = time.perf_counter() - start
+        print(f"  {'legacy (recursive search)':<28} {'RecursionError':>13} after {elapsed * 1000:.1f} ms")
+
+    rng = random.Random(1)
+    names = synthetic_names(size)
+    name_set = set(names)
+    refs = [_typo(rng.choice(names), rng) for _ in range(1000)]
+    refs = [r for r in refs if r not in name_set]
+
+    print(f"\nNames:   {len(names):,} skills, {len(refs):,} unknown references\n")
+
+    start = time.perf_counter()
+    index = SkillNameIndex(names)
+    build = time.perf_counter() - start
+    start = time.perf_counter()
+    suggested = sum(1 for r in refs if index.suggest(r))
+    indexed = time.perf_counter() - start
+    print(f"  {'indexed (trigram postings)':<28} {indexed * 1000:10.1f} ms  "
+          f"{suggested} with suggestions (+{build * 1000:.0f} ms build)")
+
+    start = time.perf_counter()
+    suggested = sum(1 for r in refs if [s for s in names if r in s or s in r])
+    elapsed = time.perf_counter() - start
+    print(f"  {'legacy (substring scan)':<28} {elapsed * 1000:10.1f} ms  "
+          f"{suggested} with suggestions ({elapsed / indexed:.1f}x indexed time)")
+
+    print(f"\n{'='*60}\n")
+    return 0
+
+
+def query_graph(graph: DependencyGraph, skill: str, dependents: bool, json_output: bool = False) -> int:
+    """Answer --dependents / --closure from the persisted graph, grouped by depth."""
+    if not dependents and skill not in graph.nodes:
+        print(f"❌ Skill not found: {skill}", file=sys.stderr)
+        return 1
+
+    depths = graph.dependents(skill) if dependents else graph.closure(skill)
+
+    if json_output:
+        key = 'dependents' if dependents else 'closure'
+        print(json.dumps({'skill': skill, key: dict(sorted(depths.items()))}, indent=2))
+        return 0
+
+    heading = "Skills that use" if dependents else "Skills used by"
+    print(f"\n{heading} '{skill}' ({len(depths)}):")
+    if not depths:
+        print("   (none)")
+    for depth in sorted(set(depths.values())):
+        names = sorted(n for n, d in depths.items() if d == depth)
+        label = "direct" if depth == 1 else f"depth {depth}"
+        print(f"   {label}: {', '.join(names)}")
+    print()
+    return 0
+
+
 def main():
     parser = argparse.ArgumentParser(description='Check skill dependencies')
     parser.add_argument('--skill', '-s', help='Check specific skill only')
     parser.add_argument('--json', action='store_true', help='Output JSON')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Stream one JSON line per issue, then a summary line')
     parser.add_argument('--dir', default='.', help='Base directory')
+    parser.add_argument('--changed-since', metavar='REV',
+                        help='Only check skills changed since REV and the skills that use them')
+    parser.add_argument('--dependents', metavar='SKILL',
+                        help='List skills that use SKILL, directly or transitively (impact analysis)')
+    parser.add_argument('--closure', metavar='SKILL',
+                        help='List skills SKILL uses, directly or transitively')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Threads for the skill scan (1 = sequential)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help="Don't read or write .cache/ (the corpus cache and dependency graph); "
+                             "files are read once per run, in memory")
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Benchmark cycle detection and suggestions on synthetic skills')
+    parser.add_argument('--benchmark-size', type=int, default=10000,
+                        help='Number of skills in the synthetic graph')
 
     args = parser.parse_args()
 
-    base_dir = Path(args.dir).resolve()
-    checker = DependencyChecker(base_dir)
+    if args.benchmark:
+        return run_benchmark(args.benchmark_size)
 
-    if args.skill:
-        passed = checker.check_single(args.skill)
-    else:
-        passed = checker.check_all()
+    base_dir = Path(args.dir).resolve()
+    # Without the shared cache, an in-memory one still lets the graph refresh
+    # and the skill scan share each file's single read
+    cache = CorpusCache.in_memory(base_dir) if args.no_cache else open_cache(base_dir)
+
+    try:
+        graph = open_graph(base_dir, cache, persist=not args.no_cache)
+        if args.dependents:
+            return query_graph(graph, args.dependents, dependents=True, json_output=args.json)
+        if args.closure:
+            return query_graph(graph, args.closure, dependents=False, json_output=args.json)
+
+        on_issue = None
+        if args.jsonl:
+            on_issue = lambda issue: print(json.dumps(issue.to_dict()), flush=True)
+        checker = DependencyChecker(base_dir, cache, graph, workers=args.workers, on_issue=on_issue)
+        if args.skill:
+            passed = checker.check_single(args.skill)
+        elif args.changed_since:
+            try:
+                affected = affected_skills(base_dir, args.changed_since, cache, graph)
+            except RuntimeError as e:
+                parser.error(str(e))
+            passed = checker.check_changed(affected)
+        else:
+            passed = checker.check_all()
+    finally:
+        if cache is not None:
+            cache.close()
 
-    if args.json:
-        import json
+    if args.jsonl:
+        print(json.dumps({'summary': {
+            'passed': passed,
+            'skills': len(checker.skill_names),
+            'references': sum(len(v) for v in checker.skill_references.values()),
+            'errors': sum(1 for i in checker.issues if i.severity == 'error'),
+            'warnings': sum(1 for i in checker.issues if i.severity == 'warning'),
+        }}), flush=True)
+    elif args.json:
         print(json.dumps({
             'passed': passed,
             'skills_found': list(checker.skill_names),
             'references': {k: list(v) for k, v in checker.skill_references.items()},
-            'issues': [
-                {'skill': i.skill, 'type': i.issue_type,
-                 'message': i.message, 'severity': i.severity}
-                for i in checker.issues
-            ]
+            'issues': [i.to_dict() for i in checker.issues]
         }, indent=2))
     else:
         checker.print_report()
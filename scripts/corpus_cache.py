@@ -0,0 +1,364 @@
+#!/usr/bin/env python3
+"""
+Shared Parsed-Corpus Cache
+
+An on-disk cache of parsed SKILL.md / AGENT.md / reference files shared by
+generate_ecosystem_data.py, measure-ecosystem.py, check_dependencies.py,
+validate_skill.py and build_embeddings.py, so a full run of the script suite
+reads and parses each file at most once.
+
+Each document is stored with its raw content, parsed frontmatter, section
+offsets and code fence count, keyed by path relative to the project root.
+Entries are revalidated with a stat() call: an unchanged (mtime, size) is a
+hit without touching the file; otherwise the file is read and hashed, and is
+only re-parsed if its content hash changed. Directory listings (e.g. a skill's
+references/) are cached by directory mtime.
+
+The cache lives in .cache/corpus.sqlite under the project root.
+
+Usage:
+    from corpus_cache import CorpusCache
+
+    with CorpusCache(base_dir) as cache:
+        entry = cache.get(base_dir / '.claude/skills/foo/SKILL.md')
+        entry.frontmatter, entry.body, entry.sections, entry.code_fences
+
+    python scripts/corpus_cache.py --stats   # Warm the cache and show hit rates
+    python scripts/corpus_cache.py --clear
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+
+from skill_parser import load_yaml, section_spans, split_frontmatter
+
+CACHE_DIR_NAME = ".cache"
+CACHE_FILE_NAME = "corpus.sqlite"
+
+# SQLite's name for a database that lives only in this process
+MEMORY_PATH = ":memory:"
+
+# Bump when the parsed representation changes; older caches are discarded
+SCHEMA_VERSION = 1
+
+# Code fences as counted by validate_skill (opening and closing fences both match)
+CODE_FENCE_RE = re.compile(r'```[\w]*\n')
+
+
+@dataclass
+class CorpusEntry:
+    """A parsed markdown document from the corpus."""
+    path: Path
+    content_hash: str
+    content: str
+    frontmatter: Dict[str, Any]
+    has_frontmatter: bool  # A closed '---' block was found
+    frontmatter_error: Optional[str]  # YAML error message, if the block is invalid
+    body_offset: int
+    section_spans: List[Tuple[str, int, int]] = field(default_factory=list)
+    code_fences: int = 0
+
+    @property
+    def body(self) -> str:
+        """Markdown after the frontmatter block."""
+        return self.content[self.body_offset:]
+
+    @property
+    def sections(self) -> List[Tuple[str, str]]:
+        """(title, content) pairs, as returned by skill_parser.split_sections."""
+        body = self.body
+        return [(title, body[start:end]) for title, start, end in self.section_spans]
+
+
+def find_project_root(start: Path) -> Optional[Path]:
+    """Find the nearest directory at or above start containing .claude."""
+    current = start.resolve()
+    if current.is_file():
+        current = current.parent
+    while True:
+        if (current / ".claude").exists():
+            return current
+        if current == current.parent:
+            return None
+        current = current.parent
+
+
+def parse_entry(path: Path, raw: bytes) -> CorpusEntry:
+    """Parse raw file bytes into a CorpusEntry."""
+    content = raw.decode("utf-8", errors="replace")
+    frontmatter: Dict[str, Any] = {}
+    error = None
+    body_offset = 0
+
+    parts = split_frontmatter(content)
+    if parts is not None:
+        raw_frontmatter, body = parts
+        body_offset = len(content) - len(body)
+        try:
+            data = load_yaml(raw_frontmatter)
+            if isinstance(data, dict):
+                # Normalise through JSON so fresh and cached entries are identical
+                # (YAML dates etc. become strings)
+                frontmatter = json.loads(json.dumps(data, default=str))
+        except yaml.YAMLError as e:
+            error = str(e)
+
+    return CorpusEntry(
+        path=path,
+        content_hash=hashlib.md5(raw).hexdigest(),
+        content=content,
+        frontmatter=frontmatter,
+        has_frontmatter=parts is not None,
+        frontmatter_error=error,
+        body_offset=body_offset,
+        section_spans=section_spans(content[body_offset:]),
+        code_fences=len(CODE_FENCE_RE.findall(content)),
+    )
+
+
+class CorpusCache:
+    """Per-file parsed-document cache backed by SQLite."""
+
+    def __init__(self, base_dir: Path, cache_path: Optional[Path] = None):
+        self.base_dir = base_dir.resolve()
+        self.cache_path = cache_path or self.base_dir / CACHE_DIR_NAME / CACHE_FILE_NAME
+        if str(self.cache_path) != MEMORY_PATH:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # Shared by worker threads (e.g. check_dependencies' parallel scan)
+        self._lock = threading.Lock()
+        self._memo: Dict[str, CorpusEntry] = {}
+        self.stats = {"hits": 0, "rehashed": 0, "parsed": 0}
+
+        self._db = sqlite3.connect(str(self.cache_path), check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._init_schema()
+
+    @classmethod
+    def in_memory(cls, base_dir: Path) -> "CorpusCache":
+        """A cache for this process only: files are still read once, nothing touches .cache/."""
+        return cls(base_dir, Path(MEMORY_PATH))
+
+    def _init_schema(self) -> None:
+        self._db.execute("CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)")
+        row = self._db.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is None or int(row[0]) != SCHEMA_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS documents")
+            self._db.execute("DROP TABLE IF EXISTS directories")
+            self._db.execute("INSERT OR REPLACE INTO meta VALUES ('schema_version', ?)",
+                             (str(SCHEMA_VERSION),))
+
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS documents (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                content TEXT NOT NULL,
+                frontmatter TEXT NOT NULL,
+                has_frontmatter INTEGER NOT NULL,
+                frontmatter_error TEXT,
+                body_offset INTEGER NOT NULL,
+                sections TEXT NOT NULL,
+                code_fences INTEGER NOT NULL
+            )
+        """)
+        self._db.execute("""
+            CREATE TABLE IF NOT EXISTS directories (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                entries TEXT NOT NULL
+            )
+        """)
+        self._db.commit()
+
+    def _key(self, path: Path) -> str:
+        """Cache key: path relative to the project root when possible."""
+        resolved = path.resolve()
+        try:
+            return str(resolved.relative_to(self.base_dir))
+        except ValueError:
+            return str(resolved)
+
+    def get(self, path: Path) -> CorpusEntry:
+        """Return the parsed document at path, reading it only if it changed."""
+        key = self._key(path)
+        if key in self._memo:
+            return self._memo[key]
+
+        st = path.stat()
+        with self._lock:
+            row = self._db.execute(
+                "SELECT mtime_ns, size, content_hash, content, frontmatter, has_frontmatter, "
+                "frontmatter_error, body_offset, sections, code_fences FROM documents WHERE path = ?",
+                (key,)
+            ).fetchone()
+
+        if row and row[0] == st.st_mtime_ns and row[1] == st.st_size:
+            self.stats["hits"] += 1
+            entry = self._entry_from_row(path, row)
+        else:
+            raw = path.read_bytes()
+            content_hash = hashlib.md5(raw).hexdigest()
+            if row and row[2] == content_hash:
+                # Touched but unchanged: keep the parse, refresh the stat
+                self.stats["rehashed"] += 1
+                entry = self._entry_from_row(path, row)
+                with self._lock:
+                    self._db.execute("UPDATE documents SET mtime_ns = ?, size = ? WHERE path = ?",
+                                     (st.st_mtime_ns, st.st_size, key))
+            else:
+                self.stats["parsed"] += 1
+                entry = parse_entry(path, raw)
+                self._store(key, st, entry)
+
+        self._memo[key] = entry
+        return entry
+
+    def _entry_from_row(self, path: Path, row: tuple) -> CorpusEntry:
+        return CorpusEntry(
+            path=path,
+            content_hash=row[2],
+            content=row[3],
+            frontmatter=json.loads(row[4]),
+            has_frontmatter=bool(row[5]),
+            frontmatter_error=row[6],
+            body_offset=row[7],
+            section_spans=[tuple(s) for s in json.loads(row[8])],
+            code_fences=row[9],
+        )
+
+    def _store(self, key: str, st: os.stat_result, entry: CorpusEntry) -> None:
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO documents VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    key, st.st_mtime_ns, st.st_size, entry.content_hash, entry.content,
+                    json.dumps(entry.frontmatter),
+                    int(entry.has_frontmatter), entry.frontmatter_error, entry.body_offset,
+                    json.dumps(entry.section_spans), entry.code_fences,
+                )
+            )
+
+    def list_dir(self, directory: Path, suffix: str = "") -> List[str]:
+        """Sorted names of files in directory (optionally ending in suffix), cached by mtime."""
+        try:
+            mtime_ns = directory.stat().st_mtime_ns
+        except FileNotFoundError:
+            return []
+
+        key = self._key(directory)
+        with self._lock:
+            row = self._db.execute("SELECT mtime_ns, entries FROM directories WHERE path = ?",
+                                   (key,)).fetchone()
+
+        if row and row[0] == mtime_ns:
+            names = json.loads(row[1])
+        else:
+            with os.scandir(directory) as it:
+                names = sorted(e.name for e in it if e.is_file())
+            with self._lock:
+                self._db.execute("INSERT OR REPLACE INTO directories VALUES (?, ?, ?)",
+                                 (key, mtime_ns, json.dumps(names)))
+
+        return [n for n in names if n.endswith(suffix)]
+
+    def references(self, skill_dir: Path) -> List[str]:
+        """Reference file names (references/*.md) for a skill."""
+        return self.list_dir(skill_dir / "references", ".md")
+
+    def prune(self) -> int:
+        """Drop entries for files that no longer exist. Returns rows removed."""
+        with self._lock:
+            rows = self._db.execute("SELECT path FROM documents").fetchall()
+            stale = [(p,) for (p,) in rows if not (self.base_dir / p).exists()]
+            self._db.executemany("DELETE FROM documents WHERE path = ?", stale)
+        return len(stale)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.commit()
+            self._db.close()
+
+    def __enter__(self) -> "CorpusCache":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_markdown(path: Path, cache: Optional[CorpusCache] = None) -> CorpusEntry:
+    """Parse path through the cache when one is given, otherwise straight from disk."""
+    if cache is not None:
+        return cache.get(path)
+    return parse_entry(path, path.read_bytes())
+
+
+def open_cache(start: Path, enabled: bool = True) -> Optional[CorpusCache]:
+    """Open the cache for the project containing start, or None if disabled/unavailable."""
+    if not enabled:
+        return None
+    root = find_project_root(start)
+    if root is None:
+        return None
+    try:
+        return CorpusCache(root)
+    except (OSError, sqlite3.Error):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared parsed-corpus cache')
+    parser.add_argument('--dir', default='.', help='Base directory')
+    parser.add_argument('--stats', action='store_true', help='Warm the cache and print hit statistics')
+    parser.add_argument('--clear', action='store_true', help='Delete the cache file')
+    args = parser.parse_args()
+
+    base_dir = Path(args.dir).resolve()
+    cache_path = base_dir / CACHE_DIR_NAME / CACHE_FILE_NAME
+
+    if args.clear:
+        for suffix in ("", "-wal", "-shm"):
+            Path(str(cache_path) + suffix).unlink(missing_ok=True)
+        print(f"Cleared {cache_path}")
+        return 0
+
+    if not args.stats:
+        parser.print_help()
+        return 0
+
+    with CorpusCache(base_dir) as cache:
+        skills_dir = base_dir / ".claude" / "skills"
+        documents = 0
+        for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
+            cache.get(skill_md)
+            for ref in cache.references(skill_md.parent):
+                cache.get(skill_md.parent / "references" / ref)
+                documents += 1
+            documents += 1
+        removed = cache.prune()
+
+        print(f"Cache:     {cache.cache_path}")
+        print(f"Documents: {documents}")
+        print(f"Hits:      {cache.stats['hits']}")
+        print(f"Rehashed:  {cache.stats['rehashed']}")
+        print(f"Parsed:    {cache.stats['parsed']}")
+        print(f"Pruned:    {removed}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+"""
+Persistent Skill Dependency Graph
+
+Keeps the skill graph that check_dependencies.py derives from every SKILL.md
+in a compact artifact, .cache/dependency-graph.json, so impact analysis is an
+index lookup rather than a rescan. Per skill it stores:
+
+- uses:             skills named on the "**Use with**:" line (forward edges)
+- reference_links:  references/*.md files the SKILL.md mentions
+- mcp_servers:      MCP servers named in allowed-tools
+
+plus a reverse-edge index (used_by). Refreshing is incremental: each skill
+carries the content hash of its SKILL.md, and only skills whose hash changed
+are re-extracted. With the corpus cache an unchanged skill costs one stat().
+
+Usage:
+    from dependency_graph import open_graph
+
+    graph = open_graph(base_dir, cache)
+    graph.dependents('api-architect')   # {skill: depth} of everything that uses it
+    graph.closure('api-architect')      # {skill: depth} of everything it uses
+
+    python scripts/check_dependencies.py --dependents api-architect
+    python scripts/check_dependencies.py --closure api-architect
+"""
+
+import hashlib
+import json
+import os
+import re
+from collections import defaultdict, deque
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from corpus_cache import CACHE_DIR_NAME, CorpusCache, CorpusEntry, parse_entry
+from skill_parser import scan_frontmatter
+
+GRAPH_FILE_NAME = "dependency-graph.json"
+
+# Bump when the stored fields or their extraction change
+GRAPH_FORMAT_VERSION = 2
+
+USE_WITH_RE = re.compile(r'\*\*Use with\*\*:\s*(.+)')
+SKILL_NAME_RE = re.compile(r'([a-z][a-z0-9-]+)')
+REFERENCE_CODE_RE = re.compile(r'`references/([^`]+)`')
+REFERENCE_PATH_RE = re.compile(r'references/([a-zA-Z0-9_-]+\.md)')
+MCP_SERVER_RE = re.compile(r'mcp__([a-zA-Z0-9_-]+)__')
+
+
+def use_with_refs(content: str) -> List[str]:
+    """Skill names listed on the first "**Use with**:" line of a SKILL.md."""
+    match = USE_WITH_RE.search(content)
+    if not match:
+        return []
+    return SKILL_NAME_RE.findall(match.group(1))
+
+
+def reference_links(content: str) -> List[str]:
+    """references/ files mentioned in a SKILL.md, trailing punctuation stripped."""
+    mentions = REFERENCE_CODE_RE.findall(content) + REFERENCE_PATH_RE.findall(content)
+    return sorted({m.rstrip('`\'".,;:)') for m in mentions})
+
+
+def mcp_servers(frontmatter: Dict[str, Any]) -> List[str]:
+    """MCP server names referenced by allowed-tools (mcp__<server>__<tool>)."""
+    tools = frontmatter.get('allowed-tools')
+    if not tools:
+        return []
+    if isinstance(tools, list):
+        tools = ','.join(str(t) for t in tools)
+    return list(dict.fromkeys(MCP_SERVER_RE.findall(str(tools))))
+
+
+def skill_frontmatter(entry: CorpusEntry) -> Dict[str, Any]:
+    """Parsed frontmatter, or its top-level lines read one by one if the YAML is invalid."""
+    if entry.frontmatter_error:
+        return scan_frontmatter(entry.content)
+    return entry.frontmatter
+
+
+@dataclass
+class SkillNode:
+    """What one SKILL.md contributes to the graph."""
+    content_hash: str
+    uses: List[str] = field(default_factory=list)
+    reference_links: List[str] = field(default_factory=list)
+    mcp_servers: List[str] = field(default_factory=list)
+
+
+class DependencyGraph:
+    """Skill dependency graph with a reverse-edge index, persisted between runs."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.nodes: Dict[str, SkillNode] = {}
+        self.used_by: Dict[str, List[str]] = {}
+        self.dirty = False
+        self.stats = {"unchanged": 0, "updated": 0, "removed": 0}
+
+    @classmethod
+    def load(cls, base_dir: Path) -> "DependencyGraph":
+        """Load the artifact for base_dir; a missing or outdated file gives an empty graph."""
+        graph = cls(base_dir / CACHE_DIR_NAME / GRAPH_FILE_NAME)
+        try:
+            data = json.loads(graph.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return graph
+        if data.get("format_version") != GRAPH_FORMAT_VERSION:
+            return graph
+
+        graph.nodes = {name: SkillNode(**node) for name, node in data.get("skills", {}).items()}
+        graph.used_by = data.get("used_by", {})
+        return graph
+
+    def refresh(self, skills_dir: Path, cache: Optional[CorpusCache] = None) -> "DependencyGraph":
+        """Bring the graph up to date with skills_dir, re-extracting changed skills only."""
+        present = set()
+        if skills_dir.exists():
+            for skill_dir in skills_dir.iterdir():
+                skill_md = skill_dir / 'SKILL.md'
+                if not (skill_dir.is_dir() and skill_md.exists()):
+                    continue
+                present.add(skill_dir.name)
+                self._refresh_skill(skill_dir.name, skill_md, cache)
+
+        for name in set(self.nodes) - present:
+            del self.nodes[name]
+            self.stats["removed"] += 1
+            self.dirty = True
+
+        if self.dirty:
+            self._rebuild_reverse_index()
+        return self
+
+    def _refresh_skill(self, name: str, skill_md: Path, cache: Optional[CorpusCache]) -> None:
+        if cache is not None:
+            entry = cache.get(skill_md)
+            content_hash = entry.content_hash
+        else:
+            entry = None
+            raw = skill_md.read_bytes()
+            content_hash = hashlib.md5(raw).hexdigest()
+
+        node = self.nodes.get(name)
+        if node is not None and node.content_hash == content_hash:
+            self.stats["unchanged"] += 1
+            return
+
+        if entry is None:
+            entry = parse_entry(skill_md, raw)
+
+        self.nodes[name] = SkillNode(
+            content_hash=content_hash,
+            uses=use_with_refs(entry.content),
+            reference_links=reference_links(entry.content),
+            mcp_servers=mcp_servers(skill_frontmatter(entry)),
+        )
+        self.stats["updated"] += 1
+        self.dirty = True
+
+    def _rebuild_reverse_index(self) -> None:
+        used_by: Dict[str, List[str]] = defaultdict(list)
+        for name in sorted(self.nodes):
+            for ref in dict.fromkeys(self.nodes[name].uses):
+                used_by[ref].append(name)
+        self.used_by = dict(used_by)
+
+    def save(self) -> None:
+        """Write the artifact if anything changed (atomically)."""
+        if not self.dirty:
+            return
+        data = {
+            "format_version": GRAPH_FORMAT_VERSION,
+            "skills": {name: asdict(self.nodes[name]) for name in sorted(self.nodes)},
+            "used_by": self.used_by,
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(data, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+    def references(self, name: str) -> List[str]:
+        """Forward edges of a skill that point at existing skills."""
+        node = self.nodes.get(name)
+        if node is None:
+            return []
+        return [ref for ref in dict.fromkeys(node.uses) if ref in self.nodes]
+
+    def _walk(self, start: str, edges) -> Dict[str, int]:
+        depths: Dict[str, int] = {}
+        queue = deque([(start, 0)])
+        while queue:
+            name, depth = queue.popleft()
+            for nxt in edges(name):
+                if nxt != start and nxt not in depths:
+                    depths[nxt] = depth + 1
+                    queue.append((nxt, depth + 1))
+        return depths
+
+    def dependents(self, name: str) -> Dict[str, int]:
+        """Skills that use name directly (depth 1) or transitively. Works for missing names too."""
+        return self._walk(name, lambda n: self.used_by.get(n, ()))
+
+    def closure(self, name: str) -> Dict[str, int]:
+        """Existing skills name uses directly (depth 1) or transitively."""
+        return self._walk(name, self.references)
+
+
+def open_graph(base_dir: Path, cache: Optional[CorpusCache] = None, persist: bool = True) -> DependencyGraph:
+    """Load, refresh and persist the dependency graph for base_dir.
+
+    With persist=False the graph is built from scratch in memory and the
+    artifact is neither read nor written.
+    """
+    if not persist:
+        return DependencyGraph(base_dir / CACHE_DIR_NAME / GRAPH_FILE_NAME).refresh(
+            base_dir / '.claude' / 'skills', cache)
+    graph = DependencyGraph.load(base_dir).refresh(base_dir / '.claude' / 'skills', cache)
+    try:
+        graph.save()
+    except OSError:
+        pass  # Read-only checkout: the in-memory graph is still current
+    return graph
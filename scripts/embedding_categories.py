@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Embedding-Based Skill Categories
+
+An alternative to measure-ecosystem.py's keyword categoriser, which tags most
+skills as design/ml-ai because short keywords like 'ui' and 'ai' match inside
+ordinary words. Here each category is the centroid of a few labelled prototype
+descriptions, and every skill gets the category whose centroid is closest to
+its summary embedding (the "<skill>-summary" chunks build_embeddings.py stores
+in the claude_ecosystem ChromaDB collection). All skills are classified in one
+matrix product.
+
+The embedding model is only needed to embed the prototypes. Their centroids
+are cached in .cache/category-centroids.json, keyed by model and prototype
+text, so once the cache exists a run reads stored vectors and never loads it.
+
+Usage:
+    from embedding_categories import categorize_skills
+
+    categorize_skills(base_dir)   # {skill directory: [category]}
+
+    python scripts/embedding_categories.py
+    python scripts/embedding_categories.py --json
+    python scripts/measure-ecosystem.py --categorizer embeddings
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from corpus_cache import CACHE_DIR_NAME
+
+# Constants (must match build_embeddings.py)
+EMBEDDING_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+CHROMA_COLLECTION_NAME = "claude_ecosystem"
+DEFAULT_CHROMA_PATH = ".chroma_db"
+
+CENTROIDS_FILE = "category-centroids.json"
+
+# Skills less similar than this to every centroid are left uncategorized
+MIN_SIMILARITY = 0.2
+
+# Labelled prototypes per category (same category names as measure-ecosystem.py)
+CATEGORY_PROTOTYPES: Dict[str, List[str]] = {
+    'security': [
+        "Security auditing, vulnerability scanning and OWASP threat review",
+        "Authentication hardening, secrets handling and penetration testing",
+        "Compliance controls, access policies and CVE remediation",
+    ],
+    'testing': [
+        "Writing unit, integration and end-to-end tests",
+        "Test-driven development, coverage and flaky test diagnosis",
+        "Browser test automation with Playwright, Jest or pytest",
+    ],
+    'infrastructure': [
+        "Deploying services with Docker, Kubernetes and CI/CD pipelines",
+        "Infrastructure as code, cloud provisioning and DevOps automation",
+        "Site reliability, monitoring, incident response and scaling",
+    ],
+    'design': [
+        "Visual design, typography, color palettes and layout",
+        "User experience research, interaction design and usability critique",
+        "Design systems, brand identity and illustration style",
+    ],
+    'ml-ai': [
+        "Training and evaluating machine learning models",
+        "Building LLM applications, prompt engineering and AI agents",
+        "Embeddings, retrieval-augmented generation and computer vision models",
+    ],
+    'career': [
+        "Resume and CV writing, portfolio building and job applications",
+        "Career coaching, interview preparation and professional growth",
+        "Networking, personal branding and job search strategy",
+    ],
+    'audio-video': [
+        "Audio engineering, sound design and music production",
+        "Video editing, motion graphics and media processing",
+        "Voice synthesis, speech processing and podcast production",
+    ],
+    'documentation': [
+        "Technical writing, READMEs and developer documentation",
+        "API reference docs, tutorials and knowledge base articles",
+        "Diagrams, specifications and architecture decision records",
+    ],
+    'backend': [
+        "Designing REST and GraphQL APIs and backend services",
+        "Database schema design, SQL query optimization and migrations",
+        "Server-side architecture, queues, background jobs and caching",
+    ],
+    'frontend': [
+        "Building React and Vue user interfaces and components",
+        "Frontend performance, browser rendering and responsive CSS",
+        "Web app state management, routing and accessibility",
+    ],
+}
+
+
+def _normalize(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return matrix / np.where(norms == 0, 1, norms)
+
+
+def prototypes_fingerprint() -> str:
+    """Hash of the model and prototype text the cached centroids were built from."""
+    payload = json.dumps({'model': EMBEDDING_MODEL, 'prototypes': CATEGORY_PROTOTYPES}, sort_keys=True)
+    return hashlib.md5(payload.encode('utf-8')).hexdigest()
+
+
+def load_centroids(base_dir: Path) -> Tuple[List[str], np.ndarray]:
+    """Category names and unit-length centroids, embedding the prototypes only on a cache miss."""
+    path = base_dir / CACHE_DIR_NAME / CENTROIDS_FILE
+    fingerprint = prototypes_fingerprint()
+    try:
+        data = json.loads(path.read_text(encoding='utf-8'))
+        if data.get('fingerprint') == fingerprint:
+            return data['categories'], np.asarray(data['centroids'], dtype=np.float32)
+    except (OSError, ValueError, KeyError):
+        pass
+
+    # Only reached when the prototypes or the model changed
+    from sentence_transformers import SentenceTransformer
+    model = SentenceTransformer(EMBEDDING_MODEL)
+
+    categories = list(CATEGORY_PROTOTYPES)
+    texts = [text for category in categories for text in CATEGORY_PROTOTYPES[category]]
+    vectors = _normalize(model.encode(texts, convert_to_numpy=True).astype(np.float32))
+
+    centroids = []
+    start = 0
+    for category in categories:
+        count = len(CATEGORY_PROTOTYPES[category])
+        centroids.append(vectors[start:start + count].mean(axis=0))
+        start += count
+    centroids = _normalize(np.stack(centroids))
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps({
+            'fingerprint': fingerprint,
+            'model': EMBEDDING_MODEL,
+            'categories': categories,
+            'centroids': centroids.round(6).tolist(),
+        }), encoding='utf-8')
+        os.replace(tmp_path, path)
+    except OSError:
+        pass  # Read-only checkout: recomputed next time
+    return categories, centroids
+
+
+def skill_key(metadata: Dict[str, str]) -> str:
+    """Skill directory name of a chunk (its frontmatter name may differ)."""
+    source_file = metadata.get('source_file')
+    return Path(source_file).parent.name if source_file else metadata['name']
+
+
+def load_summary_vectors(chroma_full_path: Path) -> Tuple[List[str], np.ndarray]:
+    """Skill directory names and summary-chunk embeddings stored by build_embeddings.py."""
+    if not chroma_full_path.exists():
+        raise FileNotFoundError(
+            f"ChromaDB not found at {chroma_full_path}. "
+            "Run 'python scripts/build_embeddings.py' first."
+        )
+
+    import chromadb
+    from chromadb.config import Settings
+
+    client = chromadb.PersistentClient(
+        path=str(chroma_full_path),
+        settings=Settings(anonymized_telemetry=False)
+    )
+    try:
+        collection = client.get_collection(CHROMA_COLLECTION_NAME)
+    except Exception:
+        raise ValueError(
+            f"Collection '{CHROMA_COLLECTION_NAME}' not found. "
+            "Run 'python scripts/build_embeddings.py' first."
+        )
+
+    records = collection.get(
+        where={"$and": [{"type": "skill"}, {"chunk_type": "summary"}]},
+        include=["embeddings", "metadatas"]
+    )
+    names = [skill_key(meta) for meta in records['metadatas']]
+    if not names:
+        return [], np.zeros((0, 0), dtype=np.float32)
+    return names, np.asarray(records['embeddings'], dtype=np.float32)
+
+
+def nearest_centroid(vectors: np.ndarray, centroids: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Index and cosine similarity of the closest centroid for every row of vectors."""
+    similarities = _normalize(vectors) @ centroids.T
+    best = similarities.argmax(axis=1)
+    return best, similarities[np.arange(len(best)), best]
+
+
+def categorize_skills(base_dir: Path, chroma_path: str = DEFAULT_CHROMA_PATH,
+                      min_similarity: float = MIN_SIMILARITY) -> Dict[str, List[str]]:
+    """Nearest-centroid category for every skill with a stored summary embedding.
+
+    Keyed by skill directory name, like measure-ecosystem's SkillMetrics.name.
+    Skills that have not been embedded yet are absent from the result.
+    """
+    names, vectors = load_summary_vectors(base_dir / chroma_path)
+    if not names:
+        return {}
+    categories, centroids = load_centroids(base_dir)
+    best, similarity = nearest_centroid(vectors, centroids)
+    return {
+        name: [categories[index]] if score >= min_similarity else ['uncategorized']
+        for name, index, score in zip(names, best.tolist(), similarity.tolist())
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Categorise skills by their summary embeddings')
+    parser.add_argument('--dir', default='.', help='Base directory')
+    parser.add_argument('--chroma-path', default=DEFAULT_CHROMA_PATH,
+                        help='Path to ChromaDB database (relative to --dir)')
+    parser.add_argument('--min-similarity', type=float, default=MIN_SIMILARITY,
+                        help='Below this cosine similarity a skill is left uncategorized')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    base_dir = Path(args.dir).resolve()
+    start = time.perf_counter()
+    try:
+        assignments = categorize_skills(base_dir, args.chroma_path, args.min_similarity)
+    except (FileNotFoundError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(dict(sorted(assignments.items())), indent=2))
+        return 0
+
+    counts: Dict[str, int] = {}
+    for categories in assignments.values():
+        for category in categories:
+            counts[category] = counts.get(category, 0) + 1
+
+    print(f"\n{'='*60}")
+    print("EMBEDDING SKILL CATEGORIES")
+    print(f"{'='*60}\n")
+    print(f"Categorised {len(assignments)} skills in {elapsed * 1000:.1f} ms\n")
+    for category, count in sorted(counts.items(), key=lambda x: -x[1]):
+        print(f"  {category}: {count}")
+    print(f"\n{'='*60}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
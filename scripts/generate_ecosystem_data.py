@@ -16,12 +16,13 @@ Output goes to .claude/data/ecosystem-state.json by default.
 """
 
 import json
-import yaml
 import argparse
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 
+from corpus_cache import CorpusCache, open_cache, read_markdown
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .claude directory."""
@@ -33,24 +34,7 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
-def parse_frontmatter(content: str) -> tuple[Dict[str, Any], str]:
-    """Parse YAML frontmatter from markdown content."""
-    if not content.startswith("---"):
-        return {}, content
-
-    try:
-        parts = content.split("---", 2)
-        if len(parts) >= 3:
-            frontmatter = yaml.safe_load(parts[1]) or {}
-            body = parts[2].strip()
-            return frontmatter, body
-    except yaml.YAMLError:
-        pass
-
-    return {}, content
-
-
-def load_agents(agents_dir: Path) -> List[Dict[str, Any]]:
+def load_agents(agents_dir: Path, cache: Optional[CorpusCache] = None) -> List[Dict[str, Any]]:
     """Load all agent definitions from both flat and directory formats."""
     agents = []
 
@@ -68,8 +52,7 @@ def load_agents(agents_dir: Path) -> List[Dict[str, Any]]:
         if dir_version.exists():
             continue
 
-        content = md_file.read_text(encoding="utf-8")
-        frontmatter, body = parse_frontmatter(content)
+        frontmatter = read_markdown(md_file, cache).frontmatter
 
         agents.append({
             "name": frontmatter.get("name", md_file.stem),
@@ -89,8 +72,8 @@ def load_agents(agents_dir: Path) -> List[Dict[str, Any]]:
         if not agent_md.exists():
             continue
 
-        content = agent_md.read_text(encoding="utf-8")
-        frontmatter, body = parse_frontmatter(content)
+        entry = read_markdown(agent_md, cache)
+        frontmatter, body = entry.frontmatter, entry.body
 
         agents.append({
             "name": frontmatter.get("name", subdir.name),
@@ -107,7 +90,7 @@ def load_agents(agents_dir: Path) -> List[Dict[str, Any]]:
     return sorted(agents, key=lambda a: a["name"])
 
 
-def load_skills(skills_dir: Path) -> List[Dict[str, Any]]:
+def load_skills(skills_dir: Path, cache: Optional[CorpusCache] = None) -> List[Dict[str, Any]]:
     """Load all skill definitions."""
     skills = []
 
@@ -126,8 +109,7 @@ def load_skills(skills_dir: Path) -> List[Dict[str, Any]]:
         if not skill_md.exists():
             continue
 
-        content = skill_md.read_text(encoding="utf-8")
-        frontmatter, body = parse_frontmatter(content)
+        frontmatter = read_markdown(skill_md, cache).frontmatter
 
         skills.append({
             "name": frontmatter.get("name", subdir.name),
@@ -220,14 +202,14 @@ def build_capability_graph(agents: List[Dict], skills: List[Dict]) -> Dict[str,
     return {"nodes": nodes, "edges": edges}
 
 
-def generate_ecosystem_state(project_root: Path) -> Dict[str, Any]:
+def generate_ecosystem_state(project_root: Path, cache: Optional[CorpusCache] = None) -> Dict[str, Any]:
     """Generate the complete ecosystem state."""
     claude_dir = project_root / ".claude"
     agents_dir = claude_dir / "agents"
     skills_dir = claude_dir / "skills"
 
-    agents = load_agents(agents_dir)
-    skills = load_skills(skills_dir)
+    agents = load_agents(agents_dir, cache)
+    skills = load_skills(skills_dir, cache)
 
     # Calculate statistics
     agents_by_format = {
@@ -279,6 +261,11 @@ def main():
         action="store_true",
         help="Compact JSON output"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Parse files directly instead of using the shared corpus cache"
+    )
     args = parser.parse_args()
 
     project_root = find_project_root()
@@ -292,7 +279,12 @@ def main():
         output_path = data_dir / "ecosystem-state.json"
 
     # Generate state
-    state = generate_ecosystem_state(project_root)
+    cache = open_cache(project_root, enabled=not args.no_cache)
+    try:
+        state = generate_ecosystem_state(project_root, cache)
+    finally:
+        if cache is not None:
+            cache.close()
 
     # Write output
     indent = None if args.compact else 2
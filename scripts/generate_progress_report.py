@@ -3,6 +3,16 @@
 Progress Report Generator - Part of The Archivist
 
 Generates weekly or monthly progress reports by analyzing snapshots.
+Snapshot summaries are read from the metrics history store (see
+metrics_store.py), which is synced with the snapshots directory first, so a
+report costs one indexed query rather than parsing every snapshot.
+
+New skills and agents and updated skills are the keyed diff (state_diff.py)
+between the states at either end of the period, rebuilt with
+SnapshotReader, so they are the net change rather than a sum of deltas.
+
+With NumPy installed, reports also get a Rolling Trends section (7/30-day
+growth, moving averages, per-category velocity) from trend_engine.py.
 
 Usage:
     python scripts/generate_progress_report.py --weekly
@@ -10,12 +20,23 @@ Usage:
     python scripts/generate_progress_report.py --weekly --output path/to/report.md
 """
 
-import json
 import argparse
+import sqlite3
 from pathlib import Path
 from datetime import datetime, timezone, timedelta
 from typing import Dict, List, Any, Optional
 
+from generate_snapshot import SnapshotReader, load_index, map_files, read_snapshot, snapshot_summary, snapshots_since
+from metrics_store import MetricsStore
+from state_diff import diff_states
+
+try:
+    from trend_engine import WINDOWS, compute_trends
+except ImportError:  # NumPy not installed: reports skip rolling trends
+    WINDOWS, compute_trends = {}, None
+
+METRIC_LABELS = {"total_skills": "Skills", "total_agents": "Agents", "unique_tools": "Tools"}
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .claude directory."""
@@ -27,37 +48,76 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
-def load_snapshots(snapshots_dir: Path, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
-    """Load all snapshots since a given date."""
-    if not snapshots_dir.exists():
-        return []
-
-    snapshots = []
-    for json_file in sorted(snapshots_dir.glob("*.json")):
-        try:
-            data = json.loads(json_file.read_text(encoding="utf-8"))
-
-            # Parse timestamp
-            ts_str = data.get("timestamp", "")
-            if ts_str:
-                # Handle both formats: "2024-12-07 18:00 UTC" and ISO format
-                try:
-                    ts = datetime.strptime(ts_str, "%Y-%m-%d %H:%M UTC")
-                except ValueError:
-                    ts = datetime.fromisoformat(ts_str.replace("Z", "+00:00"))
+def _read_snapshot(json_file: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = read_snapshot(json_file)
+    except (ValueError, OSError):
+        return None
+    if "patch" in data:
+        data = {
+            "timestamp": data.get("timestamp"),
+            "state": {"summary": snapshot_summary(data)},
+            "delta": data.get("delta", {}),
+        }
+    return {"file": json_file.name, "data": data}
+
+
+def load_snapshots(snapshots_dir: Path, since: Optional[datetime] = None,
+                   workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Load all snapshots since a given date.
+
+    The snapshot index picks the files in range, so older snapshots are never
+    opened; the rest are read in parallel. Delta-encoded snapshots are not
+    rebuilt: reports only need their summary and delta, which come back as
+    {"state": {"summary": ...}}.
+    """
+    files = [snapshots_dir / entry["file"] for entry in snapshots_since(snapshots_dir, since)]
+    return [snapshot for snapshot in map_files(_read_snapshot, files, workers) if snapshot is not None]
+
+
+def load_snapshot_history(project_root: Path, snapshots_dir: Path,
+                          since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Snapshot summaries and deltas since a date, from the metrics history store.
+
+    Returns the same shape as load_snapshots() with only the fields reports
+    use (timestamp, state.summary, delta). Falls back to load_snapshots() if
+    the store can't be opened.
+    """
+    try:
+        with MetricsStore.open(project_root) as store:
+            store.sync_snapshots(snapshots_dir)
+            series = store.snapshot_series(since)
+    except (OSError, sqlite3.Error):
+        return load_snapshots(snapshots_dir, since)
+
+    return [
+        {
+            "file": file,
+            "data": {"timestamp": timestamp, "state": {"summary": summary}, "delta": delta}
+        }
+        for file, timestamp, summary, delta in zip(
+            series["file"], series["timestamp"], series["summary"], series["delta"])
+    ]
 
-                # Filter by date if specified
-                if since and ts < since:
-                    continue
 
-            snapshots.append({
-                "file": json_file.name,
-                "data": data
-            })
-        except (json.JSONDecodeError, OSError, ValueError):
-            continue
+def load_rolling_trends(project_root: Path, snapshots_dir: Path,
+                        since: datetime) -> Optional[Dict[str, Any]]:
+    """Rolling trends as of the latest snapshot, or None without NumPy, the store or 2 snapshots.
 
-    return snapshots
+    History starts one longest window before since, so the first days of the
+    report period still have full trailing windows.
+    """
+    if compute_trends is None:
+        return None
+    history_start = since - timedelta(days=max(WINDOWS.values()))
+    try:
+        with MetricsStore.open(project_root) as store:
+            store.sync_snapshots(snapshots_dir)
+            rolling = compute_trends(store.snapshot_totals(history_start),
+                                     store.category_series(history_start))
+    except (OSError, sqlite3.Error):
+        return None
+    return rolling if rolling["points"] >= 2 else None
 
 
 def calculate_trends(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -91,8 +151,45 @@ def calculate_trends(snapshots: List[Dict[str, Any]]) -> Dict[str, Any]:
     }
 
 
-def collect_changes(snapshots: List[Dict[str, Any]]) -> Dict[str, List[str]]:
-    """Collect all changes across snapshots."""
+def period_diff(snapshots: List[Dict[str, Any]], snapshots_dir: Path) -> Optional[Dict[str, Any]]:
+    """diff_states() from the state before the first snapshot to the last one's state.
+
+    None if those states can't be rebuilt (e.g. snapshot files pruned).
+    """
+    period = {snapshot["file"] for snapshot in snapshots}
+    files = [entry["file"] for entry in load_index(snapshots_dir)]
+    # Index order, not the order the period was loaded in, decides first and last
+    positions = [i for i, name in enumerate(files) if name in period]
+    if not positions:
+        return None
+    first, last = positions[0], positions[-1]
+    try:
+        reader = SnapshotReader(snapshots_dir)
+        # Rebuilding the baseline first lets the last state reuse it
+        before = reader.state(files[first - 1]) if first > 0 else {}
+        after = reader.state(files[last])
+    except (KeyError, OSError, ValueError):
+        return None
+    return diff_states(before, after)
+
+
+def collect_changes(snapshots: List[Dict[str, Any]],
+                    snapshots_dir: Optional[Path] = None) -> Dict[str, List[str]]:
+    """Collect all changes across snapshots.
+
+    With snapshots_dir, this is the net change over the period (one keyed
+    diff of the states at either end), so a skill added and removed again
+    doesn't count. Otherwise, or if the states can't be rebuilt, the
+    per-snapshot deltas are concatenated.
+    """
+    diffs = period_diff(snapshots, snapshots_dir) if snapshots_dir is not None else None
+    if diffs is not None:
+        return {
+            "new_skills": diffs["skills"].added,
+            "new_agents": diffs["agents"].added,
+            "changed_skills": list(diffs["skills"].changed),
+        }
+
     all_new_skills = []
     all_new_agents = []
     all_changed_skills = []
@@ -107,11 +204,68 @@ def collect_changes(snapshots: List[Dict[str, Any]]) -> Dict[str, List[str]]:
     return {
         "new_skills": all_new_skills,
         "new_agents": all_new_agents,
-        "changed_skills": list(set(all_changed_skills))  # Deduplicate
+        "changed_skills": list(dict.fromkeys(all_changed_skills))  # Deduplicate, keep order
     }
 
 
-def generate_weekly_report(snapshots: List[Dict[str, Any]]) -> str:
+def _format_number(value: Optional[float], signed: bool = False, suffix: str = "") -> str:
+    if value is None:
+        return "N/A"
+    return f"{value:+g}{suffix}" if signed else f"{value:g}{suffix}"
+
+
+def format_rolling_trends(rolling: Optional[Dict[str, Any]]) -> List[str]:
+    """Rolling Trends section: per-window change, growth and moving average, then category velocity."""
+    if not rolling:
+        return []
+
+    windows = {name: f"{days:g}-day" for name, days in WINDOWS.items()}
+    header = ["Metric", "Now"]
+    for label in windows.values():
+        header.extend([f"{label} Change", f"{label} Growth", f"{label} Avg"])
+    lines = [
+        "## Rolling Trends",
+        "",
+        "| " + " | ".join(header) + " |",
+        "|" + "|".join("-" * (len(h) + 2) for h in header) + "|",
+    ]
+    for name, entry in rolling["metrics"].items():
+        cells = [METRIC_LABELS.get(name, name), _format_number(entry["latest"])]
+        for window in windows:
+            stats = entry[window]
+            cells.extend([
+                _format_number(stats["delta"], signed=True),
+                _format_number(stats["growth_pct"], signed=True, suffix="%"),
+                _format_number(stats["average"]),
+            ])
+        lines.append("| " + " | ".join(cells) + " |")
+    lines.append("")
+
+    longest_window = list(windows)[-1]
+    categories = sorted(
+        rolling["categories"].items(),
+        key=lambda item: (-(item[1][longest_window]["per_week"] or 0), item[0])
+    )[:10]
+    if categories:
+        header = ["Category", "Skills"] + [f"Per Week ({label})" for label in windows.values()]
+        lines.extend([
+            "### Category Velocity",
+            "",
+            "| " + " | ".join(header) + " |",
+            "|" + "|".join("-" * (len(h) + 2) for h in header) + "|",
+        ])
+        for name, entry in categories:
+            cells = [name, _format_number(entry["latest"])]
+            cells.extend(_format_number(entry[window]["per_week"], signed=True) for window in windows)
+            lines.append("| " + " | ".join(cells) + " |")
+        lines.append("")
+
+    return lines
+
+
+def generate_weekly_report(snapshots: List[Dict[str, Any]],
+                           rolling: Optional[Dict[str, Any]] = None,
+                           changes: Optional[Dict[str, List[str]]] = None) -> str:
     """Generate weekly progress report."""
     if not snapshots:
         return "# Weekly Progress Report\n\nNo snapshots available for this week.\n"
@@ -121,7 +275,8 @@ def generate_weekly_report(snapshots: List[Dict[str, Any]]) -> str:
     start_date = end_date - timedelta(days=7)
 
     trends = calculate_trends(snapshots)
-    changes = collect_changes(snapshots)
+    if changes is None:
+        changes = collect_changes(snapshots)
 
     lines = [
         f"# Weekly Progress Report: Week of {start_date.strftime('%Y-%m-%d')}",
@@ -158,6 +313,8 @@ def generate_weekly_report(snapshots: List[Dict[str, Any]]) -> str:
             ""
         ])
 
+    lines.extend(format_rolling_trends(rolling))
+
     # Highlights
     lines.extend(["## Highlights", ""])
 
@@ -208,7 +365,9 @@ def generate_weekly_report(snapshots: List[Dict[str, Any]]) -> str:
     return "\n".join(lines)
 
 
-def generate_monthly_report(snapshots: List[Dict[str, Any]]) -> str:
+def generate_monthly_report(snapshots: List[Dict[str, Any]],
+                            rolling: Optional[Dict[str, Any]] = None,
+                            changes: Optional[Dict[str, List[str]]] = None) -> str:
     """Generate monthly progress report."""
     if not snapshots:
         return "# Monthly Progress Report\n\nNo snapshots available for this month.\n"
@@ -218,7 +377,8 @@ def generate_monthly_report(snapshots: List[Dict[str, Any]]) -> str:
     start_date = end_date - timedelta(days=30)
 
     trends = calculate_trends(snapshots)
-    changes = collect_changes(snapshots)
+    if changes is None:
+        changes = collect_changes(snapshots)
 
     lines = [
         f"# Monthly Progress Report: {start_date.strftime('%B %Y')}",
@@ -265,6 +425,8 @@ def generate_monthly_report(snapshots: List[Dict[str, Any]]) -> str:
 
         lines.append("")
 
+    lines.extend(format_rolling_trends(rolling))
+
     # Major additions
     lines.extend(["## Major Additions", ""])
 
@@ -347,13 +509,15 @@ def main():
         report_type = "monthly"
 
     # Load snapshots
-    snapshots = load_snapshots(snapshots_dir, since)
+    snapshots = load_snapshot_history(project_root, snapshots_dir, since)
+    rolling = load_rolling_trends(project_root, snapshots_dir, since)
+    changes = collect_changes(snapshots, snapshots_dir)
 
     # Generate report
     if args.weekly:
-        report = generate_weekly_report(snapshots)
+        report = generate_weekly_report(snapshots, rolling, changes)
     else:
-        report = generate_monthly_report(snapshots)
+        report = generate_monthly_report(snapshots, rolling, changes)
 
     # Determine output path
     if args.output:
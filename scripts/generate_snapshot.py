@@ -5,17 +5,74 @@ Ecosystem Snapshot Generator - Part of The Archivist
 Creates timestamped snapshots of ecosystem state with delta tracking.
 Compares against previous snapshot to identify changes.
 
+Each snapshot directory keeps index.jsonl, one line per snapshot (file,
+timestamp, summary counts), appended on write. "Latest" and "since date"
+lookups read the index and open only the snapshots they return; snapshots the
+index doesn't know yet (e.g. written by older versions) are indexed once.
+
+With --storage delta, only every KEYFRAME_INTERVAL-th snapshot embeds the
+full state (a keyframe). The others store the summary plus a patch against
+the previous snapshot (see state_diff.make_patch), and SnapshotReader
+rebuilds any of them from the nearest keyframe. Both kinds can share a
+directory. Pruning must keep whole keyframe groups: a delta whose base was
+deleted can't be rebuilt (the next snapshot written is then a keyframe).
+
+Snapshots are read on a thread pool and parsed with orjson when it is
+installed. Indexing an unindexed snapshot reads only its first few KB (the
+timestamp and summary counts come first) unless those fields aren't there.
+
 Usage:
     python scripts/generate_snapshot.py [--output PATH] [--label LABEL]
+    python scripts/generate_snapshot.py --label milestone --storage delta
+    python scripts/generate_snapshot.py --state-at "2026-10-01 12:00"
 
 Output goes to .claude/archive/snapshots/ by default.
 """
 
 import json
+import os
+import re
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Any, Optional, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson not installed
+    from json import loads as json_loads
+
+from metrics_store import parse_timestamp, snapshot_file_order
+from state_diff import apply_patch, diff_states, make_patch
+
+INDEX_FILE_NAME = "index.jsonl"
+
+# Delta storage writes a full-state keyframe every this many snapshots
+KEYFRAME_INTERVAL = 10
+
+# Snapshot files start with their timestamp and summary; this much covers them
+HEADER_BYTES = 4096
+
+HEADER_TIMESTAMP_RE = re.compile(rb'^\{\s*"timestamp":\s*"([^"]+)",\s*"(state|base)":')
+HEADER_COUNT_RES = {
+    name: re.compile(rb'"' + name.encode() + rb'":\s*(\d+)[,\s}]')
+    for name in ("total_skills", "total_agents", "unique_tools")
+}
+
+
+def read_snapshot(path: Path) -> Dict[str, Any]:
+    """Parse a snapshot JSON file (orjson if available)."""
+    return json_loads(path.read_bytes())
+
+
+def map_files(func: Callable[[Path], Any], paths: List[Path], workers: Optional[int] = None) -> Iterable[Any]:
+    """func over paths on a thread pool, results in order."""
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    if workers <= 1 or len(paths) <= 1:
+        return map(func, paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(func, paths))
 
 
 def find_project_root() -> Path:
@@ -38,20 +95,189 @@ def load_ecosystem_state(state_file: Path) -> Optional[Dict[str, Any]]:
         return None
 
 
-def find_previous_snapshot(snapshots_dir: Path) -> Optional[Dict[str, Any]]:
-    """Find the most recent snapshot file."""
-    if not snapshots_dir.exists():
+def snapshot_summary(snapshot: Dict[str, Any]) -> Dict[str, Any]:
+    """Summary counts of a keyframe or delta snapshot document."""
+    if "patch" in snapshot:
+        return snapshot.get("summary", {})
+    return snapshot.get("state", {}).get("summary", {})
+
+
+def index_entry(file_name: str, snapshot: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """Index line for a snapshot document; None if it has no usable timestamp."""
+    ts = parse_timestamp(snapshot.get("timestamp", ""))
+    if ts is None:
         return None
+    summary = snapshot_summary(snapshot)
+    return {
+        "file": file_name,
+        "timestamp": ts.isoformat(),
+        "keyframe": "patch" not in snapshot,
+        "total_skills": summary.get("total_skills"),
+        "total_agents": summary.get("total_agents"),
+        "unique_tools": summary.get("unique_tools"),
+    }
+
 
-    snapshot_files = sorted(snapshots_dir.glob("*.json"))
-    if not snapshot_files:
+def peek_index_entry(path: Path) -> Optional[Dict[str, Any]]:
+    """Index entry from the head of a snapshot file; None if the head doesn't have it all."""
+    with path.open("rb") as f:
+        head = f.read(HEADER_BYTES)
+    match = HEADER_TIMESTAMP_RE.match(head)
+    ts = parse_timestamp(match.group(1).decode("utf-8")) if match else None
+    if ts is None:
+        return None
+    entry: Dict[str, Any] = {
+        "file": path.name,
+        "timestamp": ts.isoformat(),
+        "keyframe": match.group(2) == b"state",
+    }
+    for name, pattern in HEADER_COUNT_RES.items():
+        count = pattern.search(head, match.end())
+        if count is None:
+            return None
+        entry[name] = int(count.group(1))
+    return entry
+
+
+def _index_file(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        return peek_index_entry(path) or index_entry(path.name, read_snapshot(path))
+    except (ValueError, OSError):
+        return None
+
+
+def load_index(snapshots_dir: Path, workers: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Index entries for every snapshot in snapshots_dir, oldest first.
+
+    Costs one directory listing plus the index read; only snapshots missing
+    from the index are opened (in parallel, header first) and then added to
+    it. Entries whose file is gone are dropped. Snapshots with the same
+    (minute) timestamp keep the order they were indexed in.
+    """
+    if not snapshots_dir.exists():
+        return []
+
+    index_path = snapshots_dir / INDEX_FILE_NAME
+    entries: Dict[str, Dict[str, Any]] = {}
+    try:
+        with index_path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    entries.pop(entry["file"], None)  # A re-indexed file moves to its latest line
+                    entries[entry["file"]] = entry
+                except (json.JSONDecodeError, KeyError, TypeError):
+                    continue  # Torn or foreign line
+    except OSError:
+        pass
+
+    present = {p.name for p in snapshots_dir.glob("*.json")}
+    dirty = bool(entries.keys() - present)
+    for name in entries.keys() - present:
+        del entries[name]
+
+    missing = sorted((snapshots_dir / name for name in present - entries.keys()), key=snapshot_file_order)
+    for entry in map_files(_index_file, missing, workers):
+        if entry is not None:
+            entries[entry["file"]] = entry
+            dirty = True
+
+    ordered = sorted(entries.values(), key=lambda e: e["timestamp"])
+    if dirty:
+        try:
+            tmp_path = index_path.with_suffix(".tmp")
+            tmp_path.write_text("".join(json.dumps(e) + "\n" for e in ordered), encoding="utf-8")
+            os.replace(tmp_path, index_path)
+        except OSError:
+            pass  # Read-only archive: rebuilt in memory next time
+    return ordered
+
+
+def append_index(snapshots_dir: Path, entry: Dict[str, Any]) -> None:
+    """Record a newly written snapshot in the index."""
+    with (snapshots_dir / INDEX_FILE_NAME).open("a", encoding="utf-8") as f:
+        f.write(json.dumps(entry) + "\n")
+
+
+def _utc_iso(when: datetime) -> str:
+    """when as a UTC ISO string comparable with index timestamps (naive means UTC)."""
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return when.astimezone(timezone.utc).isoformat()
+
+
+def snapshots_since(snapshots_dir: Path, since: Optional[datetime] = None) -> List[Dict[str, Any]]:
+    """Index entries at or after since (all if None), oldest first."""
+    entries = load_index(snapshots_dir)
+    if since is None:
+        return entries
+    cutoff = _utc_iso(since)
+    return [e for e in entries if e["timestamp"] >= cutoff]
+
+
+class SnapshotReader:
+    """Full states of keyframe and delta snapshots in one directory.
+
+    A delta snapshot is rebuilt by walking its base links back to a keyframe
+    (or to the last state this reader rebuilt) and applying the patches
+    forward, so reading a range oldest-first applies each patch once.
+    """
+
+    def __init__(self, snapshots_dir: Path):
+        self.snapshots_dir = snapshots_dir
+        self._last: Optional[Tuple[str, Dict[str, Any]]] = None
+
+    def document(self, file_name: str) -> Dict[str, Any]:
+        return read_snapshot(self.snapshots_dir / file_name)
+
+    def state(self, file_name: str, document: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Ecosystem state captured by a snapshot. Raises OSError/ValueError/KeyError if unreadable."""
+        chain = []
+        seen = set()
+        name, doc = file_name, document
+        while True:
+            if self._last is not None and self._last[0] == name:
+                state = self._last[1]
+                break
+            if doc is None:
+                doc = self.document(name)
+            if "patch" not in doc:
+                state = doc["state"]
+                break
+            seen.add(name)
+            chain.append(doc["patch"])
+            name, doc = doc["base"], None
+            if name in seen:
+                raise ValueError(f"Snapshot {file_name} has no reachable keyframe")
+
+        for patch in reversed(chain):
+            state = apply_patch(state, patch)
+        self._last = (file_name, state)
+        return state
+
+    def snapshot(self, file_name: str) -> Dict[str, Any]:
+        """Snapshot document with its full state, whichever way it was stored."""
+        doc = self.document(file_name)
+        return {"timestamp": doc.get("timestamp"), "state": self.state(file_name, doc), "delta": doc.get("delta", {})}
+
+    def state_at(self, when: datetime) -> Optional[Dict[str, Any]]:
+        """State as of the latest snapshot taken at or before when."""
+        entries = [e for e in load_index(self.snapshots_dir) if e["timestamp"] <= _utc_iso(when)]
+        if not entries:
+            return None
+        return self.state(entries[-1]["file"])
+
+
+def find_previous_snapshot(snapshots_dir: Path) -> Optional[Dict[str, Any]]:
+    """Find the most recent snapshot file (delta snapshots come back with their full state)."""
+    entries = load_index(snapshots_dir)
+    if not entries:
         return None
 
     # Load most recent
-    latest = snapshot_files[-1]
     try:
-        return json.loads(latest.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, OSError):
+        return SnapshotReader(snapshots_dir).snapshot(entries[-1]["file"])
+    except (json.JSONDecodeError, OSError, KeyError, ValueError):
         return None
 
 
@@ -66,43 +292,23 @@ def calculate_delta(current: Dict[str, Any], previous: Optional[Dict[str, Any]])
             "new_agents": [a["name"] for a in current["agents"]],
         }
 
-    # Calculate diffs
-    prev_skill_names = {s["name"] for s in previous["skills"]}
-    curr_skill_names = {s["name"] for s in current["skills"]}
-
-    prev_agent_names = {a["name"] for a in previous["agents"]}
-    curr_agent_names = {a["name"] for a in current["agents"]}
-
-    new_skills = sorted(curr_skill_names - prev_skill_names)
-    removed_skills = sorted(prev_skill_names - curr_skill_names)
-
-    new_agents = sorted(curr_agent_names - prev_agent_names)
-    removed_agents = sorted(prev_agent_names - curr_agent_names)
-
-    # Detect changed skills (by comparing description/tools)
-    changed_skills = []
-    for curr_skill in current["skills"]:
-        name = curr_skill["name"]
-        if name in prev_skill_names and name not in new_skills:
-            prev_skill = next((s for s in previous["skills"] if s["name"] == name), None)
-            if prev_skill and (
-                curr_skill.get("description") != prev_skill.get("description") or
-                curr_skill.get("tools") != prev_skill.get("tools")
-            ):
-                changed_skills.append(name)
+    # Keyed diff: linear in the number of skills, agents, tools and edges
+    diffs = diff_states(previous, current)
+    skills, agents = diffs["skills"], diffs["agents"]
 
     return {
         "is_initial": False,
-        "skills_added": len(new_skills),
-        "skills_removed": len(removed_skills),
-        "agents_added": len(new_agents),
-        "agents_removed": len(removed_agents),
-        "skills_changed": len(changed_skills),
-        "new_skills": new_skills,
-        "removed_skills": removed_skills,
-        "new_agents": new_agents,
-        "removed_agents": removed_agents,
-        "changed_skills": changed_skills,
+        "skills_added": len(skills.added),
+        "skills_removed": len(skills.removed),
+        "agents_added": len(agents.added),
+        "agents_removed": len(agents.removed),
+        "skills_changed": len(skills.changed),
+        "new_skills": skills.added,
+        "removed_skills": skills.removed,
+        "new_agents": agents.added,
+        "removed_agents": agents.removed,
+        "changed_skills": list(skills.changed),
+        "details": {kind: diff.to_dict() for kind, diff in diffs.items() if diff},
     }
 
 
@@ -170,8 +376,10 @@ def generate_snapshot_markdown(
         if delta["changed_skills"]:
             lines.append("### Updated Skills")
             lines.append("")
+            skill_fields = delta.get("details", {}).get("skills", {}).get("changed", {})
             for skill_name in delta["changed_skills"]:
-                lines.append(f"- **{skill_name}**: Description or tools updated")
+                fields = skill_fields.get(skill_name)
+                lines.append(f"- **{skill_name}**: {', '.join(fields) if fields else 'Description or tools'} updated")
             lines.append("")
 
         if delta["removed_skills"]:
@@ -222,6 +430,92 @@ def generate_snapshot_markdown(
     return "\n".join(lines)
 
 
+def create_snapshot(
+    state: Dict[str, Any],
+    snapshots_dir: Path,
+    label: Optional[str] = None,
+    storage: str = "full",
+    keyframe_interval: int = KEYFRAME_INTERVAL
+) -> Tuple[Path, Path, Dict[str, Any]]:
+    """Write JSON + markdown snapshots of state. Returns (json_path, md_path, delta).
+
+    storage="delta" stores a patch against the previous snapshot unless a
+    keyframe is due (none in the last keyframe_interval snapshots).
+    """
+    snapshots_dir.mkdir(parents=True, exist_ok=True)
+
+    # Find previous snapshot (deltas compare against the state it captured)
+    entries = load_index(snapshots_dir)
+    previous = None
+    if entries:
+        try:
+            previous = SnapshotReader(snapshots_dir).state(entries[-1]["file"])
+        except (json.JSONDecodeError, OSError, KeyError, ValueError):
+            previous = None
+
+    # Calculate delta
+    delta = calculate_delta(state, previous)
+
+    # Generate timestamp
+    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
+    file_timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H%M")
+
+    # Add label if provided
+    if label:
+        filename = f"{file_timestamp}-{label}"
+    else:
+        filename = file_timestamp
+
+    # Never overwrite an earlier snapshot from the same minute (a delta may be based on it)
+    stem, n = filename, 1
+    while (snapshots_dir / f"{filename}.json").exists() or (snapshots_dir / f"{filename}.md").exists():
+        n += 1
+        filename = f"{stem}-{n}"
+
+    # Create snapshot data
+    since_keyframe = 0
+    for entry in reversed(entries):
+        if entry.get("keyframe", True):
+            break
+        since_keyframe += 1
+
+    base = entries[-1]["file"] if entries else None
+    if (storage == "delta" and previous is not None and since_keyframe + 1 < keyframe_interval
+            and base != f"{filename}.json"):
+        snapshot_data = {
+            "timestamp": timestamp,
+            "base": base,
+            "summary": state["summary"],
+            "patch": make_patch(previous, state),
+            "delta": delta,
+        }
+    else:
+        snapshot_data = {
+            "timestamp": timestamp,
+            "state": state,
+            "delta": delta,
+        }
+
+    # Write JSON snapshot
+    json_path = snapshots_dir / f"{filename}.json"
+    tmp_path = json_path.with_suffix(".tmp")
+    tmp_path.write_text(
+        json.dumps(snapshot_data, indent=2, ensure_ascii=False),
+        encoding="utf-8"
+    )
+    os.replace(tmp_path, json_path)
+    entry = index_entry(json_path.name, snapshot_data)
+    if entry is not None:
+        append_index(snapshots_dir, entry)
+
+    # Write markdown snapshot
+    markdown = generate_snapshot_markdown(state, delta, timestamp)
+    md_path = snapshots_dir / f"{filename}.md"
+    md_path.write_text(markdown, encoding="utf-8")
+
+    return json_path, md_path, delta
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate ecosystem snapshot")
     parser.add_argument(
@@ -234,10 +528,44 @@ def main():
         type=str,
         help="Optional label for snapshot (e.g., 'initial', 'milestone')"
     )
+    parser.add_argument(
+        "--storage",
+        choices=["full", "delta"],
+        default="full",
+        help="full: every snapshot embeds the whole state; delta: keyframes plus patches"
+    )
+    parser.add_argument(
+        "--keyframe-interval",
+        type=int,
+        default=KEYFRAME_INTERVAL,
+        help=f"With --storage delta, write a full keyframe every N snapshots (default: {KEYFRAME_INTERVAL})"
+    )
+    parser.add_argument(
+        "--state-at",
+        metavar="TIMESTAMP",
+        help="Print the ecosystem state as of TIMESTAMP (e.g. '2026-10-01 12:00') as JSON and exit"
+    )
     args = parser.parse_args()
 
     project_root = find_project_root()
 
+    if args.state_at:
+        snapshots_dir = args.output or project_root / ".claude" / "archive" / "snapshots"
+        when = parse_timestamp(args.state_at)
+        if when is None:
+            print(f"❌ Unrecognised timestamp: {args.state_at}")
+            return 1
+        try:
+            past_state = SnapshotReader(snapshots_dir).state_at(when)
+        except (json.JSONDecodeError, OSError, KeyError, ValueError) as e:
+            print(f"❌ Failed to rebuild snapshot state: {e}")
+            return 1
+        if past_state is None:
+            print(f"❌ No snapshot at or before {args.state_at}")
+            return 1
+        print(json.dumps(past_state, indent=2, ensure_ascii=False))
+        return 0
+
     # Load current ecosystem state
     state_file = project_root / ".claude" / "data" / "ecosystem-state.json"
     if not state_file.exists():
@@ -255,43 +583,10 @@ def main():
     else:
         snapshots_dir = project_root / ".claude" / "archive" / "snapshots"
 
-    snapshots_dir.mkdir(parents=True, exist_ok=True)
-
-    # Find previous snapshot
-    previous = find_previous_snapshot(snapshots_dir)
-
-    # Calculate delta
-    delta = calculate_delta(state, previous)
-
-    # Generate timestamp
-    timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M UTC")
-    file_timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d-%H%M")
-
-    # Add label if provided
-    if args.label:
-        filename = f"{file_timestamp}-{args.label}"
-    else:
-        filename = file_timestamp
-
-    # Create snapshot data
-    snapshot_data = {
-        "timestamp": timestamp,
-        "state": state,
-        "delta": delta,
-    }
-
-    # Write JSON snapshot
-    json_path = snapshots_dir / f"{filename}.json"
-    json_path.write_text(
-        json.dumps(snapshot_data, indent=2, ensure_ascii=False),
-        encoding="utf-8"
+    json_path, md_path, delta = create_snapshot(
+        state, snapshots_dir, args.label, args.storage, args.keyframe_interval
     )
 
-    # Write markdown snapshot
-    markdown = generate_snapshot_markdown(state, delta, timestamp)
-    md_path = snapshots_dir / f"{filename}.md"
-    md_path.write_text(markdown, encoding="utf-8")
-
     # Print summary
     print(f"✅ Snapshot created: {md_path.name}")
     print(f"   📊 {state['summary']['total_agents']} agents, {state['summary']['total_skills']} skills")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Changed-Files Selection
+
+Works out which skills and agents a change touches, so validate_skill.py,
+validate_agent.py and check_dependencies.py can check only those with
+--changed-since <rev> instead of the whole tree.
+
+The changed set is `git diff --name-only --no-renames <rev>` (committed,
+staged and unstaged changes; a rename lists both its old and new path) plus
+untracked files. Skills are then widened by their reverse dependencies: any
+skill whose "**Use with**:" line names a changed skill is re-checked too,
+since a rename or deletion changes its result.
+Reverse dependencies come from the persisted dependency graph's index.
+
+Usage:
+    from git_changes import affected_skills, affected_agents
+
+    python scripts/git_changes.py --changed-since origin/main
+    python scripts/git_changes.py --changed-since HEAD~3 --json
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Iterable, List, Optional, Set
+
+from corpus_cache import CorpusCache
+from dependency_graph import DependencyGraph, open_graph
+
+SKILLS_PREFIX = ".claude/skills/"
+AGENTS_PREFIX = ".claude/agents/"
+
+
+def _git_lines(base_dir: Path, *args: str) -> List[str]:
+    try:
+        result = subprocess.run(["git", *args], cwd=base_dir, capture_output=True, text=True)
+    except OSError as e:
+        raise RuntimeError(f"git not available: {e}")
+    if result.returncode != 0:
+        raise RuntimeError(f"git {' '.join(args)} failed: {result.stderr.strip()}")
+    return [line for line in result.stdout.splitlines() if line]
+
+
+def changed_files(base_dir: Path, rev: str) -> List[str]:
+    """Paths (relative to base_dir) changed since rev, including untracked files."""
+    paths = _git_lines(base_dir, "diff", "--name-only", "--no-renames", "--relative", rev, "--")
+    paths += _git_lines(base_dir, "ls-files", "--others", "--exclude-standard")
+    return sorted(set(paths))
+
+
+def names_under(paths: Iterable[str], prefix: str) -> Set[str]:
+    """First path component below prefix, e.g. the skill name for .claude/skills/<name>/...
+
+    Flat files (e.g. .claude/agents/smith.md) yield their stem.
+    """
+    names = set()
+    for path in paths:
+        if not path.startswith(prefix):
+            continue
+        rest = path[len(prefix):]
+        head, sep, _ = rest.partition("/")
+        if sep:
+            names.add(head)
+        elif head.endswith(".md"):
+            names.add(head[:-3])
+    return names
+
+
+def reverse_dependencies(base_dir: Path, targets: Set[str],
+                         cache: Optional[CorpusCache] = None,
+                         graph: Optional[DependencyGraph] = None) -> Set[str]:
+    """Skills whose "Use with" line names any of targets."""
+    if not targets:
+        return set()
+    if graph is None:
+        graph = open_graph(base_dir, cache)
+    return {dependent for target in targets for dependent in graph.used_by.get(target, ())}
+
+
+def affected_skills(base_dir: Path, rev: str, cache: Optional[CorpusCache] = None,
+                    graph: Optional[DependencyGraph] = None) -> Set[str]:
+    """Changed skills plus the skills that reference them.
+
+    Deleted skills are included so callers can tell they changed; filter on
+    existence where only present skills can be checked.
+    """
+    changed = names_under(changed_files(base_dir, rev), SKILLS_PREFIX)
+    return changed | reverse_dependencies(base_dir, changed, cache, graph)
+
+
+def affected_agents(base_dir: Path, rev: str) -> Set[str]:
+    """Names of agents (flat name.md or name/AGENT.md) changed since rev."""
+    return names_under(changed_files(base_dir, rev), AGENTS_PREFIX)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='List skills and agents affected by a change')
+    parser.add_argument('--changed-since', required=True, metavar='REV',
+                        help='Git revision to diff against (e.g. origin/main, HEAD~1)')
+    parser.add_argument('--dir', default='.', help='Base directory')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    base_dir = Path(args.dir).resolve()
+    try:
+        skills = affected_skills(base_dir, args.changed_since)
+        agents = affected_agents(base_dir, args.changed_since)
+    except RuntimeError as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 2
+
+    if args.json:
+        print(json.dumps({'skills': sorted(skills), 'agents': sorted(agents)}, indent=2))
+    else:
+        print(f"Skills ({len(skills)}): {', '.join(sorted(skills)) or '-'}")
+        print(f"Agents ({len(agents)}): {', '.join(sorted(agents)) or '-'}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,20 +5,137 @@ Ecosystem Growth Metrics Collector
 Measures the health and growth of the Claude Skills ecosystem.
 Run periodically to track progress over time.
 
+Per-skill metrics are cached in .cache/skill-metrics.json, keyed by a
+signature of each skill directory (name, size and mtime of every file the
+metrics are computed from). Unchanged skills are taken from the cache without
+reading any file; changed skills read each file exactly once.
+
 Usage:
     python scripts/measure-ecosystem.py
     python scripts/measure-ecosystem.py --output metrics/YYYY-MM-DD.json
+    python scripts/measure-ecosystem.py --jsonl     # One JSON line per skill, then the totals
+    python scripts/measure-ecosystem.py --no-cache  # Recompute every skill from disk
+    python scripts/measure-ecosystem.py --benchmark # Category classifier vs per-category regexes
+    python scripts/measure-ecosystem.py --categorizer embeddings  # Nearest-centroid over stored embeddings
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
+import sqlite3
 import sys
-from dataclasses import dataclass, asdict
+import time
+from dataclasses import dataclass, asdict, replace
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from corpus_cache import CACHE_DIR_NAME, CorpusCache, open_cache
+from metrics_store import MetricsStore
+
+METRICS_CACHE_FILE = "skill-metrics.json"
+
+# Bump when SkillMetrics fields or the way they are computed change
+METRICS_CACHE_VERSION = 1
+
+# Keywords per category, matched case-insensitively anywhere in SKILL.md
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    'security': ['security', 'vulnerability', 'owasp', 'audit', 'cve'],
+    'testing': ['test', 'tdd', 'coverage', 'jest', 'pytest', 'playwright'],
+    'infrastructure': ['deploy', 'ci/cd', 'docker', 'kubernetes', 'devops'],
+    'design': ['design', 'ui', 'ux', 'css', 'component', 'visual'],
+    'ml-ai': ['machine learning', 'ml', 'ai', 'model', 'embedding', 'clip', 'neural'],
+    'career': ['career', 'resume', 'cv', 'portfolio', 'job'],
+    'audio-video': ['audio', 'video', 'sound', 'music', 'voice', 'media'],
+    'documentation': ['document', 'docs', 'readme', 'technical writing'],
+    'backend': ['api', 'backend', 'database', 'server', 'rest', 'graphql'],
+    'frontend': ['react', 'vue', 'frontend', 'browser', 'dom', 'css'],
+}
+
+
+class CategoryClassifier:
+    """Every category keyword in one compiled pattern, so a document is scanned once
+
+    The keywords are folded into a prefix trie and compiled as a single regex
+    (e.g. 'a(?:i|pi|udi(?:o|t))'), which the regex engine can match at each
+    offset with one character dispatch instead of trying every keyword.
+    Matching runs over the lowercased document. At each offset the pattern
+    takes the longest keyword; any shorter keyword matching there is a prefix
+    of it, so each keyword also carries the categories of its prefixes.
+    """
+
+    def __init__(self, keywords: Dict[str, List[str]],
+                 weights: Optional[Dict[str, float]] = None):
+        self.categories = list(keywords)
+        owners: Dict[str, List[str]] = {}
+        for category, words in keywords.items():
+            for word in words:
+                owners.setdefault(word.lower(), []).append(category)
+
+        weights = {w.lower(): v for w, v in (weights or {}).items()}
+        # keyword -> [(category, weight)] for it and every keyword that is a prefix of it
+        self._hits: Dict[str, List[Tuple[str, float]]] = {
+            word: [(category, weights.get(prefix, 1.0))
+                   for prefix in owners if word.startswith(prefix)
+                   for category in owners[prefix]]
+            for word in owners
+        }
+        self._categories = {word: frozenset(c for c, _ in hits) for word, hits in self._hits.items()}
+        self._pattern = re.compile(_trie_pattern(owners))
+
+    def _matches(self, content: str):
+        """Longest keyword at every offset where one starts"""
+        content = content.lower()
+        search = self._pattern.search
+        match = search(content)
+        while match:
+            yield match.group()
+            match = search(content, match.start() + 1)
+
+    def classify(self, content: str) -> List[str]:
+        """Categories with at least one keyword in content, in declaration order"""
+        found: Set[str] = set()
+        for word in self._matches(content):
+            found |= self._categories[word]
+            if len(found) == len(self.categories):
+                break
+        return [c for c in self.categories if c in found] or ['uncategorized']
+
+    def scores(self, content: str) -> Dict[str, float]:
+        """Weighted keyword hits per category (each keyword weighs 1.0 unless configured)"""
+        totals: Dict[str, float] = {}
+        for word in self._matches(content):
+            for category, weight in self._hits[word]:
+                totals[category] = totals.get(category, 0.0) + weight
+        return {c: totals[c] for c in self.categories if c in totals}
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """Regex source matching any of words, factored by common prefix (longest match wins)"""
+    trie: Dict[str, Dict] = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict[str, Dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ''
+        body = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+        # A keyword ends here: the longer branches are optional (and tried first)
+        if '' in node:
+            body = (body if len(branches) > 1 else '(?:' + body + ')') + '?'
+        return body
+
+    return build(trie)
+
+
+CLASSIFIER = CategoryClassifier(CATEGORY_KEYWORDS)
+
 
 @dataclass
 class SkillMetrics:
@@ -61,82 +178,150 @@ class EcosystemMetrics:
     skills: List[SkillMetrics]
 
 
-def count_lines(filepath: Path) -> int:
+def read_text(filepath: Path, cache: Optional[CorpusCache] = None) -> str:
+    """Read a file, through the shared corpus cache when available"""
+    if cache is not None:
+        return cache.get(filepath).content
+    return filepath.read_text(encoding='utf-8', errors='ignore')
+
+
+def count_content_lines(content: str) -> int:
+    """Count non-empty, non-comment lines in already-read content"""
+    lines = [l for l in content.split('\n')
+             if l.strip() and not l.strip().startswith('#')]
+    return len(lines)
+
+
+def count_lines(filepath: Path, cache: Optional[CorpusCache] = None) -> int:
     """Count non-empty, non-comment lines in a file"""
     try:
-        content = filepath.read_text(encoding='utf-8', errors='ignore')
-        lines = [l for l in content.split('\n')
-                 if l.strip() and not l.strip().startswith('#')]
-        return len(lines)
+        return count_content_lines(read_text(filepath, cache))
     except Exception:
         return 0
 
 
-def extract_categories(skill_md: Path) -> List[str]:
+def extract_categories(skill_md: Path, cache: Optional[CorpusCache] = None) -> List[str]:
     """Extract categories from SKILL.md description"""
     try:
-        content = skill_md.read_text()
-        # Look for category hints in description
-        categories = []
-
-        category_patterns = {
-            'security': r'security|vulnerability|owasp|audit|cve',
-            'testing': r'test|tdd|coverage|jest|pytest|playwright',
-            'infrastructure': r'deploy|ci\/cd|docker|kubernetes|devops',
-            'design': r'design|ui|ux|css|component|visual',
-            'ml-ai': r'machine learning|ml|ai|model|embedding|clip|neural',
-            'career': r'career|resume|cv|portfolio|job',
-            'audio-video': r'audio|video|sound|music|voice|media',
-            'documentation': r'document|docs|readme|technical writing',
-            'backend': r'api|backend|database|server|rest|graphql',
-            'frontend': r'react|vue|frontend|browser|dom|css',
-        }
-
-        for category, pattern in category_patterns.items():
-            if re.search(pattern, content, re.IGNORECASE):
-                categories.append(category)
-
-        return categories if categories else ['uncategorized']
+        return categorize(read_text(skill_md, cache))
     except Exception:
         return ['unknown']
 
 
-def analyze_skill(skill_dir: Path) -> Optional[SkillMetrics]:
-    """Analyze a single skill directory"""
+def categorize(content: str) -> List[str]:
+    """Categories hinted at by already-read SKILL.md content"""
+    return CLASSIFIER.classify(content)
+
+
+def analyze_skill(skill_dir: Path, cache: Optional[CorpusCache] = None) -> Optional[SkillMetrics]:
+    """Analyze a single skill directory, reading each file once"""
     skill_md = skill_dir / 'SKILL.md'
     if not skill_md.exists():
         return None
 
     # Count reference files
     refs_dir = skill_dir / 'references'
-    reference_count = len(list(refs_dir.glob('*.md'))) if refs_dir.exists() else 0
+    refs = list(refs_dir.glob('*.md')) if refs_dir.exists() else []
 
     # Count scripts
     scripts_dir = skill_dir / 'scripts'
     script_count = len(list(scripts_dir.glob('*'))) if scripts_dir.exists() else 0
 
-    # Count total lines
-    total_lines = count_lines(skill_md)
-    if refs_dir.exists():
-        for ref in refs_dir.glob('*.md'):
-            total_lines += count_lines(ref)
+    # One read of SKILL.md serves line count, examples and categories
+    content = read_text(skill_md, cache)
 
-    # Check for examples in SKILL.md
-    content = skill_md.read_text()
-    has_examples = '```' in content  # Code blocks indicate examples
+    # Count total lines
+    total_lines = count_content_lines(content)
+    for ref in refs:
+        total_lines += count_lines(ref, cache)
 
     return SkillMetrics(
         name=skill_dir.name,
         has_skill_md=True,
         has_changelog=(skill_dir / 'CHANGELOG.md').exists(),
-        reference_count=reference_count,
+        reference_count=len(refs),
         script_count=script_count,
         total_lines=total_lines,
-        has_examples=has_examples,
-        categories=extract_categories(skill_md)
+        has_examples='```' in content,  # Code blocks indicate examples
+        categories=categorize(content)
     )
 
 
+def skill_signature(skill_dir: Path) -> str:
+    """Hash of the name, size and mtime of every file a skill's metrics depend on"""
+    digest = hashlib.md5()
+    for sub in ('.', 'references', 'scripts'):
+        try:
+            with os.scandir(skill_dir / sub) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+        for entry in entries:
+            st = entry.stat()
+            digest.update(f"{sub}/{entry.name}\0{st.st_size}\0{st.st_mtime_ns}\n".encode())
+    return digest.hexdigest()
+
+
+class SkillMetricsCache:
+    """Per-skill metrics from earlier runs, keyed by skill_signature()"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.entries: Dict[str, Dict] = {}
+        self.dirty = False
+        self.stats = {"reused": 0, "computed": 0, "removed": 0}
+
+    @classmethod
+    def load(cls, base_dir: Path) -> "SkillMetricsCache":
+        """Load the cache for base_dir; a missing or outdated file gives an empty cache."""
+        metrics_cache = cls(base_dir / CACHE_DIR_NAME / METRICS_CACHE_FILE)
+        try:
+            data = json.loads(metrics_cache.path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            return metrics_cache
+        if data.get('format_version') == METRICS_CACHE_VERSION:
+            metrics_cache.entries = data.get('skills', {})
+        return metrics_cache
+
+    def analyze(self, skill_dir: Path, cache: Optional[CorpusCache] = None) -> Optional[SkillMetrics]:
+        """analyze_skill(), skipped when the skill directory is unchanged since the last run"""
+        if not (skill_dir / 'SKILL.md').exists():
+            return None
+
+        signature = skill_signature(skill_dir)
+        entry = self.entries.get(skill_dir.name)
+        if entry is not None and entry['signature'] == signature:
+            self.stats["reused"] += 1
+            return SkillMetrics(**entry['metrics'])
+
+        skill = analyze_skill(skill_dir, cache)
+        self.entries[skill_dir.name] = {'signature': signature, 'metrics': asdict(skill)}
+        self.stats["computed"] += 1
+        self.dirty = True
+        return skill
+
+    def prune(self, names: Set[str]) -> None:
+        """Forget skills that no longer exist"""
+        for name in set(self.entries) - names:
+            del self.entries[name]
+            self.stats["removed"] += 1
+            self.dirty = True
+
+    def save(self) -> None:
+        """Write the cache if anything changed (atomically)"""
+        if not self.dirty:
+            return
+        data = {
+            'format_version': METRICS_CACHE_VERSION,
+            'skills': {name: self.entries[name] for name in sorted(self.entries)},
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(data, separators=(',', ':')), encoding='utf-8')
+        os.replace(tmp_path, self.path)
+        self.dirty = False
+
+
 def count_agents(base_dir: Path) -> int:
     """Count custom agents defined"""
     agents_dir = base_dir / '.claude' / 'agents'
@@ -145,9 +330,19 @@ def count_agents(base_dir: Path) -> int:
     return len([f for f in agents_dir.glob('*.md') if f.is_file()])
 
 
-def collect_metrics(base_dir: Path) -> EcosystemMetrics:
-    """Collect all ecosystem metrics"""
+def collect_metrics(base_dir: Path, cache: Optional[CorpusCache] = None,
+                    on_skill: Optional[Callable[[SkillMetrics], None]] = None,
+                    incremental: bool = True,
+                    category_overrides: Optional[Dict[str, List[str]]] = None) -> EcosystemMetrics:
+    """Collect all ecosystem metrics, calling on_skill with each skill as it is analyzed
+
+    With incremental, unchanged skills come from the per-skill metrics cache.
+    category_overrides (e.g. from embedding_categories), keyed by skill
+    directory name, replaces the keyword categories of the skills it names.
+    """
     skills_dir = base_dir / '.claude' / 'skills'
+    metrics_cache = SkillMetricsCache.load(base_dir) if incremental else None
+    analyze = metrics_cache.analyze if metrics_cache is not None else analyze_skill
 
     skills: List[SkillMetrics] = []
     categories: Dict[str, int] = {}
@@ -155,12 +350,23 @@ def collect_metrics(base_dir: Path) -> EcosystemMetrics:
     if skills_dir.exists():
         for skill_dir in skills_dir.iterdir():
             if skill_dir.is_dir():
-                skill = analyze_skill(skill_dir)
+                skill = analyze(skill_dir, cache)
                 if skill:
+                    if category_overrides and skill.name in category_overrides:
+                        skill = replace(skill, categories=category_overrides[skill.name])
+                    if on_skill is not None:
+                        on_skill(skill)
                     skills.append(skill)
                     for cat in skill.categories:
                         categories[cat] = categories.get(cat, 0) + 1
 
+    if metrics_cache is not None:
+        metrics_cache.prune({s.name for s in skills})
+        try:
+            metrics_cache.save()
+        except OSError:
+            pass  # Read-only checkout: the metrics are still complete
+
     total_skills = len(skills)
     total_agents = count_agents(base_dir)
     total_references = sum(s.reference_count for s in skills)
@@ -189,6 +395,21 @@ def collect_metrics(base_dir: Path) -> EcosystemMetrics:
     )
 
 
+def save_dated_metrics(base_dir: Path, metrics: EcosystemMetrics) -> Path:
+    """Save metrics to metrics/YYYY-MM-DD.json and append the run to the history store"""
+    metrics_dir = base_dir / 'metrics'
+    metrics_dir.mkdir(exist_ok=True)
+    dated_file = metrics_dir / f"{datetime.now().strftime('%Y-%m-%d')}.json"
+    data = asdict(metrics)
+    dated_file.write_text(json.dumps(data, indent=2))
+    try:
+        with MetricsStore.open(base_dir) as store:
+            store.append_metrics(data, day=dated_file.stem)
+    except (OSError, sqlite3.Error) as e:
+        print(f"⚠️  Metrics history not updated: {e}", file=sys.stderr)
+    return dated_file
+
+
 def print_summary(metrics: EcosystemMetrics) -> None:
     """Print human-readable summary"""
     print("\n" + "=" * 60)
@@ -228,32 +449,109 @@ def print_summary(metrics: EcosystemMetrics) -> None:
     print("\n" + "=" * 60)
 
 
+def _legacy_categorize(content: str) -> List[str]:
+    """One re.search per category, as extract_categories used to do."""
+    categories = [category for category, words in CATEGORY_KEYWORDS.items()
+                  if re.search('|'.join(map(re.escape, words)), content, re.IGNORECASE)]
+    return categories if categories else ['uncategorized']
+
+
+def run_benchmark(base_dir: Path, repeat: int = 5) -> int:
+    """Time the combined classifier against per-category regexes over the skills tree."""
+    files = sorted((base_dir / '.claude' / 'skills').glob('*/SKILL.md'))
+    if not files:
+        print(f"No SKILL.md files found under {base_dir / '.claude' / 'skills'}")
+        return 1
+    documents = [f.read_text(encoding='utf-8', errors='ignore') for f in files]
+
+    mismatches = sum(1 for d in documents if CLASSIFIER.classify(d) != _legacy_categorize(d))
+
+    print(f"\n{'='*60}")
+    print("CATEGORY CLASSIFIER BENCHMARK")
+    print(f"{'='*60}\n")
+    print(f"Files:      {len(documents)} SKILL.md ({sum(map(len, documents)) / 1024:.0f} KiB)")
+    print(f"Repeat:     best of {repeat}")
+    print(f"Mismatches: {mismatches}\n")
+
+    baseline = None
+    for label, fn in [
+        (f"legacy ({len(CATEGORY_KEYWORDS)} x re.search)", _legacy_categorize),
+        ("combined trie pattern, single pass", CLASSIFIER.classify),
+        ("combined trie pattern, weighted scores", CLASSIFIER.scores),
+    ]:
+        best = float('inf')
+        for _ in range(repeat):
+            start = time.perf_counter()
+            for content in documents:
+                fn(content)
+            best = min(best, time.perf_counter() - start)
+        baseline = baseline or best
+        print(f"  {label:<40} {best * 1000:8.2f} ms  ({baseline / best:4.1f}x)")
+
+    print(f"\n{'='*60}\n")
+    return 1 if mismatches else 0
+
+
 def main():
     parser = argparse.ArgumentParser(description='Collect ecosystem metrics')
     parser.add_argument('--output', '-o', help='Output JSON file path')
     parser.add_argument('--json', action='store_true', help='Output JSON only')
+    parser.add_argument('--jsonl', action='store_true',
+                        help='Stream one JSON line per skill, then a summary line with the totals')
     parser.add_argument('--dir', default='.', help='Base directory to analyze')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Recompute every skill, reading files directly instead of using the caches')
+    parser.add_argument('--categorizer', choices=['keywords', 'embeddings'], default='keywords',
+                        help='How to assign categories: keyword patterns, or nearest centroid over the '
+                             'skill summary embeddings from build_embeddings.py (keywords for '
+                             'skills not embedded yet)')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Benchmark the category classifier over the skills tree')
+    parser.add_argument('--repeat', type=int, default=5, help='Benchmark repetitions')
     args = parser.parse_args()
 
     base_dir = Path(args.dir).resolve()
-    metrics = collect_metrics(base_dir)
+    if args.benchmark:
+        return run_benchmark(base_dir, args.repeat)
+
+    category_overrides = None
+    if args.categorizer == 'embeddings':
+        from embedding_categories import categorize_skills
+        try:
+            category_overrides = categorize_skills(base_dir)
+        except (FileNotFoundError, ValueError) as e:
+            print(f"❌ {e}", file=sys.stderr)
+            return 1
+
+    cache = open_cache(base_dir, enabled=not args.no_cache)
+    on_skill = None
+    if args.jsonl:
+        on_skill = lambda skill: print(json.dumps(asdict(skill)), flush=True)
+    try:
+        metrics = collect_metrics(base_dir, cache, on_skill, incremental=not args.no_cache,
+                                  category_overrides=category_overrides)
+    finally:
+        if cache is not None:
+            cache.close()
 
     if args.output:
         output_path = Path(args.output)
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_text(json.dumps(asdict(metrics), indent=2))
-        print(f"Metrics saved to: {output_path}")
-
-    if args.json:
+        if not args.jsonl:
+            print(f"Metrics saved to: {output_path}")
+
+    if args.jsonl:
+        summary = asdict(metrics)
+        del summary['skills']
+        print(json.dumps({'summary': summary}), flush=True)
+    elif args.json:
         print(json.dumps(asdict(metrics), indent=2))
     else:
         print_summary(metrics)
 
     # Always save to metrics directory with date
-    metrics_dir = base_dir / 'metrics'
-    metrics_dir.mkdir(exist_ok=True)
-    dated_file = metrics_dir / f"{datetime.now().strftime('%Y-%m-%d')}.json"
-    dated_file.write_text(json.dumps(asdict(metrics), indent=2))
+    save_dated_metrics(base_dir, metrics)
 
     return 0
 
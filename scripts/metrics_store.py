@@ -0,0 +1,367 @@
+#!/usr/bin/env python3
+"""
+Ecosystem Metrics History Store
+
+An append-only SQLite store of everything the trend tooling needs, so history
+queries are one indexed SELECT instead of a json.loads per file:
+
+- metric_runs:    one row per measure-ecosystem.py run (the totals)
+- skill_metrics:  one row per skill per run
+- snapshots:      one row per generate_snapshot.py snapshot (summary + delta)
+
+Series come back columnar ({column: [values...]}), ready for vectorised
+trend computation. measure-ecosystem.py appends each run as it saves
+metrics/YYYY-MM-DD.json; snapshots are synced from the snapshots directory,
+reading only files the store hasn't seen. Existing JSON history is imported
+with --migrate (safe to re-run).
+
+The store lives in metrics/metrics.sqlite under the project root (ignored by
+git, beside the committed metrics/*.json it is rebuilt from).
+
+Usage:
+    from metrics_store import MetricsStore
+
+    with MetricsStore.open(base_dir) as store:
+        store.metric_series(['total_skills', 'total_guidance_lines'], since='2025-01-01')
+        store.skill_series('api-architect')
+
+    python scripts/metrics_store.py --migrate
+    python scripts/metrics_store.py --series total_skills total_agents
+"""
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson not installed
+    from json import loads as json_loads
+
+STORE_DIR_NAME = "metrics"
+STORE_FILE_NAME = "metrics.sqlite"
+
+# Recorded in the meta table; bump when the tables change
+SCHEMA_VERSION = 1
+
+# Numeric totals of a measure-ecosystem run, in EcosystemMetrics field order
+RUN_COLUMNS = [
+    'total_skills', 'total_agents', 'total_references', 'total_scripts',
+    'total_guidance_lines', 'avg_references_per_skill', 'avg_lines_per_skill',
+    'skills_with_examples', 'skills_with_changelog', 'skills_with_scripts',
+]
+
+SKILL_COLUMNS = ['has_changelog', 'reference_count', 'script_count', 'total_lines', 'has_examples']
+
+SNAPSHOT_COLUMNS = ['total_skills', 'total_agents', 'unique_tools']
+
+# "-N" suffix generate_snapshot.py adds to a name already taken in the same minute
+SNAPSHOT_SUFFIX_RE = re.compile(r'^(\d{4}-\d{2}-\d{2}-\d{4}(?:-.+?)?)-(\d+)$')
+
+
+def parse_timestamp(timestamp: str) -> Optional[datetime]:
+    """Parse a snapshot ("2024-12-07 18:00 UTC") or ISO 8601 timestamp as an aware UTC datetime."""
+    if not timestamp:
+        return None
+    try:
+        ts = datetime.strptime(timestamp, "%Y-%m-%d %H:%M UTC")
+    except ValueError:
+        try:
+            ts = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    return ts.replace(tzinfo=timezone.utc) if ts.tzinfo is None else ts.astimezone(timezone.utc)
+
+
+def snapshot_file_order(path: Path) -> Tuple[str, int]:
+    """Sort key putting NAME.json before NAME-2.json, NAME-3.json (same-minute snapshots)."""
+    match = SNAPSHOT_SUFFIX_RE.match(path.stem)
+    return (match.group(1), int(match.group(2))) if match else (path.stem, 1)
+
+
+def _iso(value: Any) -> Optional[str]:
+    """since= argument (datetime or date string) as a comparable ISO string."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).isoformat()
+    return str(value)
+
+
+def _columns(cursor: sqlite3.Cursor, names: List[str]) -> Dict[str, List[Any]]:
+    rows = cursor.fetchall()
+    if not rows:
+        return {name: [] for name in names}
+    return {name: list(values) for name, values in zip(names, zip(*rows))}
+
+
+class MetricsStore:
+    """Append-only metrics and snapshot history backed by SQLite."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(str(path))
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._init_schema()
+
+    @classmethod
+    def open(cls, base_dir: Path) -> "MetricsStore":
+        return cls(base_dir / STORE_DIR_NAME / STORE_FILE_NAME)
+
+    def _init_schema(self) -> None:
+        run_columns = ",\n".join(
+            f"{c} {'REAL' if c.startswith('avg_') else 'INTEGER'}" for c in RUN_COLUMNS)
+        self._db.executescript(f"""
+            CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+
+            CREATE TABLE IF NOT EXISTS metric_runs (
+                id INTEGER PRIMARY KEY,
+                timestamp TEXT NOT NULL UNIQUE,
+                day TEXT NOT NULL,
+                version TEXT,
+                {run_columns},
+                categories TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS metric_runs_day ON metric_runs (day);
+
+            CREATE TABLE IF NOT EXISTS skill_metrics (
+                name TEXT NOT NULL,
+                run_id INTEGER NOT NULL REFERENCES metric_runs (id),
+                {', '.join(f'{c} INTEGER' for c in SKILL_COLUMNS)},
+                categories TEXT NOT NULL,
+                PRIMARY KEY (name, run_id)
+            ) WITHOUT ROWID;
+
+            CREATE TABLE IF NOT EXISTS snapshots (
+                file TEXT PRIMARY KEY,
+                timestamp TEXT NOT NULL,
+                {', '.join(f'{c} INTEGER' for c in SNAPSHOT_COLUMNS)},
+                summary TEXT NOT NULL,
+                delta TEXT NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS snapshots_timestamp ON snapshots (timestamp);
+        """)
+        self._db.execute("INSERT OR IGNORE INTO meta VALUES ('schema_version', ?)",
+                         (str(SCHEMA_VERSION),))
+        self._db.commit()
+
+    # -------------------------------------------------------------------------
+    # Appending
+    # -------------------------------------------------------------------------
+
+    def append_metrics(self, metrics: Dict[str, Any], day: Optional[str] = None) -> bool:
+        """Store one measure-ecosystem run (asdict(EcosystemMetrics)). False if already stored.
+
+        day is the metrics/YYYY-MM-DD.json date the run was saved under
+        (default: the run's local date, as save_dated_metrics names the file).
+        """
+        with self._db:
+            return self._insert_metrics(metrics, day)
+
+    def _insert_metrics(self, metrics: Dict[str, Any], day: Optional[str] = None) -> bool:
+        ts = parse_timestamp(metrics.get('timestamp', ''))
+        if ts is None:
+            return False
+        timestamp = ts.isoformat()
+        if day is None:
+            day = ts.astimezone().strftime('%Y-%m-%d')
+        cursor = self._db.execute(
+            f"INSERT OR IGNORE INTO metric_runs (timestamp, day, version, {', '.join(RUN_COLUMNS)}, "
+            f"categories) VALUES ({', '.join(['?'] * (len(RUN_COLUMNS) + 4))})",
+            (timestamp, day, metrics.get('version'),
+             *(metrics.get(c) for c in RUN_COLUMNS), json.dumps(metrics.get('categories', {})))
+        )
+        if cursor.rowcount == 0:
+            return False
+
+        run_id = cursor.lastrowid
+        self._db.executemany(
+            f"INSERT OR REPLACE INTO skill_metrics (name, run_id, {', '.join(SKILL_COLUMNS)}, "
+            f"categories) VALUES ({', '.join(['?'] * (len(SKILL_COLUMNS) + 3))})",
+            [(s['name'], run_id, *(int(s.get(c) or 0) for c in SKILL_COLUMNS),
+              json.dumps(s.get('categories', []))) for s in metrics.get('skills', [])]
+        )
+        return True
+
+    def append_snapshot(self, file: str, snapshot: Dict[str, Any]) -> bool:
+        """Store the summary and delta of a snapshot JSON document. False if already stored."""
+        with self._db:
+            return self._insert_snapshot(file, snapshot)
+
+    def _insert_snapshot(self, file: str, snapshot: Dict[str, Any]) -> bool:
+        ts = parse_timestamp(snapshot.get('timestamp', ''))
+        if ts is None:
+            return False
+        # Delta-encoded snapshots carry the summary beside their patch
+        summary = snapshot['summary'] if 'patch' in snapshot else snapshot.get('state', {}).get('summary', {})
+        cursor = self._db.execute(
+            f"INSERT OR IGNORE INTO snapshots (file, timestamp, {', '.join(SNAPSHOT_COLUMNS)}, "
+            f"summary, delta) VALUES ({', '.join(['?'] * (len(SNAPSHOT_COLUMNS) + 4))})",
+            (file, ts.isoformat(), *(summary.get(c) for c in SNAPSHOT_COLUMNS),
+             json.dumps(summary), json.dumps(snapshot.get('delta', {})))
+        )
+        return cursor.rowcount > 0
+
+    def snapshot_files(self) -> Set[str]:
+        return {row[0] for row in self._db.execute("SELECT file FROM snapshots")}
+
+    def sync_snapshots(self, snapshots_dir: Path) -> int:
+        """Import snapshot JSON files the store hasn't seen, in one transaction. Returns the number added."""
+        if not snapshots_dir.exists():
+            return 0
+        known = self.snapshot_files()
+        added = 0
+        with self._db:
+            for json_file in sorted(snapshots_dir.glob("*.json"), key=snapshot_file_order):
+                if json_file.name in known:
+                    continue
+                try:
+                    data = json_loads(json_file.read_bytes())
+                except (ValueError, OSError):
+                    continue
+                if isinstance(data, dict) and ('state' in data or 'patch' in data):
+                    added += self._insert_snapshot(json_file.name, data)
+        return added
+
+    def migrate(self, base_dir: Path) -> Dict[str, int]:
+        """Import metrics/*.json and the snapshots directory. Already-stored files are skipped."""
+        runs = 0
+        with self._db:
+            for json_file in sorted((base_dir / STORE_DIR_NAME).glob("*.json")):
+                try:
+                    data = json.loads(json_file.read_text(encoding="utf-8"))
+                except (json.JSONDecodeError, OSError):
+                    continue
+                if isinstance(data, dict) and 'timestamp' in data:
+                    runs += self._insert_metrics(data, day=json_file.stem)
+        snapshots = self.sync_snapshots(base_dir / ".claude" / "archive" / "snapshots")
+        return {'metric_runs': runs, 'snapshots': snapshots}
+
+    # -------------------------------------------------------------------------
+    # Columnar queries
+    # -------------------------------------------------------------------------
+
+    def metric_series(self, columns: Iterable[str] = RUN_COLUMNS, since: Any = None,
+                      daily: bool = False) -> Dict[str, List[Any]]:
+        """Run totals over time, oldest first, plus 'timestamp' and 'day'.
+
+        day is the local date of the metrics/YYYY-MM-DD.json file a run was
+        saved to, so daily (keep only the last run of each day) matches what
+        those files hold.
+        """
+        columns = [c for c in columns if c in RUN_COLUMNS]
+        names = ['timestamp', 'day', *columns]
+        where = []
+        params: List[Any] = []
+        if since is not None:
+            where.append("timestamp >= ?")
+            params.append(_iso(since))
+        if daily:
+            where.append("id IN (SELECT MAX(id) FROM metric_runs GROUP BY day)")
+        sql = f"SELECT {', '.join(names)} FROM metric_runs"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        return _columns(self._db.execute(sql + " ORDER BY timestamp", params), names)
+
+    def skill_series(self, name: str, since: Any = None) -> Dict[str, List[Any]]:
+        """One skill's metrics over time, oldest first, plus 'timestamp'."""
+        names = ['timestamp', *SKILL_COLUMNS]
+        sql = (f"SELECT r.timestamp, {', '.join('s.' + c for c in SKILL_COLUMNS)} "
+               "FROM skill_metrics s JOIN metric_runs r ON r.id = s.run_id WHERE s.name = ?")
+        params: List[Any] = [name]
+        if since is not None:
+            sql += " AND r.timestamp >= ?"
+            params.append(_iso(since))
+        return _columns(self._db.execute(sql + " ORDER BY r.timestamp", params), names)
+
+    def snapshot_series(self, since: Any = None) -> Dict[str, List[Any]]:
+        """Snapshot summaries over time, oldest first: file, timestamp, totals, summary, delta."""
+        names = ['file', 'timestamp', *SNAPSHOT_COLUMNS, 'summary', 'delta']
+        sql = f"SELECT {', '.join(names)} FROM snapshots"
+        params: List[Any] = []
+        if since is not None:
+            sql += " WHERE timestamp >= ?"
+            params.append(_iso(since))
+        series = _columns(self._db.execute(sql + " ORDER BY timestamp, rowid", params), names)
+        series['summary'] = [json.loads(s) for s in series['summary']]
+        series['delta'] = [json.loads(d) for d in series['delta']]
+        return series
+
+    def snapshot_totals(self, since: Any = None) -> Dict[str, List[Any]]:
+        """Snapshot totals over time, oldest first, without decoding summaries or deltas."""
+        names = ['file', 'timestamp', *SNAPSHOT_COLUMNS]
+        sql = f"SELECT {', '.join(names)} FROM snapshots"
+        params: List[Any] = []
+        if since is not None:
+            sql += " WHERE timestamp >= ?"
+            params.append(_iso(since))
+        return _columns(self._db.execute(sql + " ORDER BY timestamp, rowid", params), names)
+
+    def category_series(self, since: Any = None) -> Dict[str, List[Any]]:
+        """Skills per category in each snapshot, oldest first: file, timestamp, category, count.
+
+        SQLite's json_each reads skill_categories out of the stored summaries.
+        """
+        names = ['file', 'timestamp', 'category', 'count']
+        sql = ("SELECT s.file, s.timestamp, c.key, c.value "
+               "FROM snapshots s, json_each(s.summary, '$.skill_categories') c")
+        params: List[Any] = []
+        if since is not None:
+            sql += " WHERE s.timestamp >= ?"
+            params.append(_iso(since))
+        return _columns(self._db.execute(sql + " ORDER BY s.timestamp, s.rowid", params), names)
+
+    def close(self) -> None:
+        self._db.commit()
+        self._db.close()
+
+    def __enter__(self) -> "MetricsStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Ecosystem metrics history store')
+    parser.add_argument('--dir', default='.', help='Base directory')
+    parser.add_argument('--migrate', action='store_true',
+                        help='Import metrics/*.json and .claude/archive/snapshots/*.json')
+    parser.add_argument('--series', nargs='+', metavar='COLUMN',
+                        help=f"Print run totals over time (columns: {', '.join(RUN_COLUMNS)})")
+    parser.add_argument('--since', help='Only runs at or after this date (YYYY-MM-DD)')
+    parser.add_argument('--daily', action='store_true', help='Last run of each day only')
+    args = parser.parse_args()
+
+    if not args.migrate and not args.series:
+        parser.print_help()
+        return 0
+
+    base_dir = Path(args.dir).resolve()
+    with MetricsStore.open(base_dir) as store:
+        if args.migrate:
+            added = store.migrate(base_dir)
+            print(f"Store:       {store.path}")
+            print(f"Metric runs: +{added['metric_runs']}")
+            print(f"Snapshots:   +{added['snapshots']}")
+
+        if args.series:
+            unknown = [c for c in args.series if c not in RUN_COLUMNS]
+            if unknown:
+                parser.error(f"unknown column(s): {', '.join(unknown)}")
+            series = store.metric_series(args.series, since=args.since, daily=args.daily)
+            print(json.dumps(series, indent=2))
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+"""
+Ecosystem Pipeline Runner
+
+Runs the nightly ecosystem scripts in one process over one shared, in-memory
+corpus model instead of shelling out to each script separately:
+
+    ecosystem_data  generate_ecosystem_data.py  -> .claude/data/ecosystem-state.json
+    snapshot        generate_snapshot.py        (after ecosystem_data)
+    metrics         measure-ecosystem.py        -> metrics/YYYY-MM-DD.json
+    dependencies    check_dependencies.py
+    changelog       update_changelog.py
+    embeddings      build_embeddings.py         (needs requirements-rag.txt)
+
+Every SKILL.md, AGENT.md and reference file is read once through the corpus
+cache, then stages run as a DAG on a thread pool (independent stages in
+parallel). Each stage has an input fingerprint; a stage whose fingerprint
+matches its last successful run is skipped. Fingerprints and per-stage results
+are kept in .cache/pipeline-state.json.
+
+Usage:
+    python scripts/run_ecosystem_pipeline.py
+    python scripts/run_ecosystem_pipeline.py --force           # Ignore fingerprints
+    python scripts/run_ecosystem_pipeline.py --only metrics,dependencies
+    python scripts/run_ecosystem_pipeline.py --skip embeddings --json
+"""
+
+import argparse
+import hashlib
+import importlib.util
+import json
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+from corpus_cache import CACHE_DIR_NAME, CorpusCache, find_project_root
+
+SCRIPTS_DIR = Path(__file__).parent
+STATE_FILE_NAME = "pipeline-state.json"
+
+
+def load_script(name: str):
+    """Import a sibling script as a module (handles hyphenated file names)."""
+    module_name = name.replace("-", "_")
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, SCRIPTS_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@dataclass
+class Corpus:
+    """The in-memory corpus model shared by every stage."""
+    root: Path
+    cache: CorpusCache
+    skill_files: List[Path] = field(default_factory=list)
+    agent_files: List[Path] = field(default_factory=list)
+    reference_files: List[Path] = field(default_factory=list)
+
+    @classmethod
+    def load(cls, root: Path, cache: CorpusCache) -> "Corpus":
+        """Discover and parse every document once, warming the cache."""
+        skills_dir = root / ".claude" / "skills"
+        agents_dir = root / ".claude" / "agents"
+        corpus = cls(root=root, cache=cache)
+
+        if skills_dir.exists():
+            # One file per skill directory: both globs match the same file on case-insensitive filesystems
+            by_dir: Dict[Path, Path] = {}
+            for skill_md in sorted(skills_dir.glob("*/SKILL.md")) + sorted(skills_dir.glob("*/skill.md")):
+                by_dir.setdefault(skill_md.parent, skill_md)
+            corpus.skill_files = list(by_dir.values())
+            for skill_md in corpus.skill_files:
+                cache.get(skill_md)
+                for ref in cache.references(skill_md.parent):
+                    ref_path = skill_md.parent / "references" / ref
+                    cache.get(ref_path)
+                    corpus.reference_files.append(ref_path)
+
+        if agents_dir.exists():
+            corpus.agent_files = sorted(
+                [f for f in agents_dir.glob("*.md") if f.is_file()] + list(agents_dir.glob("*/AGENT.md"))
+            )
+            for agent_md in corpus.agent_files:
+                cache.get(agent_md)
+
+        return corpus
+
+    def fingerprint(self, files: List[Path], *extra: str) -> str:
+        """Hash of (path, content hash) for files plus any extra inputs."""
+        digest = hashlib.sha256()
+        for path in sorted(files):
+            digest.update(f"{path.relative_to(self.root)}\0{self.cache.get(path).content_hash}\n".encode())
+        for value in extra:
+            digest.update(f"{value}\n".encode())
+        return digest.hexdigest()
+
+
+@dataclass
+class Stage:
+    """A pipeline stage: a function over the corpus plus its input fingerprint."""
+    name: str
+    run: Callable[[Corpus], str]
+    inputs: Callable[[Corpus], str]
+    depends_on: List[str] = field(default_factory=list)
+
+
+@dataclass
+class StageResult:
+    name: str
+    status: str  # 'ran', 'skipped', 'failed', 'blocked', 'unavailable'
+    seconds: float = 0.0
+    summary: str = ""
+
+
+# =============================================================================
+# Stages
+# =============================================================================
+
+def run_ecosystem_data(corpus: Corpus) -> str:
+    module = load_script("generate_ecosystem_data")
+    state = module.generate_ecosystem_state(corpus.root, corpus.cache)
+    output_path = corpus.root / ".claude" / "data" / "ecosystem-state.json"
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(state, indent=2, ensure_ascii=False), encoding="utf-8")
+    summary = state["summary"]
+    return f"{summary['total_agents']} agents, {summary['total_skills']} skills"
+
+
+def run_snapshot(corpus: Corpus) -> str:
+    module = load_script("generate_snapshot")
+    state = module.load_ecosystem_state(corpus.root / ".claude" / "data" / "ecosystem-state.json")
+    if state is None:
+        raise RuntimeError("No ecosystem state found")
+    _, md_path, delta = module.create_snapshot(state, corpus.root / ".claude" / "archive" / "snapshots")
+    if delta.get("is_initial"):
+        return f"{md_path.name} (initial)"
+    return (f"{md_path.name} (+{delta['skills_added']} skills, +{delta['agents_added']} agents, "
+            f"~{delta['skills_changed']} updated)")
+
+
+def run_metrics(corpus: Corpus) -> str:
+    module = load_script("measure-ecosystem")
+    metrics = module.collect_metrics(corpus.root, corpus.cache)
+    dated_file = module.save_dated_metrics(corpus.root, metrics)
+    return f"{metrics.total_skills} skills, {metrics.total_guidance_lines:,} lines -> {dated_file.name}"
+
+
+def run_dependencies(corpus: Corpus) -> str:
+    module = load_script("check_dependencies")
+    checker = module.DependencyChecker(corpus.root, corpus.cache)
+    passed = checker.check_all()
+    errors = sum(1 for i in checker.issues if i.severity == 'error')
+    warnings = sum(1 for i in checker.issues if i.severity == 'warning')
+    # Standing dependency errors are a result, not a stage failure: the
+    # fingerprint is still saved, so an unchanged corpus isn't re-checked
+    if not passed:
+        return f"❗ {errors} errors, {warnings} warnings (run check_dependencies.py for details)"
+    return f"{errors} errors, {warnings} warnings"
+
+
+def run_changelog(corpus: Corpus) -> str:
+    module = load_script("update_changelog")
+    changelog_path = corpus.root / ".claude" / "archive" / "changelogs" / "CHANGELOG.md"
+    commits, head = module.new_commits(changelog_path, cwd=corpus.root)
+    if not commits:
+        return "no new commits"
+    changelog_path.parent.mkdir(parents=True, exist_ok=True)
+    module.write_changelog(changelog_path, commits, rules=module.project_rules(corpus.root))
+    module.save_cursor(changelog_path, head)
+    return f"{len(commits)} commit(s)"
+
+
+def run_embeddings(corpus: Corpus) -> str:
+    module = load_script("build_embeddings")
+    stats = module.build_embeddings(cache=corpus.cache, base_dir=corpus.root)
+    return f"{stats['total_chunks']} chunks, {stats['new_chunks']} embedded"
+
+
+def git_head(root: Path) -> str:
+    """Last commit touching skills/agents, or '' outside a git repo."""
+    try:
+        result = subprocess.run(
+            ["git", "log", "-1", "--format=%H", "--", ".claude/skills/", ".claude/agents/"],
+            cwd=root, capture_output=True, text=True, check=True
+        )
+        return result.stdout.strip()
+    except (subprocess.CalledProcessError, OSError):
+        return ""
+
+
+def build_stages() -> Dict[str, Stage]:
+    def documents(c: Corpus) -> str:
+        return c.fingerprint(c.skill_files + c.agent_files)
+
+    stages = [
+        Stage("ecosystem_data", run_ecosystem_data, documents),
+        # Snapshots only change when the state they capture does
+        Stage("snapshot", run_snapshot, documents, depends_on=["ecosystem_data"]),
+        # Metrics are a daily time series, so the date is an input
+        Stage("metrics", run_metrics,
+              lambda c: c.fingerprint(c.skill_files + c.reference_files, datetime.now().strftime('%Y-%m-%d'))),
+        Stage("dependencies", run_dependencies, lambda c: c.fingerprint(c.skill_files + c.reference_files)),
+        # An empty HEAD (no git) never matches, so the stage always runs
+        Stage("changelog", run_changelog, lambda c: git_head(c.root) or str(time.time())),
+        Stage("embeddings", run_embeddings, documents),
+    ]
+    return {s.name: s for s in stages}
+
+
+# =============================================================================
+# Runner
+# =============================================================================
+
+def load_state(state_path: Path) -> Dict[str, Any]:
+    try:
+        return json.loads(state_path.read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def run_pipeline(
+    root: Path,
+    selected: List[str],
+    force: bool = False,
+    workers: int = 4
+) -> List[StageResult]:
+    """Run the selected stages as a DAG. Returns results in stage order."""
+    stages = build_stages()
+    state_path = root / CACHE_DIR_NAME / STATE_FILE_NAME
+    previous = load_state(state_path)
+    results: Dict[str, StageResult] = {}
+
+    with CorpusCache(root) as cache:
+        start = time.perf_counter()
+        corpus = Corpus.load(root, cache)
+        results["corpus"] = StageResult(
+            "corpus", "ran", time.perf_counter() - start,
+            f"{len(corpus.skill_files)} skills, {len(corpus.agent_files)} agents, "
+            f"{len(corpus.reference_files)} references"
+        )
+
+        fingerprints = {name: stages[name].inputs(corpus) for name in selected}
+
+        def execute(stage: Stage) -> StageResult:
+            if not force and previous.get(stage.name, {}).get("inputs") == fingerprints[stage.name]:
+                return StageResult(stage.name, "skipped", 0.0, "inputs unchanged")
+            started = time.perf_counter()
+            try:
+                summary = stage.run(corpus)
+                return StageResult(stage.name, "ran", time.perf_counter() - started, summary)
+            except ImportError as e:
+                return StageResult(stage.name, "unavailable", time.perf_counter() - started, str(e))
+            except Exception as e:
+                return StageResult(stage.name, "failed", time.perf_counter() - started, str(e))
+
+        pending = {name: stages[name] for name in selected}
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            while pending or running:
+                for name, stage in list(pending.items()):
+                    deps = [d for d in stage.depends_on if d in selected]
+                    if any(results.get(d) and results[d].status in ("failed", "blocked", "unavailable")
+                           for d in deps):
+                        results[name] = StageResult(name, "blocked", 0.0, f"needs {', '.join(deps)}")
+                        del pending[name]
+                    elif all(d in results for d in deps):
+                        running[pool.submit(execute, stage)] = name
+                        del pending[name]
+
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    result = future.result()
+                    results[result.name] = result
+                    del running[future]
+
+    # Remember fingerprints of stages that succeeded (or were already current)
+    for name in selected:
+        if results[name].status in ("ran", "skipped"):
+            previous[name] = {
+                "inputs": fingerprints[name],
+                "status": results[name].status,
+                "summary": results[name].summary if results[name].status == "ran"
+                else previous.get(name, {}).get("summary", ""),
+                "seconds": round(results[name].seconds, 3),
+                "finished_at": datetime.now(timezone.utc).isoformat(),
+            }
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(previous, indent=2), encoding="utf-8")
+
+    return [results["corpus"]] + [results[name] for name in stages if name in selected]
+
+
+def print_results(results: List[StageResult], total: float) -> None:
+    icons = {'ran': '✅', 'skipped': '⏭️ ', 'failed': '❌', 'blocked': '⛔', 'unavailable': '⚪'}
+
+    print(f"\n{'='*60}")
+    print("ECOSYSTEM PIPELINE")
+    print(f"{'='*60}\n")
+    for r in results:
+        print(f"  {icons.get(r.status, '•')} {r.name:<15} {r.status:<12} {r.seconds:7.2f}s  {r.summary}")
+    print(f"\n{'='*60}")
+    print(f"Total: {total:.2f}s")
+    print(f"{'='*60}\n")
+
+
+def main():
+    stage_names = list(build_stages())
+
+    parser = argparse.ArgumentParser(description='Run the ecosystem scripts as one pipeline')
+    parser.add_argument('--dir', help='Project root (default: nearest directory containing .claude)')
+    parser.add_argument('--only', help=f"Comma-separated stages to run ({','.join(stage_names)})")
+    parser.add_argument('--skip', help='Comma-separated stages to leave out')
+    parser.add_argument('--force', action='store_true', help='Run stages even if their inputs are unchanged')
+    parser.add_argument('--workers', type=int, default=4, help='Parallel stage workers')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    root = Path(args.dir).resolve() if args.dir else (find_project_root(Path.cwd()) or Path.cwd())
+
+    selected = args.only.split(',') if args.only else list(stage_names)
+    if args.skip:
+        selected = [s for s in selected if s not in args.skip.split(',')]
+    unknown = [s for s in selected if s not in stage_names]
+    if unknown:
+        parser.error(f"Unknown stage(s): {', '.join(unknown)}")
+
+    start = time.perf_counter()
+    results = run_pipeline(root, selected, force=args.force, workers=args.workers)
+    total = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps({
+            'root': str(root),
+            'seconds': round(total, 3),
+            'stages': [
+                {'stage': r.name, 'status': r.status, 'seconds': round(r.seconds, 3), 'summary': r.summary}
+                for r in results
+            ]
+        }, indent=2))
+    else:
+        print_results(results, total)
+
+    return 1 if any(r.status in ('failed', 'blocked') for r in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -3,8 +3,19 @@
 Skill Scanner and Ingester
 Scans ~/coding/ recursively for Claude skills and ingests them into the website.
 
+The scan lists directories with os.scandir on a thread pool, one directory
+level at a time. Besides SKIP_DIRS it prunes directories ignored by any
+.gitignore above them, virtualenvs (a pyvenv.cfg inside) and, with
+--max-depth, anything deeper than the limit. Each directory's listing is kept
+in .cache/scan-dirs.json with its mtime; a directory's mtime changes whenever
+an entry is added, removed or renamed in it, so on the next scan an unchanged
+directory costs one stat() instead of a listing (and its .gitignore is only
+re-read if that file changed).
+
 Run manually: python3 scripts/scan-and-ingest-skills.py
 Run with --dry-run to see what would be ingested without making changes.
+Run with --max-depth 6 to stop descending 6 levels below ~/coding/.
+Run with --rescan to list every directory again, ignoring the cache.
 """
 
 import os
@@ -14,23 +25,46 @@ import json
 import shutil
 import subprocess
 import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import translate
 from pathlib import Path
 from datetime import datetime
 
+import yaml
+
+from corpus_cache import CACHE_DIR_NAME
+from skill_parser import parse_frontmatter, scan_frontmatter
+
 # Configuration
 SCAN_ROOT = Path.home() / "coding"
 REPO_ROOT = Path(__file__).parent.parent
 SKILLS_DIR = REPO_ROOT / ".claude" / "skills"
 HERO_IMAGES_DIR = REPO_ROOT / "website" / "static" / "img" / "skills"
 LOG_FILE = REPO_ROOT / "logs" / "skill-scan.log"
+DIR_CACHE_FILE = REPO_ROOT / CACHE_DIR_NAME / "scan-dirs.json"
 
 # Directories to skip
 SKIP_DIRS = {
     "node_modules", ".git", "dist", "build", "__pycache__",
     ".venv", "venv", ".next", ".nuxt", "out", "coverage",
+    "target", ".gradle", ".tox", ".mypy_cache", ".pytest_cache",
     "some_claude_skills"  # Skip our own repo
 }
 
+IGNORE_FILE = ".gitignore"
+VENV_MARKER = "pyvenv.cfg"
+
+# Bump when the cached directory entries change shape
+DIR_CACHE_VERSION = 1
+
+# Directories listed per thread pool task
+DIR_BATCH = 64
+
+# Directories modified this close to the scan may change again within the
+# same mtime tick, so their listings are not cached
+RACY_MTIME_NS = 2_000_000_000
+
 # Skill file patterns
 SKILL_PATTERNS = ["SKILL.md", "skill.md"]
 
@@ -46,40 +80,194 @@ def log(message: str, level: str = "INFO"):
         f.write(formatted + "\n")
 
 
-def find_skill_files() -> list[Path]:
-    """Recursively find all skill files in ~/coding/."""
-    skill_files = []
+def compile_gitignore(lines: list[str]) -> list[tuple[bool, bool, re.Pattern]]:
+    """(negated, anchored, regex) per .gitignore pattern, in file order.
 
-    for root, dirs, files in os.walk(SCAN_ROOT):
-        # Skip excluded directories
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
+    Only directory pruning uses these, so trailing-slash (directory-only)
+    patterns are treated like any other. Anchored patterns (containing a
+    slash) match the path relative to the .gitignore's directory; the rest
+    match the directory name at any depth.
+    """
+    rules = []
+    for line in lines:
+        line = line.rstrip()
+        if not line or line.startswith("#"):
+            continue
+        negated = line.startswith("!")
+        if negated:
+            line = line[1:]
+        if line.startswith("\\"):
+            line = line[1:]
+        line = line.rstrip("/")
+        if line.startswith("**/"):
+            line = line[3:]
+        if not line:
+            continue
+        anchored = "/" in line
+        rules.append((negated, anchored, re.compile(translate(line.lstrip("/")))))
+    return rules
+
+
+def is_ignored(path: str, name: str, ignores: tuple) -> bool:
+    """Whether directory path is ignored by the (base dir prefix, rules) in ignores, outermost first.
+
+    As in git, the last matching pattern wins, deeper .gitignore files
+    taking precedence over shallower ones.
+    """
+    ignored = False
+    for base, rules in ignores:
+        relative = None
+        for negated, anchored, pattern in rules:
+            if anchored:
+                if relative is None:
+                    relative = path[len(base):].replace(os.sep, "/")
+                matched = pattern.match(relative)
+            else:
+                matched = pattern.match(name)
+            if matched:
+                ignored = not negated
+    return ignored
+
+
+def read_directory(path: str, cached: dict | None) -> dict | None:
+    """Subdirectories, skill files and .gitignore patterns of one directory.
+
+    Returns cached unchanged if the directory's mtime still matches (re-reading
+    only a modified .gitignore), or None if the directory can't be read.
+    """
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
 
-        for pattern in SKILL_PATTERNS:
-            if pattern in files:
-                skill_path = Path(root) / pattern
-                skill_files.append(skill_path)
+    if cached is not None and cached.get("mtime") == mtime:
+        if "ignore_mtime" not in cached:
+            return cached
+        ignore_path = os.path.join(path, IGNORE_FILE)
+        try:
+            ignore_mtime = os.stat(ignore_path).st_mtime_ns
+            if ignore_mtime == cached["ignore_mtime"]:
+                return cached
+            with open(ignore_path, encoding="utf-8", errors="replace") as f:
+                return {**cached, "ignore": f.read().splitlines(), "ignore_mtime": ignore_mtime}
+        except OSError:
+            pass  # Fall through to a full listing
+
+    entry = {"mtime": mtime, "dirs": [], "skills": []}
+    try:
+        with os.scandir(path) as it:
+            for item in it:
+                try:
+                    if item.is_dir(follow_symlinks=False):
+                        entry["dirs"].append(item.name)
+                    elif item.name in SKILL_PATTERNS:
+                        entry["skills"].append(item.name)
+                    elif item.name == VENV_MARKER:
+                        entry["venv"] = True
+                    elif item.name == IGNORE_FILE:
+                        with open(item.path, encoding="utf-8", errors="replace") as f:
+                            entry["ignore"] = f.read().splitlines()
+                        entry["ignore_mtime"] = item.stat().st_mtime_ns
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    entry["skills"].sort(key=SKILL_PATTERNS.index)
+    return entry
 
-    return skill_files
 
+def read_directories(batch: list[tuple[str, dict | None]]) -> list[dict | None]:
+    return [read_directory(path, cached) for path, cached in batch]
 
-def parse_frontmatter(content: str) -> dict | None:
-    """Extract YAML frontmatter from skill file."""
-    if not content.startswith("---"):
-        return None
 
+def load_dir_cache(root: Path) -> dict:
+    """Cached directory entries from the last scan of root (empty if none or stale)."""
     try:
-        end = content.index("---", 3)
-        frontmatter = content[3:end].strip()
+        data = json.loads(DIR_CACHE_FILE.read_text(encoding="utf-8"))
+        if data.get("version") == DIR_CACHE_VERSION and data.get("root") == str(root):
+            return data["dirs"]
+    except (OSError, ValueError, KeyError, AttributeError):
+        pass
+    return {}
 
-        result = {}
-        for line in frontmatter.split("\n"):
-            if ":" in line and not line.startswith(" ") and not line.startswith("-"):
-                key, value = line.split(":", 1)
-                result[key.strip()] = value.strip()
 
-        return result
-    except (ValueError, IndexError):
-        return None
+def save_dir_cache(root: Path, dirs: dict) -> None:
+    try:
+        DIR_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = DIR_CACHE_FILE.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps({"version": DIR_CACHE_VERSION, "root": str(root), "dirs": dirs}),
+                            encoding="utf-8")
+        os.replace(tmp_path, DIR_CACHE_FILE)
+    except OSError as e:
+        log(f"Could not save directory cache: {e}", "WARN")
+
+
+def find_skill_files(root: Path = SCAN_ROOT, max_depth: int | None = None,
+                     workers: int | None = None, use_cache: bool = True) -> list[Path]:
+    """Recursively find all skill files under root (~/coding/ by default).
+
+    max_depth limits how many directory levels below root are scanned (root
+    itself is depth 0). With use_cache, directories unchanged since the last
+    scan are not listed again.
+    """
+    root = Path(root).resolve()
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+    cache = load_dir_cache(root) if use_cache else {}
+    racy_after = time.time_ns() - RACY_MTIME_NS
+    start = time.perf_counter()
+
+    skill_files = []
+    seen = {}
+    visited = listed = 0
+    compiled = {}
+
+    # Breadth-first, one directory level per batch: (path, depth, inherited .gitignore rules)
+    level = [(str(root), 0, ())]
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        while level:
+            cached = [cache.get(path) for path, _, _ in level]
+            batch = list(zip((path for path, _, _ in level), cached))
+            if workers <= 1 or len(batch) <= DIR_BATCH:
+                entries = read_directories(batch)
+            else:
+                batches = [batch[i:i + DIR_BATCH] for i in range(0, len(batch), DIR_BATCH)]
+                entries = [entry for result in pool.map(read_directories, batches) for entry in result]
+
+            next_level = []
+            for (path, depth, ignores), old, entry in zip(level, cached, entries):
+                if entry is None:
+                    continue
+                visited += 1
+                if entry is not old:
+                    listed += 1
+                if entry["mtime"] < racy_after:
+                    seen[path] = entry
+
+                skill_files.extend(Path(path) / name for name in entry["skills"])
+                if entry.get("venv") or (max_depth is not None and depth >= max_depth):
+                    continue
+
+                prefix = path if path.endswith(os.sep) else path + os.sep
+                if "ignore" in entry:
+                    if path not in compiled:
+                        compiled[path] = compile_gitignore(entry["ignore"])
+                    if compiled[path]:
+                        ignores = ignores + ((prefix, compiled[path]),)
+                for name in entry["dirs"]:
+                    if name in SKIP_DIRS:
+                        continue
+                    child = prefix + name
+                    if ignores and is_ignored(child, name, ignores):
+                        continue
+                    next_level.append((child, depth + 1, ignores))
+            level = next_level
+
+    if use_cache:
+        # A depth-limited scan keeps the deeper entries of earlier scans
+        save_dir_cache(root, {**cache, **seen} if max_depth is not None else seen)
+    log(f"Scanned {visited} directories ({listed} listed, {visited - listed} unchanged) "
+        f"in {time.perf_counter() - start:.1f}s")
+    return sorted(skill_files)
 
 
 def sanitize_skill_name(name: str) -> str:
@@ -99,10 +287,16 @@ def sanitize_skill_name(name: str) -> str:
 
 def get_skill_name(skill_path: Path, content: str) -> str | None:
     """Extract skill name from frontmatter or directory name."""
-    frontmatter = parse_frontmatter(content)
+    try:
+        frontmatter, _ = parse_frontmatter(content, strict=True)
+    except yaml.YAMLError as e:
+        # Many upstream skills have sloppy YAML; a plain `name:` line still names them
+        log(f"Invalid YAML frontmatter in {skill_path}, reading fields line by line: "
+            f"{str(e).splitlines()[0]}", "WARN")
+        frontmatter = scan_frontmatter(content)
 
-    if frontmatter and "name" in frontmatter:
-        return sanitize_skill_name(frontmatter["name"])
+    if frontmatter.get("name"):
+        return sanitize_skill_name(str(frontmatter["name"]))
 
     # Use parent directory name as fallback
     return sanitize_skill_name(skill_path.parent.name)
@@ -282,6 +476,9 @@ def main():
     parser = argparse.ArgumentParser(description="Scan and ingest Claude skills")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be done without making changes")
     parser.add_argument("--no-push", action="store_true", help="Don't push changes to remote")
+    parser.add_argument("--max-depth", type=int, help="Directory levels below the scan root to descend")
+    parser.add_argument("--workers", type=int, help="Threads listing directories in parallel")
+    parser.add_argument("--rescan", action="store_true", help="List every directory, ignoring the scan cache")
     args = parser.parse_args()
 
     log("=" * 60)
@@ -290,7 +487,8 @@ def main():
     log("=" * 60)
 
     # Find all skill files
-    skill_files = find_skill_files()
+    skill_files = find_skill_files(max_depth=args.max_depth, workers=args.workers,
+                                   use_cache=not args.rescan)
     log(f"Found {len(skill_files)} skill files")
 
     # Process each skill
@@ -11,6 +11,7 @@ Usage:
     python scripts/semantic_search.py "photo analysis" --type skill --top-k 10
     python scripts/semantic_search.py "RAG embeddings" --type agent --show-content
     python scripts/semantic_search.py "visual design" --min-score 0.5
+    python scripts/semantic_search.py "testing" --jsonl    # One JSON line per result
 """
 
 import sys
@@ -253,6 +254,11 @@ def format_result(result: Dict[str, Any], show_content: bool = False, index: int
     is_flag=True,
     help='Output results as JSON'
 )
+@click.option(
+    '--jsonl',
+    is_flag=True,
+    help='Stream a query line, then one JSON line per result'
+)
 @click.option(
     '--chroma-path',
     default=DEFAULT_CHROMA_PATH,
@@ -271,6 +277,7 @@ def main(
     min_score: float,
     show_content: bool,
     json_output: bool,
+    jsonl: bool,
     chroma_path: str,
     stats: bool
 ):
@@ -321,6 +328,24 @@ def main(
             return
 
         # Perform search
+        filters = {
+            'type': doc_type,
+            'chunk_type': chunk_type,
+            'min_score': min_score
+        }
+
+        if jsonl:
+            print(json.dumps({'query': query, 'filters': filters}), flush=True)
+            for result in searcher.search(
+                query=query,
+                top_k=top_k,
+                doc_type=doc_type,
+                chunk_type=chunk_type,
+                min_score=min_score
+            ):
+                print(json.dumps(result), flush=True)
+            return
+
         if not json_output:
             console.print(f"\n[bold]Searching for:[/bold] \"{query}\"")
             if doc_type:
@@ -343,11 +368,7 @@ def main(
             # JSON output
             output = {
                 'query': query,
-                'filters': {
-                    'type': doc_type,
-                    'chunk_type': chunk_type,
-                    'min_score': min_score
-                },
+                'filters': filters,
                 'results': results
             }
             print(json.dumps(output, indent=2))
@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Shared Frontmatter + Section Parser
+
+One parser for SKILL.md and AGENT.md files, shared by every script in scripts/.
+YAML is loaded with libyaml's CSafeLoader when available (falling back to the
+pure-Python SafeLoader), and markdown sections are split in a single regex pass
+instead of matching every line.
+
+Usage:
+    from skill_parser import parse_frontmatter, scan_frontmatter, split_sections
+
+    python scripts/skill_parser.py --benchmark
+    python scripts/skill_parser.py --benchmark --dir . --repeat 10
+"""
+
+import argparse
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # libyaml not compiled in
+    from yaml import SafeLoader as YamlLoader
+
+FRONTMATTER_DELIMITER = "---"
+
+# Markdown headers (#, ##, ###) - same levels build_embeddings has always chunked on
+HEADER_RE = re.compile(r'^(#{1,3})[ \t]+(.+)$', re.MULTILINE)
+
+
+def load_yaml(text: str) -> Any:
+    """Load YAML with the fastest available safe loader."""
+    return yaml.load(text, Loader=YamlLoader)
+
+
+def split_frontmatter(content: str) -> Optional[Tuple[str, str]]:
+    """
+    Split a markdown document into (raw frontmatter, body).
+
+    Returns None if the document has no frontmatter block or it is never closed.
+    """
+    if not content.startswith(FRONTMATTER_DELIMITER):
+        return None
+
+    end = content.find("\n" + FRONTMATTER_DELIMITER, len(FRONTMATTER_DELIMITER))
+    if end == -1:
+        return None
+
+    # Body starts on the line after the closing delimiter
+    body_start = content.find("\n", end + 1 + len(FRONTMATTER_DELIMITER))
+    body = "" if body_start == -1 else content[body_start + 1:]
+    return content[len(FRONTMATTER_DELIMITER):end], body
+
+
+def parse_frontmatter(content: str, strict: bool = False) -> Tuple[Dict[str, Any], str]:
+    """
+    Parse YAML frontmatter from markdown content.
+
+    Returns (frontmatter, body). Documents without frontmatter yield ({}, content).
+    Invalid YAML yields ({}, body) unless strict=True, in which case the
+    yaml.YAMLError is raised for the caller to report.
+    """
+    parts = split_frontmatter(content)
+    if parts is None:
+        return {}, content
+
+    raw, body = parts
+    try:
+        data = load_yaml(raw)
+    except yaml.YAMLError:
+        if strict:
+            raise
+        return {}, body
+
+    return (data if isinstance(data, dict) else {}), body
+
+
+def scan_frontmatter(content: str) -> Dict[str, str]:
+    """
+    Read top-level `key: value` lines of a frontmatter block, without YAML.
+
+    The lenient fallback for blocks parse_frontmatter() rejects as invalid
+    YAML: values are raw strings and nested or list lines are skipped.
+    """
+    parts = split_frontmatter(content)
+    if parts is None:
+        return {}
+
+    fields = {}
+    for line in parts[0].split("\n"):
+        if ":" in line and not line.startswith((" ", "\t", "-", "#")):
+            key, value = line.split(":", 1)
+            fields[key.strip()] = value.strip()
+    return fields
+
+
+def section_spans(body: str, default_title: str = "Introduction") -> List[Tuple[str, int, int]]:
+    """
+    Locate markdown sections based on #, ## and ### headers.
+
+    Returns list of (section_title, start, end) where body[start:end] is the
+    stripped section content. Content before the first header is titled
+    default_title; empty sections are dropped.
+    """
+    spans = []
+    title = default_title
+    start = 0
+
+    for match in HEADER_RE.finditer(body):
+        span = _strip_span(body, start, match.start())
+        if span:
+            spans.append((title, *span))
+        title = match.group(2).strip()
+        start = match.end() + 1
+
+    span = _strip_span(body, start, len(body))
+    if span:
+        spans.append((title, *span))
+
+    return spans
+
+
+def split_sections(body: str, default_title: str = "Introduction") -> List[Tuple[str, str]]:
+    """
+    Split markdown into sections based on #, ## and ### headers.
+
+    Returns list of (section_title, section_content) tuples. Content before the
+    first header is titled default_title; empty sections are dropped.
+    """
+    return [(title, body[start:end]) for title, start, end in section_spans(body, default_title)]
+
+
+def _strip_span(text: str, start: int, end: int) -> Optional[Tuple[int, int]]:
+    """Narrow [start, end) to exclude surrounding whitespace; None if nothing is left."""
+    end = min(end, len(text))
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return (start, end) if start < end else None
+
+
+# =============================================================================
+# Benchmark
+# =============================================================================
+
+def _legacy_parse(content: str) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    """The split('---', 2) + yaml.safe_load + per-line regex path the scripts used."""
+    frontmatter: Dict[str, Any] = {}
+    body = content
+    if content.startswith("---"):
+        parts = content.split("---", 2)
+        if len(parts) >= 3:
+            try:
+                frontmatter = yaml.safe_load(parts[1]) or {}
+            except yaml.YAMLError:
+                pass
+            body = parts[2]
+
+    sections = []
+    current_title = "Introduction"
+    current_content: List[str] = []
+    for line in body.split("\n"):
+        header_match = re.match(r'^(#{1,3})\s+(.+)$', line)
+        if header_match:
+            if current_content:
+                text = "\n".join(current_content).strip()
+                if text:
+                    sections.append((current_title, text))
+            current_title = header_match.group(2).strip()
+            current_content = []
+        else:
+            current_content.append(line)
+    if current_content:
+        text = "\n".join(current_content).strip()
+        if text:
+            sections.append((current_title, text))
+
+    return frontmatter, sections
+
+
+def _shared_parse(content: str) -> Tuple[Dict[str, Any], List[Tuple[str, str]]]:
+    frontmatter, body = parse_frontmatter(content)
+    return frontmatter, split_sections(body)
+
+
+def _time(fn: Callable[[str], Any], documents: List[str], repeat: int) -> float:
+    """Best-of-N wall time to parse every document once."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for content in documents:
+            fn(content)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_benchmark(base_dir: Path, repeat: int = 5) -> int:
+    """Time the legacy parsing path against the shared parser over the skills tree."""
+    skills_dir = base_dir / ".claude" / "skills"
+    files = sorted(skills_dir.glob("*/SKILL.md"))
+    if not files:
+        print(f"No SKILL.md files found under {skills_dir}")
+        return 1
+
+    documents = [f.read_text(encoding="utf-8") for f in files]
+    total_bytes = sum(len(d) for d in documents)
+
+    candidates: List[Tuple[str, Callable[[str], Any]]] = [
+        ("legacy (split + safe_load + per-line regex)", _legacy_parse),
+        ("shared (CSafeLoader + single-pass sections)", _shared_parse),
+    ]
+    try:
+        import frontmatter as python_frontmatter
+        candidates.insert(1, (
+            "python-frontmatter + per-line regex",
+            lambda c: _legacy_parse("\n" + python_frontmatter.loads(c).content),
+        ))
+    except ImportError:
+        pass
+
+    print(f"\n{'='*60}")
+    print("FRONTMATTER + SECTION PARSER BENCHMARK")
+    print(f"{'='*60}\n")
+    print(f"Files:   {len(documents)} SKILL.md ({total_bytes / 1024:.0f} KiB)")
+    print(f"Loader:  {YamlLoader.__name__}")
+    print(f"Repeat:  best of {repeat}\n")
+
+    baseline = None
+    for label, fn in candidates:
+        elapsed = _time(fn, documents, repeat)
+        baseline = baseline or elapsed
+        print(f"  {label:<46} {elapsed * 1000:8.1f} ms  ({baseline / elapsed:4.1f}x)")
+
+    print(f"\n{'='*60}\n")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Shared frontmatter/section parser')
+    parser.add_argument('--benchmark', action='store_true',
+                        help='Benchmark against the legacy parsers over the skills tree')
+    parser.add_argument('--dir', default='.', help='Base directory')
+    parser.add_argument('--repeat', type=int, default=5, help='Benchmark repetitions')
+    args = parser.parse_args()
+
+    if not args.benchmark:
+        parser.print_help()
+        return 0
+
+    return run_benchmark(Path(args.dir).resolve(), args.repeat)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
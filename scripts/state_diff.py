@@ -0,0 +1,272 @@
+#!/usr/bin/env python3
+"""
+Keyed Ecosystem State Diff
+
+Compares two ecosystem states (generate_ecosystem_data.py output, or the
+"state" of a snapshot) entity by entity: skills and agents keyed by name,
+tools keyed by name with their usage count, and capability-graph edges keyed
+by (from, to, type). Each side is indexed into a dict once, so a diff is
+linear in the number of entities, and every changed entity carries the names
+of the fields that differ.
+
+generate_snapshot.py builds its deltas from this; anything else that needs
+"what changed between these two states" (reports, changelogs) can call
+diff_states() directly.
+
+make_patch()/apply_patch() use the same keying to turn one state into the
+next: only added or modified records, removed keys, and the new ordering
+when it isn't implied. Delta-encoded snapshots store these patches.
+
+Usage:
+    from state_diff import diff_states
+
+    diffs = diff_states(previous_state, current_state)
+    diffs['skills'].added      # ['new-skill']
+    diffs['skills'].changed    # {'api-architect': ['description', 'tools']}
+
+    patch = make_patch(previous_state, current_state)
+    apply_patch(previous_state, patch) == current_state   # True
+
+    python scripts/state_diff.py OLD.json NEW.json
+    python scripts/state_diff.py OLD.json NEW.json --json
+"""
+
+import argparse
+import json
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+ENTITY_KINDS = ("skills", "agents", "tools", "edges")
+
+
+@dataclass
+class EntityDiff:
+    """Added, removed and changed keys of one entity kind."""
+    added: List[str] = field(default_factory=list)
+    removed: List[str] = field(default_factory=list)
+    changed: Dict[str, List[str]] = field(default_factory=dict)  # key -> changed fields
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.changed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"added": self.added, "removed": self.removed, "changed": self.changed}
+
+
+def index_records(records: Iterable[Dict[str, Any]], key: str = "name") -> Dict[str, Dict[str, Any]]:
+    """Records keyed by their key field; later duplicates win."""
+    return {record[key]: record for record in records if key in record}
+
+
+def changed_fields(previous: Dict[str, Any], current: Dict[str, Any]) -> List[str]:
+    """Fields whose value differs, in current's field order then removed fields."""
+    fields = [name for name, value in current.items()
+              if name not in previous or previous[name] != value]
+    fields.extend(name for name in previous if name not in current)
+    return fields
+
+
+def diff_indexed(previous: Dict[str, Any], current: Dict[str, Any]) -> EntityDiff:
+    """Diff two key -> value maps. Dict values get per-field details; others change as 'value'."""
+    diff = EntityDiff(
+        added=sorted(current.keys() - previous.keys()),
+        removed=sorted(previous.keys() - current.keys()),
+    )
+    for key in sorted(current.keys() & previous.keys()):
+        old, new = previous[key], current[key]
+        if old == new:
+            continue
+        if isinstance(old, dict) and isinstance(new, dict):
+            diff.changed[key] = changed_fields(old, new)
+        else:
+            diff.changed[key] = ["value"]
+    return diff
+
+
+def diff_records(previous: Iterable[Dict[str, Any]], current: Iterable[Dict[str, Any]],
+                 key: str = "name", fields: Optional[Iterable[str]] = None) -> EntityDiff:
+    """Diff two record lists by key. With fields, only those fields count as changes."""
+    prev_index = index_records(previous, key)
+    curr_index = index_records(current, key)
+    if fields is not None:
+        fields = list(fields)
+        prev_index = {k: {f: r.get(f) for f in fields} for k, r in prev_index.items()}
+        curr_index = {k: {f: r.get(f) for f in fields} for k, r in curr_index.items()}
+    return diff_indexed(prev_index, curr_index)
+
+
+def edge_key(edge: Dict[str, Any]) -> str:
+    return f"{edge.get('from')} -> {edge.get('to')} ({edge.get('type')})"
+
+
+def diff_states(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, EntityDiff]:
+    """Per-kind diffs (skills, agents, tools, edges) between two ecosystem states."""
+    prev_edges = previous.get("capability_graph", {}).get("edges", [])
+    curr_edges = current.get("capability_graph", {}).get("edges", [])
+    return {
+        "skills": diff_records(previous.get("skills", []), current.get("skills", [])),
+        "agents": diff_records(previous.get("agents", []), current.get("agents", [])),
+        "tools": diff_indexed(previous.get("tool_usage", {}), current.get("tool_usage", {})),
+        "edges": diff_indexed({edge_key(e): e for e in prev_edges},
+                              {edge_key(e): e for e in curr_edges}),
+    }
+
+
+def node_key(node: Dict[str, Any]) -> str:
+    return node["id"]
+
+
+def record_key(record: Dict[str, Any]) -> str:
+    return record["name"]
+
+
+# Top-level state keys patched record by record; everything else is copied whole
+PATCHED_KEYS = ("skills", "agents", "tool_usage", "capability_graph")
+
+
+def _keyed(records: List[Dict[str, Any]], key: Callable[[Dict[str, Any]], str]) -> Optional[Dict[str, Any]]:
+    """Records by key, or None if a key is missing or repeated (then the list is stored whole)."""
+    try:
+        index = {key(record): record for record in records}
+    except (KeyError, TypeError):
+        return None
+    return index if len(index) == len(records) else None
+
+
+def list_patch(previous: List[Dict[str, Any]], current: List[Dict[str, Any]],
+               key: Callable[[Dict[str, Any]], str]) -> Dict[str, Any]:
+    """Records of current that are new or differ from previous, plus removed keys."""
+    prev_index, curr_index = _keyed(previous, key), _keyed(current, key)
+    if prev_index is None or curr_index is None:
+        return {"replace": current}
+    patch: Dict[str, Any] = {
+        "upsert": [record for k, record in curr_index.items() if prev_index.get(k) != record],
+        "remove": [k for k in prev_index if k not in curr_index],
+    }
+    # apply_list_patch keeps surviving records in place and appends new ones
+    implied = [k for k in prev_index if k in curr_index] + [k for k in curr_index if k not in prev_index]
+    if list(curr_index) != implied:
+        patch["order"] = list(curr_index)
+    return patch
+
+
+def apply_list_patch(previous: List[Dict[str, Any]], patch: Dict[str, Any],
+                     key: Callable[[Dict[str, Any]], str]) -> List[Dict[str, Any]]:
+    if "replace" in patch:
+        return list(patch["replace"])
+    index = {key(record): record for record in previous}
+    for k in patch["remove"]:
+        index.pop(k, None)
+    for record in patch["upsert"]:
+        index[key(record)] = record
+    if "order" in patch:
+        return [index[k] for k in patch["order"]]
+    return list(index.values())
+
+
+def mapping_patch(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Keys of current that are new or changed, plus removed keys."""
+    patch: Dict[str, Any] = {
+        "set": {k: v for k, v in current.items() if k not in previous or previous[k] != v},
+        "remove": [k for k in previous if k not in current],
+    }
+    implied = [k for k in previous if k in current] + [k for k in current if k not in previous]
+    if list(current) != implied:
+        patch["order"] = list(current)
+    return patch
+
+
+def apply_mapping_patch(previous: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    mapping = dict(previous)
+    for k in patch["remove"]:
+        mapping.pop(k, None)
+    mapping.update(patch["set"])
+    if "order" in patch:
+        return {k: mapping[k] for k in patch["order"]}
+    return mapping
+
+
+def make_patch(previous: Dict[str, Any], current: Dict[str, Any]) -> Dict[str, Any]:
+    """Patch that apply_patch() turns previous into current with."""
+    patch: Dict[str, Any] = {
+        "keys": list(current),
+        "fields": {k: v for k, v in current.items() if k not in PATCHED_KEYS},
+    }
+    for name in ("skills", "agents"):
+        if name in current:
+            patch[name] = list_patch(previous.get(name, []), current[name], record_key)
+    if "tool_usage" in current:
+        patch["tool_usage"] = mapping_patch(previous.get("tool_usage", {}), current["tool_usage"])
+    if "capability_graph" in current:
+        prev_graph, curr_graph = previous.get("capability_graph", {}), current["capability_graph"]
+        patch["capability_graph"] = {
+            "keys": list(curr_graph),
+            "fields": {k: v for k, v in curr_graph.items() if k not in ("nodes", "edges")},
+            "nodes": list_patch(prev_graph.get("nodes", []), curr_graph.get("nodes", []), node_key),
+            "edges": list_patch(prev_graph.get("edges", []), curr_graph.get("edges", []), edge_key),
+        }
+    return patch
+
+
+def apply_patch(previous: Dict[str, Any], patch: Dict[str, Any]) -> Dict[str, Any]:
+    """State produced by applying a make_patch() patch to previous. previous is not modified."""
+    state = dict(patch["fields"])
+    for name in ("skills", "agents"):
+        if name in patch:
+            state[name] = apply_list_patch(previous.get(name, []), patch[name], record_key)
+    if "tool_usage" in patch:
+        state["tool_usage"] = apply_mapping_patch(previous.get("tool_usage", {}), patch["tool_usage"])
+    if "capability_graph" in patch:
+        prev_graph, graph_patch = previous.get("capability_graph", {}), patch["capability_graph"]
+        graph = {
+            "nodes": apply_list_patch(prev_graph.get("nodes", []), graph_patch["nodes"], node_key),
+            "edges": apply_list_patch(prev_graph.get("edges", []), graph_patch["edges"], edge_key),
+            **graph_patch["fields"],
+        }
+        state["capability_graph"] = {k: graph[k] for k in graph_patch["keys"]}
+    return {k: state[k] for k in patch["keys"]}
+
+
+def load_state(path: Path) -> Dict[str, Any]:
+    """Ecosystem state from a state file or a snapshot file."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return data.get("state", data)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Diff two ecosystem states or snapshots')
+    parser.add_argument('previous', help='Older state or snapshot JSON')
+    parser.add_argument('current', help='Newer state or snapshot JSON')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    try:
+        diffs = diff_states(load_state(Path(args.previous)), load_state(Path(args.current)))
+    except (OSError, ValueError) as e:
+        print(f"❌ {e}", file=sys.stderr)
+        return 1
+
+    if args.json:
+        print(json.dumps({kind: diff.to_dict() for kind, diff in diffs.items()}, indent=2))
+        return 0
+
+    print(f"\n{'='*60}")
+    print("ECOSYSTEM STATE DIFF")
+    print(f"{'='*60}\n")
+    for kind in ENTITY_KINDS:
+        diff = diffs[kind]
+        print(f"{kind.capitalize()}: +{len(diff.added)} -{len(diff.removed)} ~{len(diff.changed)}")
+        for name in diff.added:
+            print(f"  + {name}")
+        for name in diff.removed:
+            print(f"  - {name}")
+        for name, fields in diff.changed.items():
+            print(f"  ~ {name}: {', '.join(fields)}")
+    print(f"\n{'='*60}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
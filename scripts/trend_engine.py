@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Rolling Snapshot Trends
+
+Trend statistics over the snapshot time series kept by metrics_store.py:
+growth over trailing windows (7 and 30 days by default), time-based moving
+averages, and per-category velocity (skills gained per week). Every statistic
+is computed for every snapshot at once with NumPy: each snapshot's window
+start comes from one np.searchsorted over the timestamps, and window averages
+from cumulative sums, so a report over years of hourly snapshots is a few
+array operations rather than a loop over parsed JSON. The inputs are the
+store's snapshot_totals() and category_series() columns, which never decode
+a summary in Python.
+
+Usage:
+    from trend_engine import compute_trends
+
+    with MetricsStore.open(base_dir) as store:
+        trends = compute_trends(store.snapshot_totals(), store.category_series())
+    trends['metrics']['total_skills']['weekly']['growth_pct']
+
+    python scripts/trend_engine.py
+    python scripts/trend_engine.py --since 2026-01-01 --json
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from metrics_store import SNAPSHOT_COLUMNS, MetricsStore
+
+# Trailing windows in days
+WINDOWS: Dict[str, float] = {'weekly': 7.0, 'monthly': 30.0}
+
+SECONDS_PER_DAY = 86400.0
+
+
+def to_days(timestamps: List[str]) -> np.ndarray:
+    """Store timestamps (UTC ISO 8601) as float days since the epoch."""
+    # The store normalises every timestamp to UTC, so the offset can be dropped
+    seconds = np.array([ts[:19] for ts in timestamps], dtype='datetime64[s]').astype(np.int64)
+    return seconds / SECONDS_PER_DAY
+
+
+def window_starts(days: np.ndarray, window: float) -> np.ndarray:
+    """Index of the first snapshot inside each snapshot's trailing window."""
+    return np.searchsorted(days, days - window, side='left')
+
+
+def rolling_stats(days: np.ndarray, values: np.ndarray, window: float) -> Dict[str, np.ndarray]:
+    """Rolling statistics of each row of values (rows x snapshots) over a trailing window.
+
+    delta:       change since the first snapshot in the window
+    growth_pct:  delta relative to that snapshot (NaN where it was 0)
+    per_week:    delta per 7 days of elapsed time (NaN where no time elapsed)
+    average:     mean of the snapshots in the window
+    """
+    starts = window_starts(days, window)
+    base = values[:, starts]
+    delta = values - base
+    span = days - days[starts]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        growth_pct = np.where(base != 0, delta / base * 100.0, np.nan)
+        per_week = np.where(span > 0, delta / span * 7.0, np.nan)
+
+    cumulative = np.concatenate([np.zeros((values.shape[0], 1)), np.cumsum(values, axis=1)], axis=1)
+    ends = np.arange(1, values.shape[1] + 1)
+    average = (cumulative[:, ends] - cumulative[:, starts]) / (ends - starts)
+
+    return {'delta': delta, 'growth_pct': growth_pct, 'per_week': per_week, 'average': average}
+
+
+def category_matrix(files: List[str], categories: Dict[str, List[Any]]) -> Dict[str, Any]:
+    """Pivot category_series() rows into a categories x snapshots count matrix (0 where absent)."""
+    column = {name: i for i, name in enumerate(files)}
+    row: Dict[str, int] = {}
+    rows, cols, counts = [], [], []
+    for file, category, count in zip(categories['file'], categories['category'], categories['count']):
+        col = column.get(file)
+        if col is None:
+            continue
+        rows.append(row.setdefault(category, len(row)))
+        cols.append(col)
+        counts.append(count)
+
+    matrix = np.zeros((len(row), len(files)))
+    matrix[rows, cols] = counts
+    names = sorted(row)
+    return {'names': names, 'values': matrix[[row[name] for name in names]]}
+
+
+def _latest(stats: Dict[str, np.ndarray], row: int) -> Dict[str, Optional[float]]:
+    out = {}
+    for key, array in stats.items():
+        value = float(array[row, -1])
+        out[key] = None if np.isnan(value) else round(value, 2)
+    return out
+
+
+def compute_trends(totals: Dict[str, List[Any]], categories: Optional[Dict[str, List[Any]]] = None,
+                   windows: Dict[str, float] = WINDOWS) -> Dict[str, Any]:
+    """Rolling statistics as of the latest snapshot, per total and per category.
+
+    totals and categories are MetricsStore.snapshot_totals() and
+    category_series() results. Returns {'points', 'start', 'end', 'metrics',
+    'categories'}, where each metric/category maps to its latest value and,
+    per window name, the latest rolling_stats() values.
+    """
+    files, timestamps = totals['file'], totals['timestamp']
+    result: Dict[str, Any] = {
+        'points': len(files),
+        'start': timestamps[0] if timestamps else None,
+        'end': timestamps[-1] if timestamps else None,
+        'metrics': {},
+        'categories': {},
+    }
+    if not files:
+        return result
+
+    days = to_days(timestamps)
+    metric_names = [c for c in SNAPSHOT_COLUMNS if c in totals]
+    metric_values = np.array([[v or 0 for v in totals[c]] for c in metric_names], dtype=float)
+    pivot = category_matrix(files, categories) if categories else {'names': [], 'values': np.zeros((0, len(files)))}
+
+    groups = [('metrics', metric_names, metric_values), ('categories', pivot['names'], pivot['values'])]
+    for group, names, values in groups:
+        stats = {window: rolling_stats(days, values, length) for window, length in windows.items()}
+        for row, name in enumerate(names):
+            entry: Dict[str, Any] = {'latest': float(values[row, -1])}
+            for window in windows:
+                entry[window] = _latest(stats[window], row)
+            result[group][name] = entry
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Rolling trends over the snapshot history')
+    parser.add_argument('--dir', default='.', help='Base directory')
+    parser.add_argument('--since', help='Only snapshots at or after this date (YYYY-MM-DD)')
+    parser.add_argument('--json', action='store_true', help='Output JSON')
+    args = parser.parse_args()
+
+    base_dir = Path(args.dir).resolve()
+    start = time.perf_counter()
+    with MetricsStore.open(base_dir) as store:
+        store.sync_snapshots(base_dir / '.claude' / 'archive' / 'snapshots')
+        trends = compute_trends(store.snapshot_totals(args.since), store.category_series(args.since))
+    elapsed = time.perf_counter() - start
+
+    if args.json:
+        print(json.dumps(trends, indent=2))
+        return 0
+
+    print(f"\n{'='*60}")
+    print("ROLLING SNAPSHOT TRENDS")
+    print(f"{'='*60}\n")
+    print(f"{trends['points']} snapshots ({trends['start']} to {trends['end']}) in {elapsed * 1000:.1f} ms\n")
+    for group in ('metrics', 'categories'):
+        for name, entry in trends[group].items():
+            windows = '  '.join(
+                f"{window}: {entry[window]['delta']:+g} ({entry[window]['per_week'] or 0:+.2f}/wk)"
+                for window in WINDOWS
+            )
+            print(f"  {name:<24} {entry['latest']:>8g}  {windows}")
+        print()
+    print(f"{'='*60}\n")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
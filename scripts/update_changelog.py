@@ -5,20 +5,93 @@ Changelog Generator - Part of The Archivist
 Analyzes git history for .claude/skills/ and .claude/agents/ changes
 and generates/updates CHANGELOG.md in Keep a Changelog format.
 
+Runs are incremental: the last commit written to each changelog is kept in
+.changelog-cursor.json beside it, and the next run only reads the commits
+after it. git log output is NUL-delimited (so any subject or body parses)
+and consumed as a stream.
+
+--backfill writes one entry per release (tag, month or week) from a single
+git log pass, newest first, e.g. to seed a changelog from a year of history.
+With tags, a commit belongs to the oldest tag that contains it (what
+`git log <previous tag>..<tag>` lists), not the tag nearest its date.
+Entries are inserted by streaming the existing file into a new one rather
+than rebuilding it in memory.
+
+Commits are categorised by compiled rules (conventional-commit type, then
+subject keywords, then file status) and files mapped to skills/agents by a
+path prefix trie. The defaults are DEFAULT_RULES; .claude/changelog-rules.json
+(or --rules PATH) overrides any of its keys, e.g.
+{"conventional_types": {"feat": "Added", "docs": "Changed"}}.
+
 Usage:
-    python scripts/update_changelog.py [--output PATH] [--since DATE]
+    python scripts/update_changelog.py [--output PATH] [--since DATE] [--full]
+    python scripts/update_changelog.py --backfill tags --output CHANGELOG.md
+    python scripts/update_changelog.py --backfill monthly --since 2025-10-01
+    python scripts/update_changelog.py --rules changelog-rules.json
 
 Output goes to .claude/archive/changelogs/CHANGELOG.md by default.
 """
 
 import subprocess
 import argparse
+import json
+import os
 import re
+import shutil
 from pathlib import Path
 from datetime import datetime, timezone
-from typing import Dict, List, Any, Optional, Tuple
+from typing import IO, Dict, Iterable, Iterator, List, Any, Optional, Tuple
 from collections import defaultdict
 
+CURSOR_FILE_NAME = ".changelog-cursor.json"
+
+# Each commit starts with COMMIT_MARKER + hash; fields are NUL-terminated
+COMMIT_MARKER = "\x1e"
+LOG_FORMAT = "%x1e%H%x00%ai%x00%cI%x00%s%x00%b%x00"
+
+CHANGELOG_HEADER = """# Changelog
+
+All notable changes to the Claude Skills Ecosystem will be documented in this file.
+
+The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
+and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
+
+"""
+
+# Keep a Changelog sections, in output order
+CATEGORIES = ["Added", "Changed", "Fixed", "Deprecated", "Removed", "Security"]
+
+# Project rules file (JSON overrides of DEFAULT_RULES), relative to the project root
+RULES_FILE = Path(".claude") / "changelog-rules.json"
+
+DEFAULT_RULES: Dict[str, Any] = {
+    # Conventional-commit type -> category; takes precedence over keywords
+    "conventional_types": {
+        "feat": "Added",
+        "fix": "Fixed",
+        "perf": "Changed",
+        "refactor": "Changed",
+        "deprecate": "Deprecated",
+        "security": "Security",
+    },
+    # Category -> subject keywords (substring match); earlier categories win
+    "keywords": {
+        "Added": ["add", "new", "create", "initial"],
+        "Removed": ["remove", "delete"],
+        "Fixed": ["fix", "bug", "issue", "error"],
+        "Deprecated": ["deprecate"],
+        "Security": ["security", "vulnerability", "cve"],
+        "Changed": ["update", "improve", "enhance", "change", "refactor"],
+    },
+    # Fallback: the first file whose git status has a category
+    "file_status": {"A": "Added", "D": "Removed", "M": "Changed"},
+    "default": "Changed",
+    # Path prefix -> entity type; the next path component is the entity name
+    "entities": {".claude/skills": "skill", ".claude/agents": "agent"},
+    # Leading verbs dropped from entry text
+    "strip_prefixes": ["add", "new", "create", "update", "improve", "fix", "remove", "delete"],
+}
+
 
 def find_project_root() -> Path:
     """Find the project root by looking for .claude directory."""
@@ -30,161 +103,330 @@ def find_project_root() -> Path:
     return Path.cwd()
 
 
-def get_git_log(since: Optional[str] = None) -> List[Dict[str, Any]]:
+def _git(args: List[str], cwd: Optional[Path] = None) -> Optional[str]:
+    """stdout of a git command, or None if it fails."""
+    try:
+        result = subprocess.run(["git", *args], cwd=cwd, capture_output=True, text=True)
+    except OSError:
+        return None
+    return result.stdout.strip() if result.returncode == 0 else None
+
+
+def head_commit(cwd: Optional[Path] = None) -> Optional[str]:
+    return _git(["rev-parse", "--verify", "--quiet", "HEAD"], cwd)
+
+
+def load_cursor(changelog_path: Path) -> Optional[str]:
+    """Last commit already written to changelog_path, if recorded."""
+    try:
+        cursors = json.loads((changelog_path.parent / CURSOR_FILE_NAME).read_text(encoding="utf-8"))
+        return cursors.get(changelog_path.name)
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+def save_cursor(changelog_path: Path, commit: str) -> None:
+    """Record commit as the last one written to changelog_path."""
+    cursor_path = changelog_path.parent / CURSOR_FILE_NAME
+    try:
+        cursors = json.loads(cursor_path.read_text(encoding="utf-8"))
+        if not isinstance(cursors, dict):
+            cursors = {}
+    except (OSError, ValueError):
+        cursors = {}
+    cursors[changelog_path.name] = commit
+    tmp_path = cursor_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(cursors, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp_path, cursor_path)
+
+
+def _read_tokens(stream: IO[bytes], chunk_size: int = 1 << 16) -> Iterator[str]:
+    """NUL-separated tokens of a byte stream, read in chunks."""
+    pending = b""
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            break
+        parts = (pending + chunk).split(b"\0")
+        pending = parts.pop()
+        for part in parts:
+            yield part.decode("utf-8", errors="replace")
+    if pending:
+        yield pending.decode("utf-8", errors="replace")
+
+
+def parse_log_tokens(tokens: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    """Commits from the NUL-separated tokens of `git log -z --name-status --pretty=LOG_FORMAT`."""
+    tokens = iter(tokens)
+    commit = None
+    for token in tokens:
+        token = token.lstrip("\n")
+        if token.startswith(COMMIT_MARKER):
+            if commit:
+                yield commit
+            date, committed, subject, body = (next(tokens, "") for _ in range(4))
+            commit = {
+                "hash": token[len(COMMIT_MARKER):],
+                "date": date,
+                "committed": committed,
+                "subject": subject,
+                "body": body.strip(),
+                "files": []
+            }
+        elif token and commit:
+            # Status, then one path (two for renames and copies: old, new)
+            status = token[0]
+            path = next(tokens, "")
+            change = {"status": status, "path": path}
+            if status in ("R", "C"):
+                change["old_path"], change["path"] = path, next(tokens, "")
+            commit["files"].append(change)
+    if commit:
+        yield commit
+
+
+def iter_git_log(since: Optional[str] = None, cwd: Optional[Path] = None,
+                 after: Optional[str] = None, until: str = "HEAD") -> Iterator[Dict[str, Any]]:
+    """Stream commits touching .claude/skills/ and .claude/agents/, newest first.
+
+    after limits the walk to commits after that one (after..until). Raises
+    subprocess.CalledProcessError if git fails.
+    """
+    cmd = [
+        "git", "log", "-z",
+        f"--pretty=format:{LOG_FORMAT}",
+        "--name-status",
+    ]
+
+    if since:
+        cmd.append(f"--since={since}")
+
+    cmd.append(f"{after}..{until}" if after else until)
+    cmd.extend([
+        "--",
+        ".claude/skills/",
+        ".claude/agents/"
+    ])
+
+    process = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        yield from parse_log_tokens(_read_tokens(process.stdout))
+    finally:
+        process.stdout.close()
+        stderr = process.stderr.read()
+        process.stderr.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise subprocess.CalledProcessError(returncode, cmd, stderr=stderr)
+
+
+def get_git_log(since: Optional[str] = None, cwd: Optional[Path] = None,
+                after: Optional[str] = None) -> List[Dict[str, Any]]:
     """Get git log for .claude/skills/ and .claude/agents/ directories."""
     try:
-        # Build git log command
-        cmd = [
-            "git", "log",
-            "--pretty=format:%H|%ai|%s|%b",
-            "--name-status",
-        ]
-
-        if since:
-            cmd.append(f"--since={since}")
-
-        cmd.extend([
-            "--",
-            ".claude/skills/",
-            ".claude/agents/"
-        ])
-
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-
-        return parse_git_log(result.stdout)
-
-    except subprocess.CalledProcessError:
+        return list(iter_git_log(since, cwd, after))
+    except (subprocess.CalledProcessError, OSError):
         # No git repo or no commits
         return []
 
 
 def parse_git_log(log_output: str) -> List[Dict[str, Any]]:
-    """Parse git log output into structured commits."""
-    commits = []
-    lines = log_output.split("\n")
-
-    current_commit = None
-
-    for line in lines:
-        if "|" in line and not line.startswith(("A\t", "M\t", "D\t", "R\t")):
-            # New commit line
-            parts = line.split("|", 3)
-            if len(parts) >= 3:
-                if current_commit:
-                    commits.append(current_commit)
-
-                current_commit = {
-                    "hash": parts[0],
-                    "date": parts[1],
-                    "subject": parts[2],
-                    "body": parts[3] if len(parts) > 3 else "",
-                    "files": []
-                }
-        elif line.startswith(("A\t", "M\t", "D\t", "R\t")) and current_commit:
-            # File change line
-            parts = line.split("\t", 1)
-            if len(parts) == 2:
-                status = parts[0]
-                filepath = parts[1]
-                current_commit["files"].append({
-                    "status": status,
-                    "path": filepath
-                })
-
-    if current_commit:
-        commits.append(current_commit)
-
-    return commits
-
-
-def categorize_changes(commits: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-    """Categorize commits into Added, Changed, Fixed, Removed."""
-    categories = {
-        "Added": [],
-        "Changed": [],
-        "Fixed": [],
-        "Deprecated": [],
-        "Removed": [],
-        "Security": []
-    }
+    """Parse `git log -z --name-status --pretty=LOG_FORMAT` output into structured commits."""
+    return list(parse_log_tokens(log_output.split("\0")))
+
+
+def new_commits(changelog_path: Path, cwd: Optional[Path] = None, since: Optional[str] = None,
+                full: bool = False) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+    """Commits not yet in changelog_path, and the HEAD to record once they are written.
+
+    Resumes after the stored cursor unless full is set or since is given. A
+    cursor that is no longer an ancestor of HEAD (rewritten history) is
+    ignored.
+    """
+    head = head_commit(cwd)
+    if head is None:
+        return [], None
+    after = None if (full or since) else load_cursor(changelog_path)
+    if after is not None:
+        if after == head:
+            return [], head
+        if _git(["merge-base", "--is-ancestor", after, head], cwd) is None:
+            after = None
+    try:
+        return list(iter_git_log(since, cwd, after, until=head)), head
+    except (subprocess.CalledProcessError, OSError):
+        return [], None
+
+
+class ChangelogRules:
+    """Compiled commit categorisation and entity path rules.
+
+    rules has the DEFAULT_RULES keys (a rules file overrides any of them):
+    a conventional-commit prefix ("feat(scope)!: ...") decides the category
+    when present; otherwise the first category, in keyword order, with a
+    keyword anywhere in the subject; otherwise the first file status with a
+    mapping; otherwise the default. All conventional types are one anchored
+    regex and all keywords one alternation (longest first, so the match at
+    each offset carries the categories of its prefixes too), so a subject is
+    scanned once. Entity prefixes are a component trie, and each distinct
+    path is resolved once per rules instance.
+    """
+
+    def __init__(self, rules: Optional[Dict[str, Any]] = None):
+        rules = {**DEFAULT_RULES, **(rules or {})}
+        self.default = rules["default"]
+        self.file_status = dict(rules["file_status"])
+
+        self._types = types = {name.lower(): category for name, category in rules["conventional_types"].items()}
+        self._conventional = re.compile(
+            r"^(%s)(?:\([^)]*\))?!?:\s*" % "|".join(map(re.escape, sorted(types, key=len, reverse=True))),
+            re.IGNORECASE,
+        ) if types else None
+
+        # Category priority follows keyword declaration order
+        priority = {category: i for i, category in enumerate(rules["keywords"])}
+        owners: Dict[str, int] = {}
+        for category, words in rules["keywords"].items():
+            for word in words:
+                owners.setdefault(word.lower(), priority[category])
+        self._categories = list(rules["keywords"])
+        # keyword -> best priority among it and the keywords that are its prefixes
+        self._rank = {
+            word: min(rank for prefix, rank in owners.items() if word.startswith(prefix))
+            for word in owners
+        }
+        self._keywords = re.compile(
+            "|".join(map(re.escape, sorted(owners, key=len, reverse=True)))
+        ) if owners else None
+
+        prefixes = rules["strip_prefixes"]
+        self._strip = re.compile(
+            r"^(%s)\s*:?\s*" % "|".join(map(re.escape, prefixes)), re.IGNORECASE
+        ) if prefixes else None
+
+        # Path component trie: {component: {...}}, entity type stored under None
+        self._trie: Dict[Optional[str], Any] = {}
+        for prefix, entity_type in rules["entities"].items():
+            node = self._trie
+            for part in prefix.strip("/").split("/"):
+                node = node.setdefault(part, {})
+            node[None] = entity_type
+        self._entities: Dict[str, Optional[Tuple[str, str]]] = {}
+
+    def category(self, commit: Dict[str, Any]) -> str:
+        subject = commit["subject"]
+        if self._conventional is not None:
+            match = self._conventional.match(subject)
+            if match:
+                return self._types[match.group(1).lower()]
+
+        if self._keywords is not None:
+            best = None
+            text = subject.lower()
+            search = self._keywords.search
+            match = search(text)
+            while match:
+                rank = self._rank[match.group()]
+                if best is None or rank < best:
+                    best = rank
+                    if rank == 0:
+                        break
+                match = search(text, match.start() + 1)
+            if best is not None:
+                return self._categories[best]
+
+        for file in commit["files"]:
+            category = self.file_status.get(file["status"])
+            if category:
+                return category
+        return self.default
+
+    def entity(self, filepath: str) -> Optional[Tuple[str, str]]:
+        """(entity type, name) for a path under an entity prefix, else None."""
+        try:
+            return self._entities[filepath]
+        except KeyError:
+            pass
+
+        result = None
+        parts = [part for part in filepath.split("/") if part and part != "."]
+        # Like a .claude lookup, the prefix may start at any depth; the first root match decides
+        for start, part in enumerate(parts):
+            if part not in self._trie:
+                continue
+            node, i = self._trie, start
+            while i < len(parts) and parts[i] in node:
+                node = node[parts[i]]
+                i += 1
+                # Longest matching prefix wins
+                if None in node and i < len(parts):
+                    result = (node[None], parts[i])
+            break
+        self._entities[filepath] = result
+        return result
 
-    for commit in commits:
-        # Analyze commit message
-        subject = commit["subject"].lower()
-        body = commit["body"].lower()
-
-        # Determine category based on keywords
-        category = None
-
-        if any(kw in subject for kw in ["add", "new", "create", "initial"]):
-            category = "Added"
-        elif any(kw in subject for kw in ["remove", "delete"]):
-            category = "Removed"
-        elif any(kw in subject for kw in ["fix", "bug", "issue", "error"]):
-            category = "Fixed"
-        elif any(kw in subject for kw in ["deprecate"]):
-            category = "Deprecated"
-        elif any(kw in subject for kw in ["security", "vulnerability", "cve"]):
-            category = "Security"
-        elif any(kw in subject for kw in ["update", "improve", "enhance", "change", "refactor"]):
-            category = "Changed"
-
-        # Also check file status
-        if not category:
-            for file in commit["files"]:
-                if file["status"] == "A":
-                    category = "Added"
-                    break
-                elif file["status"] == "D":
-                    category = "Removed"
-                    break
-                elif file["status"] == "M":
-                    category = "Changed"
-                    break
-
-        # Default to Changed
-        if not category:
-            category = "Changed"
-
-        categories[category].append(commit)
+    def clean_subject(self, subject: str) -> str:
+        """Subject without its conventional-commit or leading verb prefix."""
+        if self._conventional is not None:
+            match = self._conventional.match(subject)
+            if match:
+                return subject[match.end():].strip()
+        if self._strip is not None:
+            subject = self._strip.sub("", subject, count=1)
+        return subject.strip()
 
+
+def load_rules(path: Path) -> ChangelogRules:
+    """Rules from a JSON file of DEFAULT_RULES overrides. Raises OSError or ValueError."""
+    data = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(data, dict):
+        raise ValueError(f"{path}: expected a JSON object")
+    unknown = data.keys() - DEFAULT_RULES.keys()
+    if unknown:
+        raise ValueError(f"{path}: unknown rule keys: {', '.join(sorted(unknown))}")
+    return ChangelogRules(data)
+
+
+def project_rules(project_root: Path) -> ChangelogRules:
+    """The project's rules file (RULES_FILE) if it exists, else the default rules."""
+    path = project_root / RULES_FILE
+    return load_rules(path) if path.exists() else DEFAULT_CHANGELOG_RULES
+
+
+DEFAULT_CHANGELOG_RULES = ChangelogRules()
+
+
+def categorize_changes(commits: Iterable[Dict[str, Any]],
+                       rules: Optional[ChangelogRules] = None) -> Dict[str, List[Dict[str, Any]]]:
+    """Categorize commits into Added, Changed, Fixed, Removed."""
+    rules = rules or DEFAULT_CHANGELOG_RULES
+    categories: Dict[str, List[Dict[str, Any]]] = {category: [] for category in CATEGORIES}
+    for commit in commits:
+        categories.setdefault(rules.category(commit), []).append(commit)
     return categories
 
 
-def extract_entity_name(filepath: str) -> Optional[Tuple[str, str]]:
+def extract_entity_name(filepath: str, rules: Optional[ChangelogRules] = None) -> Optional[Tuple[str, str]]:
     """Extract skill or agent name from file path."""
     # .claude/skills/skill-name/... -> ("skill", "skill-name")
     # .claude/agents/agent-name/... -> ("agent", "agent-name")
-
-    parts = Path(filepath).parts
-
-    if ".claude" in parts:
-        idx = parts.index(".claude")
-        if idx + 2 < len(parts):
-            entity_type = parts[idx + 1].rstrip("s")  # "skills" -> "skill"
-            entity_name = parts[idx + 2]
-            return (entity_type, entity_name)
-
-    return None
+    return (rules or DEFAULT_CHANGELOG_RULES).entity(filepath)
 
 
 def generate_changelog_entry(
     categories: Dict[str, List[Dict[str, Any]]],
-    version: str = "Unreleased"
+    version: str = "Unreleased",
+    date: Optional[datetime] = None,
+    rules: Optional[ChangelogRules] = None
 ) -> str:
-    """Generate a changelog entry in Keep a Changelog format."""
+    """Generate a changelog entry in Keep a Changelog format (dated today unless date is given)."""
     lines = [
-        f"## [{version}] - {datetime.now(timezone.utc).strftime('%Y-%m-%d')}",
+        f"## [{version}] - {(date or datetime.now(timezone.utc)).strftime('%Y-%m-%d')}",
         ""
     ]
 
-    for category in ["Added", "Changed", "Fixed", "Deprecated", "Removed", "Security"]:
-        entries = categories.get(category, [])
+    rules = rules or DEFAULT_CHANGELOG_RULES
+    for category, entries in categories.items():
         if not entries:
             continue
 
@@ -196,7 +438,7 @@ def generate_changelog_entry(
 
         for commit in entries:
             for file in commit["files"]:
-                entity_info = extract_entity_name(file["path"])
+                entity_info = rules.entity(file["path"])
                 if entity_info:
                     entity_type, entity_name = entity_info
                     entity_changes[f"{entity_type}:{entity_name}"].append(commit)
@@ -207,11 +449,7 @@ def generate_changelog_entry(
 
             # Get most recent commit message
             commit = commits[0]
-            subject = commit["subject"]
-
-            # Clean up subject
-            subject = re.sub(r'^(add|new|create|update|improve|fix|remove|delete)\s*:?\s*', '', subject, flags=re.IGNORECASE)
-            subject = subject.strip()
+            subject = rules.clean_subject(commit["subject"])
 
             if subject:
                 lines.append(f"- **{entity_name}** ({entity_type}): {subject}")
@@ -234,15 +472,7 @@ def merge_changelog(existing: str, new_entry: str) -> str:
     """Merge new entry into existing changelog."""
     if not existing:
         # Create new changelog
-        header = """# Changelog
-
-All notable changes to the Claude Skills Ecosystem will be documented in this file.
-
-The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
-and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
-
-"""
-        return header + new_entry
+        return CHANGELOG_HEADER + new_entry
 
     # Insert new entry after header
     lines = existing.split("\n")
@@ -263,6 +493,168 @@ and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0
     return "\n".join(new_lines)
 
 
+def insert_entries(changelog_path: Path, entries: List[str]) -> None:
+    """Insert entries (newest first) before the first release of changelog_path.
+
+    Entries are separated from each other and from the existing releases by
+    one blank line, whether one entry is written or a whole backfill. The
+    existing file is streamed into a temporary file and swapped in.
+    """
+    block = "\n\n".join(entry.rstrip("\n") for entry in entries) + "\n"
+    tmp_path = changelog_path.with_name(changelog_path.name + ".tmp")
+
+    if not changelog_path.exists() or changelog_path.stat().st_size == 0:
+        tmp_path.write_text(CHANGELOG_HEADER + block, encoding="utf-8")
+        os.replace(tmp_path, changelog_path)
+        return
+
+    with changelog_path.open(encoding="utf-8", newline="") as src, \
+            tmp_path.open("w", encoding="utf-8", newline="") as dst:
+        first_release = None
+        header_lines = 0
+        for line in src:
+            if line.startswith("## ["):
+                first_release = line
+                break
+            dst.write(line)
+            header_lines += 1
+
+        if first_release is not None and header_lines > 0:
+            # Header, new entries, then the existing releases untouched
+            dst.write(block + "\n")
+            dst.write(first_release)
+            shutil.copyfileobj(src, dst)
+        else:
+            # No header to insert after: append
+            last = first_release or ""
+            if first_release is not None:
+                dst.write(first_release)
+                for last in src:
+                    dst.write(last)
+            dst.write(("\n" if last.endswith("\n") else "\n\n") + block)
+    os.replace(tmp_path, changelog_path)
+
+
+def write_changelog(
+    changelog_path: Path,
+    commits: List[Dict[str, Any]],
+    version: str = "Unreleased",
+    rules: Optional[ChangelogRules] = None
+) -> Dict[str, List[Dict[str, Any]]]:
+    """Categorize commits and merge a new entry into changelog_path. Returns the categories."""
+    categories = categorize_changes(commits, rules)
+    insert_entries(changelog_path, [generate_changelog_entry(categories, version, rules=rules)])
+    return categories
+
+
+def _parse_date(value: str) -> datetime:
+    """git ISO 8601 date as an aware UTC datetime."""
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).astimezone(timezone.utc)
+
+
+def tag_boundaries(cwd: Optional[Path] = None) -> List[Tuple[datetime, str, str]]:
+    """(commit date, tag, commit) for every tag, oldest first. Annotated tags use their target."""
+    output = _git([
+        "for-each-ref", "refs/tags",
+        "--format=%(refname:short)%00%(*committerdate:iso-strict)%00%(committerdate:iso-strict)"
+        "%00%(*objectname)%00%(objectname)",
+    ], cwd)
+    boundaries = []
+    for line in (output or "").splitlines():
+        name, target_date, own_date, target, own = line.split("\0")
+        if target_date or own_date:
+            boundaries.append((_parse_date(target_date or own_date), name, target or own))
+    return sorted(boundaries)
+
+
+def tag_releases(boundaries: List[Tuple[datetime, str, str]], until: str = "HEAD",
+                 cwd: Optional[Path] = None) -> Dict[str, str]:
+    """Commit hash -> first tag (in boundaries order) that contains it.
+
+    Matches `git log <earlier tags>..<tag>` per tag, from one rev-list pass
+    over the commit graph: each tag claims the ancestors no earlier tag
+    reached, so every commit is visited once.
+    """
+    if not boundaries:
+        return {}
+    output = _git(["rev-list", "--parents", until, *(commit for _, _, commit in boundaries)], cwd)
+    parents = {}
+    for line in (output or "").splitlines():
+        commit, *commit_parents = line.split()
+        parents[commit] = commit_parents
+
+    releases: Dict[str, str] = {}
+    for _, tag, commit in boundaries:
+        stack = [commit]
+        while stack:
+            commit = stack.pop()
+            if commit in releases or commit not in parents:
+                continue
+            releases[commit] = tag
+            stack.extend(parents[commit])
+    return releases
+
+
+def period_label(committed: datetime, period: str) -> str:
+    """Release label of a commit date: YYYY-MM for monthly, YYYY-Www for weekly."""
+    if period == "weekly":
+        year, week, _ = committed.isocalendar()
+        return f"{year}-W{week:02d}"
+    return committed.strftime("%Y-%m")
+
+
+def group_by_release(commits: Iterable[Dict[str, Any]], mode: str,
+                     boundaries: Optional[List[Tuple[datetime, str, str]]] = None,
+                     releases: Optional[Dict[str, str]] = None
+                     ) -> List[Tuple[str, datetime, List[Dict[str, Any]]]]:
+    """Group commits (newest first) into releases: [(version, date, commits)], newest first.
+
+    mode "tags": a commit belongs to its tag in releases (see tag_releases),
+    dated by the tagged commit; commits no tag contains are "Unreleased".
+    mode "monthly" or "weekly": calendar periods of the commit date.
+    """
+    grouped: Dict[str, Tuple[datetime, List[Dict[str, Any]]]] = {}
+    tag_dates = {tag: date for date, tag, _ in boundaries or []}
+    releases = releases or {}
+    for commit in commits:
+        committed = _parse_date(commit["committed"])
+        if mode == "tags":
+            version = releases.get(commit["hash"])
+            if version is not None:
+                date = tag_dates[version]
+            else:
+                version, date = "Unreleased", committed
+        else:
+            version, date = period_label(committed, mode), committed
+        if version not in grouped:
+            grouped[version] = (date, [])
+        grouped[version][1].append(commit)
+
+    ordered = sorted(grouped.items(), key=lambda item: item[1][0], reverse=True)
+    return [(version, date, release_commits) for version, (date, release_commits) in ordered]
+
+
+def backfill_changelog(changelog_path: Path, mode: str, since: Optional[str] = None,
+                       cwd: Optional[Path] = None,
+                       rules: Optional[ChangelogRules] = None) -> List[Tuple[str, int]]:
+    """Write one entry per release from a single git log pass. Returns [(version, commits)]."""
+    head = head_commit(cwd)
+    if head is None:
+        return []
+    boundaries = tag_boundaries(cwd) if mode == "tags" else None
+    tagged = tag_releases(boundaries, head, cwd) if boundaries else None
+    releases = group_by_release(iter_git_log(since, cwd, until=head), mode, boundaries, tagged)
+    if not releases:
+        return []
+
+    insert_entries(changelog_path, [
+        generate_changelog_entry(categorize_changes(release_commits, rules), version, date, rules)
+        for version, date, release_commits in releases
+    ])
+    save_cursor(changelog_path, head)
+    return [(version, len(release_commits)) for version, _, release_commits in releases]
+
+
 def main():
     parser = argparse.ArgumentParser(description="Generate/update changelog")
     parser.add_argument(
@@ -273,7 +665,22 @@ def main():
     parser.add_argument(
         "--since", "-s",
         type=str,
-        help="Include commits since date (e.g., '2024-12-01', '1 week ago')"
+        help="Include commits since date (e.g., '2024-12-01', '1 week ago'); ignores the cursor"
+    )
+    parser.add_argument(
+        "--full",
+        action="store_true",
+        help="Read the whole history instead of resuming after the last processed commit"
+    )
+    parser.add_argument(
+        "--backfill",
+        choices=["tags", "monthly", "weekly"],
+        help="Write one entry per tag, month or week of history (all of it, or --since DATE)"
+    )
+    parser.add_argument(
+        "--rules",
+        type=Path,
+        help=f"JSON categorisation rules (default: {RULES_FILE} if present)"
     )
     parser.add_argument(
         "--version", "-v",
@@ -284,6 +691,11 @@ def main():
     args = parser.parse_args()
 
     project_root = find_project_root()
+    try:
+        rules = load_rules(args.rules) if args.rules else project_rules(project_root)
+    except (OSError, ValueError) as e:
+        print(f"❌ Invalid rules: {e}")
+        return 1
 
     # Setup output path
     if args.output:
@@ -293,8 +705,19 @@ def main():
         changelog_dir.mkdir(parents=True, exist_ok=True)
         changelog_path = changelog_dir / "CHANGELOG.md"
 
-    # Get git log
-    commits = get_git_log(since=args.since)
+    if args.backfill:
+        releases = backfill_changelog(changelog_path, args.backfill, since=args.since, rules=rules)
+        if not releases:
+            print("ℹ️  No commits found in specified range")
+            return 0
+        print(f"✅ Changelog backfilled: {changelog_path}")
+        print(f"   📝 {sum(count for _, count in releases)} commit(s) in {len(releases)} release(s)")
+        for version, count in releases:
+            print(f"   - {version}: {count}")
+        return 0
+
+    # Get git log (only commits after the cursor unless --since/--full)
+    commits, head = new_commits(changelog_path, since=args.since, full=args.full)
 
     if not commits:
         # Check if git repo exists
@@ -316,15 +739,7 @@ def main():
 - **Auto-documentation Pipeline**: Snapshot and changelog generation infrastructure
 
 """
-                header = """# Changelog
-
-All notable changes to the Claude Skills Ecosystem will be documented in this file.
-
-The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/),
-and this project adheres to [Semantic Versioning](https://semver.org/spec/v2.0.0.html).
-
-"""
-                changelog_path.write_text(header + initial_entry, encoding="utf-8")
+                changelog_path.write_text(CHANGELOG_HEADER + initial_entry, encoding="utf-8")
                 print(f"✅ Initial changelog created: {changelog_path}")
                 return 0
 
@@ -352,20 +767,10 @@ The format is based on [Keep a Changelog](https://keepachangelog.com/en/1.0.0/).
 
         return 0
 
-    # Categorize changes
-    categories = categorize_changes(commits)
-
-    # Generate new entry
-    new_entry = generate_changelog_entry(categories, args.version)
-
-    # Read existing changelog
-    existing = read_existing_changelog(changelog_path)
-
-    # Merge
-    updated_changelog = merge_changelog(existing, new_entry)
-
-    # Write
-    changelog_path.write_text(updated_changelog, encoding="utf-8")
+    # Categorize, generate and merge the new entry
+    categories = write_changelog(changelog_path, commits, args.version, rules)
+    if head:
+        save_cursor(changelog_path, head)
 
     # Print summary
     total_changes = sum(len(entries) for entries in categories.values())
@@ -4,17 +4,31 @@ Agent Validator - Pre-flight checks for Founding Council Agents
 
 Validates agent structure, content quality, and coordination references.
 Part of The Forge infrastructure.
+
+Usage:
+    python scripts/validate_agent.py .claude/agents/smith.md
+    python scripts/validate_agent.py .claude/agents/              # Validate all (parallel)
+    python scripts/validate_agent.py .claude/agents/ --json       # One JSON line per agent
+    python scripts/validate_agent.py .claude/agents/ --workers 1  # Sequential
+    python scripts/validate_agent.py .claude/agents/ --changed-since origin/main
 """
 
+import argparse
+import json
 import os
 import sys
 import re
 import yaml
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Set
+from dataclasses import asdict, dataclass
 from enum import Enum
 
+from corpus_cache import find_project_root
+from git_changes import affected_agents
+from skill_parser import load_yaml, split_frontmatter
+
 
 class Severity(Enum):
     ERROR = "ERROR"
@@ -30,6 +44,32 @@ class ValidationIssue:
     suggestion: str = None
 
 
+@dataclass
+class AgentResult:
+    """Outcome of validating one agent, small enough to ship back from a worker."""
+    name: str
+    path: str
+    issues: List[ValidationIssue]
+
+    @property
+    def errors(self) -> int:
+        return sum(1 for i in self.issues if i.severity == Severity.ERROR)
+
+    def to_dict(self) -> Dict[str, Any]:
+        counts = {s.value.lower(): 0 for s in Severity}
+        for issue in self.issues:
+            counts[issue.severity.value.lower()] += 1
+        return {
+            'agent': self.name,
+            'path': self.path,
+            'passed': self.errors == 0,
+            'errors': counts['error'],
+            'warnings': counts['warning'],
+            'info': counts['info'],
+            'issues': [dict(asdict(i), severity=i.severity.value) for i in self.issues],
+        }
+
+
 class AgentValidator:
     """Validates Claude Code agent definitions.
 
@@ -53,11 +93,15 @@ class AgentValidator:
     # Core tools agents typically need
     CORE_TOOLS = ['Read', 'Write', 'Edit', 'Glob', 'Grep', 'Bash', 'Task']
 
-    def __init__(self, agent_path: str):
+    def __init__(self, agent_path: str, known_agents: Optional[Set[str]] = None):
         self.agent_path = Path(agent_path)
+        # Agent names defined alongside this one; looked up on disk when not given
+        self.known_agents = known_agents
         self.issues: List[ValidationIssue] = []
         self.frontmatter: Dict = {}
         self.content: str = ""
+        self.body: str = ""
+        self.body_lower: str = ""
         self.is_directory_format: bool = False
 
     def validate(self) -> List[ValidationIssue]:
@@ -130,15 +174,18 @@ class AgentValidator:
             return
 
         # Extract frontmatter
+        parts = split_frontmatter(self.content)
+        if parts is None:
+            self.issues.append(ValidationIssue(
+                Severity.ERROR,
+                "Invalid frontmatter format. Must have opening and closing '---'"
+            ))
+            return
+        raw_frontmatter, self.body = parts
+        self.body_lower = self.body.lower()
+
         try:
-            parts = self.content.split('---', 2)
-            if len(parts) < 3:
-                self.issues.append(ValidationIssue(
-                    Severity.ERROR,
-                    "Invalid frontmatter format. Must have opening and closing '---'"
-                ))
-                return
-            self.frontmatter = yaml.safe_load(parts[1]) or {}
+            self.frontmatter = load_yaml(raw_frontmatter) or {}
         except yaml.YAMLError as e:
             self.issues.append(ValidationIssue(
                 Severity.ERROR,
@@ -330,12 +377,7 @@ class AgentValidator:
 
     def check_body_content(self):
         """Validate the body content of the agent file."""
-        # Get body after frontmatter
-        parts = self.content.split('---', 2)
-        if len(parts) < 3:
-            return
-        body = parts[2]
-
+        body = self.body
         lines = body.strip().split('\n')
 
         # Check for minimum content
@@ -356,7 +398,7 @@ class AgentValidator:
             ))
 
         # Check for actionable content
-        has_actions = any(word in body.lower() for word in ['first action', 'when invoked', 'always start', 'your job'])
+        has_actions = any(word in self.body_lower for word in ['first action', 'when invoked', 'always start', 'your job'])
         if not has_actions:
             self.issues.append(ValidationIssue(
                 Severity.WARNING,
@@ -374,11 +416,7 @@ class AgentValidator:
 
     def check_coordination_references(self):
         """Check if coordinating agent references are valid."""
-        # Get body after frontmatter
-        parts = self.content.split('---', 2)
-        if len(parts) < 3:
-            return
-        body = parts[2].lower()
+        body = self.body_lower
 
         # Known founding council agents
         council_agents = [
@@ -396,11 +434,12 @@ class AgentValidator:
         else:
             agents_dir = self.agent_path.parent
 
+        known_agents = self.known_agents
+        if known_agents is None:
+            known_agents = known_agent_names(agents_dir)
+
         for agent in mentioned:
-            # Check both flat format (agent.md) and directory format (agent/AGENT.md)
-            agent_file_flat = agents_dir / f"{agent}.md"
-            agent_dir = agents_dir / agent / "AGENT.md"
-            if not agent_file_flat.exists() and not agent_dir.exists():
+            if agent not in known_agents:
                 self.issues.append(ValidationIssue(
                     Severity.WARNING,
                     f"References agent '{agent}' but no agent definition found",
@@ -408,6 +447,21 @@ class AgentValidator:
                 ))
 
 
+def known_agent_names(agents_dir: Path) -> Set[str]:
+    """Names with a definition in agents_dir, as name.md or name/AGENT.md."""
+    names = set()
+    try:
+        with os.scandir(agents_dir) as it:
+            for entry in it:
+                if entry.is_file() and entry.name.endswith('.md'):
+                    names.add(entry.name[:-3])
+                elif entry.is_dir() and os.path.exists(os.path.join(entry.path, 'AGENT.md')):
+                    names.add(entry.name)
+    except FileNotFoundError:
+        pass
+    return names
+
+
 def print_report(issues: List[ValidationIssue], agent_name: str):
     """Print validation report."""
     if not issues:
@@ -453,14 +507,13 @@ def print_report(issues: List[ValidationIssue], agent_name: str):
     print(f"{'='*60}\n")
 
 
-def validate_all_agents(agents_dir: Path) -> int:
-    """Validate all agents in a directory.
+def find_agent_paths(agents_dir: Path) -> List[Path]:
+    """Agent definitions in agents_dir, sorted by name.
 
     Supports both:
     - Flat format: name.md files directly in agents_dir
     - Directory format: name/AGENT.md subdirectories
     """
-    # Collect all agent paths
     agent_paths = []
 
     # Find flat format agents (*.md files, excluding uppercase like FOUNDING_COUNCIL.md)
@@ -476,48 +529,121 @@ def validate_all_agents(agents_dir: Path) -> int:
         if subdir.is_dir() and (subdir / "AGENT.md").exists():
             agent_paths.append(subdir)
 
+    return sorted(agent_paths, key=lambda p: p.name)
+
+
+def validate_one(agent_path: Path, known_agents: Optional[Set[str]] = None) -> AgentResult:
+    """Validate a single agent. Module-level so it can run in a worker process."""
+    validator = AgentValidator(agent_path, known_agents)
+    issues = validator.validate()
+    agent_name = validator.frontmatter.get('name', agent_path.stem if agent_path.is_file() else agent_path.name)
+    return AgentResult(name=agent_name, path=str(validator.agent_path), issues=issues)
+
+
+def iter_results(agent_paths: List[Path], known_agents: Set[str], workers: int,
+                 ordered: bool = True) -> Iterator[AgentResult]:
+    """Validate agents, yielding each result as soon as it is available.
+
+    With workers > 1 agents are validated in a process pool; ordered=False
+    yields in completion order rather than path order.
+    """
+    if workers <= 1 or len(agent_paths) <= 1:
+        for agent_path in agent_paths:
+            yield validate_one(agent_path, known_agents)
+        return
+
+    with ProcessPoolExecutor(max_workers=min(workers, len(agent_paths))) as executor:
+        futures = [executor.submit(validate_one, p, known_agents) for p in agent_paths]
+        for future in (futures if ordered else as_completed(futures)):
+            yield future.result()
+
+
+def validate_all_agents(agents_dir: Path, workers: Optional[int] = None, json_output: bool = False,
+                        only: Optional[Set[str]] = None) -> int:
+    """Validate all agents in a directory (or just those named in `only`).
+
+    Text reports are printed in name order; with json_output one JSON object
+    is printed per agent as it completes, followed by a summary object.
+    """
+    agent_paths = find_agent_paths(agents_dir)
+    if only is not None:
+        agent_paths = [p for p in agent_paths if (p.stem if p.is_file() else p.name) in only]
+        if not agent_paths:
+            if json_output:
+                print(json.dumps({'summary': {'agents': 0, 'errors': 0, 'passed': True}}), flush=True)
+            else:
+                print(f"No agents changed in {agents_dir}")
+            return 0
+
     if not agent_paths:
-        print(f"No agent files found in {agents_dir}")
+        if json_output:
+            print(json.dumps({'summary': {'agents': 0, 'errors': 0, 'passed': False}}), flush=True)
+        else:
+            print(f"No agent files found in {agents_dir}")
         return 1
 
-    print(f"Found {len(agent_paths)} agent(s) to validate\n")
+    if not json_output:
+        print(f"Found {len(agent_paths)} agent(s) to validate\n")
 
+    known_agents = known_agent_names(agents_dir)
+    workers = workers or os.cpu_count() or 1
     total_errors = 0
 
-    for agent_path in sorted(agent_paths, key=lambda p: p.name):
-        validator = AgentValidator(agent_path)
-        issues = validator.validate()
-
-        errors = [i for i in issues if i.severity == Severity.ERROR]
-        total_errors += len(errors)
+    for result in iter_results(agent_paths, known_agents, workers, ordered=not json_output):
+        total_errors += result.errors
+        if json_output:
+            print(json.dumps(result.to_dict()), flush=True)
+        else:
+            print_report(result.issues, result.name)
 
-        agent_name = validator.frontmatter.get('name', agent_path.stem if agent_path.is_file() else agent_path.name)
-        print_report(issues, agent_name)
+    if json_output:
+        print(json.dumps({'summary': {
+            'agents': len(agent_paths),
+            'errors': total_errors,
+            'passed': total_errors == 0,
+        }}), flush=True)
 
     return 1 if total_errors > 0 else 0
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python validate_agent.py <agent_path_or_directory>")
-        print("\nExamples:")
-        print("  python validate_agent.py .claude/agents/smith.md")
-        print("  python validate_agent.py .claude/agents/  # Validate all")
-        sys.exit(1)
-
-    path = Path(sys.argv[1])
+    parser = argparse.ArgumentParser(
+        description='Validate agent definitions',
+        epilog='Examples:\n'
+               '  python validate_agent.py .claude/agents/smith.md\n'
+               '  python validate_agent.py .claude/agents/  # Validate all',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument('path', help='Agent file, agent directory, or agents directory')
+    parser.add_argument('--json', action='store_true',
+                        help='Stream one JSON object per agent (JSON Lines) instead of reports')
+    parser.add_argument('--changed-since', metavar='REV',
+                        help='With an agents directory, validate only agents changed since REV')
+    parser.add_argument('--workers', type=int, default=None,
+                        help='Worker processes when validating a directory (default: CPU count, 1 = sequential)')
+    args = parser.parse_args()
+
+    path = Path(args.path)
 
     if path.is_dir():
-        print(f"Validating all agents in: {path}\n")
-        exit_code = validate_all_agents(path)
+        only = None
+        if args.changed_since:
+            base_dir = find_project_root(path) or path
+            try:
+                only = affected_agents(base_dir, args.changed_since)
+            except RuntimeError as e:
+                parser.error(str(e))
+        if not args.json:
+            print(f"Validating {'changed' if only is not None else 'all'} agents in: {path}\n")
+        exit_code = validate_all_agents(path, workers=args.workers, json_output=args.json, only=only)
     else:
-        print(f"Validating agent: {path}\n")
-        validator = AgentValidator(path)
-        issues = validator.validate()
-        agent_name = validator.frontmatter.get('name', path.stem)
-        print_report(issues, agent_name)
-        errors = [i for i in issues if i.severity == Severity.ERROR]
-        exit_code = 1 if errors else 0
+        result = validate_one(path)
+        if args.json:
+            print(json.dumps(result.to_dict()))
+        else:
+            print(f"Validating agent: {path}\n")
+            print_report(result.issues, result.name)
+        exit_code = 1 if result.errors else 0
 
     sys.exit(exit_code)
 
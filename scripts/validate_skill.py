@@ -7,14 +7,24 @@ Validates that a skill directory follows the required structure and quality stan
 Usage:
     python scripts/validate_skill.py .claude/skills/my-skill
     python scripts/validate_skill.py .claude/skills/my-skill --strict
+    python scripts/validate_skill.py .claude/skills/a .claude/skills/b
+    python scripts/validate_skill.py --all --json     # Every skill, one aggregated report
+    python scripts/validate_skill.py --all --jsonl    # One JSON line per skill, streamed
+    python scripts/validate_skill.py --changed-since origin/main
 """
 
 import argparse
+import json
+import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from corpus_cache import CorpusCache, CorpusEntry, open_cache, read_markdown
+from git_changes import affected_skills
 
 @dataclass
 class ValidationResult:
@@ -36,20 +46,36 @@ class SkillValidator:
         'Anti-Pattern',
     ]
 
+    # (section, check name, compiled header pattern), built once per process
+    SECTION_PATTERNS = [
+        (section, f'has_{section.lower().replace(" ", "_")}',
+         re.compile(rf'^##\s+{re.escape(section)}', re.MULTILINE | re.IGNORECASE))
+        for section in RECOMMENDED_SECTIONS
+    ]
+
     ALLOWED_TOOLS_PATTERN = re.compile(
         r'^(Read|Write|Edit|Bash(\([^)]*\))?|Grep|Glob|WebFetch|WebSearch|Task|mcp__\w+__\w+)(,(Read|Write|Edit|Bash(\([^)]*\))?|Grep|Glob|WebFetch|WebSearch|Task|mcp__\w+__\w+))*$'
     )
 
-    def __init__(self, skill_path: Path, strict: bool = False):
+    def __init__(self, skill_path: Path, strict: bool = False, cache: Optional[CorpusCache] = None):
         self.skill_path = skill_path
         self.strict = strict
+        self.cache = cache
         self.results: List[ValidationResult] = []
+        self.entry: Optional[CorpusEntry] = None
+        self.content: str = ""
+        self.frontmatter: Dict[str, Any] = {}
+        self.passed: bool = False
 
     def add_result(self, check: str, passed: bool, message: str, severity: str = 'error'):
         self.results.append(ValidationResult(check, passed, message, severity))
 
     def validate(self) -> bool:
         """Run all validations and return overall pass/fail"""
+        self.passed = self._validate()
+        return self.passed
+
+    def _validate(self) -> bool:
         self._check_directory_exists()
         if not self.skill_path.exists():
             return False
@@ -58,6 +84,9 @@ class SkillValidator:
         if not (self.skill_path / 'SKILL.md').exists():
             return False
 
+        self.entry = read_markdown(self.skill_path / 'SKILL.md', self.cache)
+        self.content = self.entry.content
+
         self._check_frontmatter()
         self._check_description_quality()
         self._check_sections()
@@ -88,34 +117,35 @@ class SkillValidator:
         )
 
     def _check_frontmatter(self):
-        skill_md = self.skill_path / 'SKILL.md'
-        content = skill_md.read_text()
-
         # Check for YAML frontmatter
-        if not content.startswith('---'):
+        if not self.content.startswith('---'):
             self.add_result('frontmatter_exists', False, "Missing YAML frontmatter (---)")
             return
 
         # Extract frontmatter
-        parts = content.split('---', 2)
-        if len(parts) < 3:
+        if not self.entry.has_frontmatter:
             self.add_result('frontmatter_valid', False, "Malformed frontmatter")
             return
 
-        frontmatter = parts[1]
+        if self.entry.frontmatter_error:
+            self.add_result('frontmatter_valid', False,
+                           f"Invalid YAML frontmatter: {self.entry.frontmatter_error}")
+            return
+        self.frontmatter = self.entry.frontmatter
 
         # Check required fields
         for field in self.REQUIRED_FRONTMATTER:
-            pattern = rf'^{field}:\s*\S+'
-            if re.search(pattern, frontmatter, re.MULTILINE):
+            if self.frontmatter.get(field):
                 self.add_result(f'has_{field}', True, f"Has {field} field")
             else:
                 self.add_result(f'has_{field}', False, f"Missing required field: {field}")
 
         # Validate allowed-tools format
-        tools_match = re.search(r'^allowed-tools:\s*(.+)$', frontmatter, re.MULTILINE)
-        if tools_match:
-            tools = tools_match.group(1).strip()
+        tools = self.frontmatter.get('allowed-tools')
+        if tools:
+            if isinstance(tools, list):
+                tools = ','.join(str(t) for t in tools)
+            tools = str(tools).strip()
             if self.ALLOWED_TOOLS_PATTERN.match(tools):
                 self.add_result('allowed_tools_valid', True, "allowed-tools format is valid")
             else:
@@ -123,15 +153,12 @@ class SkillValidator:
                                f"Invalid allowed-tools format: {tools}")
 
     def _check_description_quality(self):
-        skill_md = self.skill_path / 'SKILL.md'
-        content = skill_md.read_text()
-
         # Extract description from frontmatter
-        desc_match = re.search(r'^description:\s*["\']?(.+?)["\']?\s*$', content, re.MULTILINE)
-        if not desc_match:
+        description = self.frontmatter.get('description')
+        if not description:
             return
 
-        description = desc_match.group(1)
+        description = str(description).strip()
 
         # Check length
         if len(description) < 50:
@@ -161,28 +188,22 @@ class SkillValidator:
                            severity='warning')
 
     def _check_sections(self):
-        skill_md = self.skill_path / 'SKILL.md'
-        content = skill_md.read_text()
+        content = self.content
 
-        for section in self.RECOMMENDED_SECTIONS:
-            pattern = rf'^##\s+{re.escape(section)}'
-            if re.search(pattern, content, re.MULTILINE | re.IGNORECASE):
-                self.add_result(f'has_{section.lower().replace(" ", "_")}', True,
-                               f"Has '{section}' section")
+        for section, check, pattern in self.SECTION_PATTERNS:
+            if pattern.search(content):
+                self.add_result(check, True, f"Has '{section}' section")
             else:
-                self.add_result(f'has_{section.lower().replace(" ", "_")}', False,
+                self.add_result(check, False,
                                f"Missing recommended section: '{section}'",
                                severity='warning')
 
     def _check_examples(self):
-        skill_md = self.skill_path / 'SKILL.md'
-        content = skill_md.read_text()
-
-        code_blocks = re.findall(r'```[\w]*\n', content)
-        if len(code_blocks) >= 2:
+        code_blocks = self.entry.code_fences
+        if code_blocks >= 2:
             self.add_result('has_code_examples', True,
-                           f"Has {len(code_blocks)} code examples")
-        elif len(code_blocks) == 1:
+                           f"Has {code_blocks} code examples")
+        elif code_blocks == 1:
             self.add_result('has_code_examples', False,
                            "Only 1 code example, recommend 2+",
                            severity='warning')
@@ -194,7 +215,10 @@ class SkillValidator:
     def _check_references(self):
         refs_dir = self.skill_path / 'references'
         if refs_dir.exists():
-            ref_count = len(list(refs_dir.glob('*.md')))
+            if self.cache is not None:
+                ref_count = len(self.cache.references(self.skill_path))
+            else:
+                ref_count = len(list(refs_dir.glob('*.md')))
             if ref_count > 0:
                 self.add_result('has_references', True,
                                f"Has {ref_count} reference files")
@@ -255,34 +279,171 @@ class SkillValidator:
 
         print(f"{'='*60}\n")
 
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            'skill': self.skill_path.name,
+            'passed': self.passed,
+            'results': [
+                {'check': r.check, 'passed': r.passed, 'message': r.message, 'severity': r.severity}
+                for r in self.results
+            ]
+        }
+
+
+def find_skill_paths(skills_dir: Path) -> List[Path]:
+    """Every skill directory (containing SKILL.md) under skills_dir, sorted by name."""
+    if not skills_dir.exists():
+        return []
+    return sorted(d for d in skills_dir.iterdir() if d.is_dir() and (d / 'SKILL.md').exists())
+
+
+def iter_validations(skill_paths: List[Path], strict: bool = False,
+                     cache: Optional[CorpusCache] = None,
+                     workers: Optional[int] = None) -> Iterator[SkillValidator]:
+    """Validate skills concurrently, sharing one cache.
+
+    Yields each validator as soon as it and everything before it is done, in input order.
+    """
+    workers = workers or min(32, (os.cpu_count() or 1) + 4)
+
+    def run(skill_path: Path) -> SkillValidator:
+        validator = SkillValidator(skill_path, strict=strict, cache=cache)
+        validator.validate()
+        return validator
+
+    if workers <= 1 or len(skill_paths) <= 1:
+        yield from map(run, skill_paths)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(run, skill_paths)
+
+
+def validate_skills(skill_paths: List[Path], strict: bool = False,
+                    cache: Optional[CorpusCache] = None,
+                    workers: Optional[int] = None) -> List[SkillValidator]:
+    """Validate skills concurrently, sharing one cache. Results keep input order."""
+    return list(iter_validations(skill_paths, strict, cache, workers))
+
+
+def stream_jsonl(skill_paths: List[Path], strict: bool = False,
+                 cache: Optional[CorpusCache] = None,
+                 workers: Optional[int] = None) -> bool:
+    """Print one JSON line per skill as it finishes, then a summary line. Returns overall pass."""
+    total = 0
+    failed = []
+    for validator in iter_validations(skill_paths, strict, cache, workers):
+        total += 1
+        if not validator.passed:
+            failed.append(validator.skill_path.name)
+        print(json.dumps(validator.to_dict()), flush=True)
+
+    print(json.dumps({'summary': {'passed': not failed, 'total': total, 'failed': failed}}),
+          flush=True)
+    return not failed
+
+
+def print_summary(validators: List[SkillValidator]) -> None:
+    """Print a one-screen summary after a multi-skill run."""
+    failed = [v.skill_path.name for v in validators if not v.passed]
+
+    print(f"{'='*60}")
+    print(f"VALIDATED {len(validators)} SKILLS: "
+          f"{len(validators) - len(failed)} passed, {len(failed)} failed")
+    if failed:
+        print(f"❌ Failed: {', '.join(failed)}")
+    print(f"{'='*60}\n")
+
+
+def print_no_skills(message: str, json_output: bool = False, jsonl: bool = False) -> int:
+    """Report an empty selection (nothing to validate, so it passes)."""
+    if jsonl:
+        print(json.dumps({'summary': {'passed': True, 'total': 0, 'failed': []}}))
+    elif json_output:
+        print(json.dumps({'passed': True, 'total': 0, 'failed': [], 'skills': []}, indent=2))
+    else:
+        print(message)
+    return 0
+
 
 def main():
     parser = argparse.ArgumentParser(description='Validate skill structure')
-    parser.add_argument('skill_path', help='Path to skill directory')
+    parser.add_argument('skill_paths', nargs='*', metavar='skill_path',
+                        help='Path to skill directory (several may be given)')
+    parser.add_argument('--all', action='store_true',
+                       help='Validate every skill under <dir>/.claude/skills')
+    parser.add_argument('--changed-since', metavar='REV',
+                       help='Validate only skills changed since REV and the skills that use them')
+    parser.add_argument('--dir', default='.', help='Base directory for --all / --changed-since')
+    parser.add_argument('--workers', type=int, default=None,
+                       help='Concurrent validators for multi-skill runs (1 = sequential)')
     parser.add_argument('--strict', action='store_true',
                        help='Fail on warnings too')
     parser.add_argument('--json', action='store_true',
                        help='Output JSON instead of report')
+    parser.add_argument('--jsonl', action='store_true',
+                       help='Stream one JSON line per skill, then a summary line')
+    parser.add_argument('--no-cache', action='store_true',
+                       help='Read files directly instead of using the shared corpus cache')
 
     args = parser.parse_args()
 
-    skill_path = Path(args.skill_path).resolve()
-    validator = SkillValidator(skill_path, strict=args.strict)
-
-    passed = validator.validate()
+    base_dir = Path(args.dir).resolve()
+    skills_dir = base_dir / '.claude' / 'skills'
+    cache = None
+
+    if args.all:
+        skill_paths = find_skill_paths(skills_dir)
+        if not skill_paths:
+            return print_no_skills(f"No skills found under {skills_dir}", args.json, args.jsonl)
+    elif args.changed_since:
+        cache = open_cache(base_dir, enabled=not args.no_cache)
+        try:
+            affected = affected_skills(base_dir, args.changed_since, cache)
+        except RuntimeError as e:
+            parser.error(str(e))
+        # Deleted skills have nothing left to validate
+        skill_paths = [p for p in find_skill_paths(skills_dir) if p.name in affected]
+        if not skill_paths:
+            if cache is not None:
+                cache.close()
+            return print_no_skills(f"No skills changed since {args.changed_since}", args.json, args.jsonl)
+    else:
+        skill_paths = [Path(p).resolve() for p in args.skill_paths]
+    if not skill_paths:
+        parser.error('give a skill_path, --all or --changed-since')
+
+    if cache is None:
+        cache = open_cache(skill_paths[0], enabled=not args.no_cache)
+    try:
+        if args.jsonl:
+            passed = stream_jsonl(skill_paths, strict=args.strict, cache=cache,
+                                  workers=args.workers)
+            return 0 if passed else 1
+        validators = validate_skills(skill_paths, strict=args.strict, cache=cache,
+                                     workers=args.workers)
+    finally:
+        if cache is not None:
+            cache.close()
+
+    passed = all(v.passed for v in validators)
+    single = len(validators) == 1 and not (args.all or args.changed_since)
 
     if args.json:
-        import json
-        print(json.dumps({
-            'skill': skill_path.name,
-            'passed': passed,
-            'results': [
-                {'check': r.check, 'passed': r.passed, 'message': r.message, 'severity': r.severity}
-                for r in validator.results
-            ]
-        }, indent=2))
+        if single:
+            report = validators[0].to_dict()
+        else:
+            report = {
+                'passed': passed,
+                'total': len(validators),
+                'failed': [v.skill_path.name for v in validators if not v.passed],
+                'skills': [v.to_dict() for v in validators],
+            }
+        print(json.dumps(report, indent=2))
     else:
-        validator.print_report()
+        for validator in validators:
+            validator.print_report()
+        if not single:
+            print_summary(validators)
 
     return 0 if passed else 1
 